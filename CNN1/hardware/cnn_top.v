@@ -63,8 +63,13 @@ module cnn_top #(
     // ========================================================================
     
     // Load conv weights and biases from include files
+    // RUNTIME_WEIGHTS: all weights are registers written by the Verilator harness
+    `ifdef RUNTIME_WEIGHTS
+    `include "cnn_weight_registers.vh"
+    `else
     `include "conv_weights.vh"
     `include "conv_bias.vh"
+    `endif
     
     // Reorganize weights for each filter
     // CONV_WEIGHTS is flat array, need to split into 4 filters of 9 weights each
@@ -81,6 +86,15 @@ module cnn_top #(
         end
     endgenerate
     
+    // conv_unit takes a signed window: reinterpret the line buffer taps element by element
+    wire signed [PIXEL_WIDTH-1:0] conv_window [0:8];
+    genvar k;
+    generate
+        for (k = 0; k < 9; k = k + 1) begin : conv_window_assign
+            assign conv_window[k] = window_3x3[k];
+        end
+    endgenerate
+    
     // Convolution outputs
     wire signed [19:0] conv_out [0:NUM_FILTERS-1];
     wire conv_valid [0:NUM_FILTERS-1];
@@ -96,7 +110,7 @@ module cnn_top #(
                 .clk(clk),
                 .rst_n(rst_n),
                 .enable(start),
-                .window(window_3x3),
+                .window(conv_window),
                 .weights(filter_weights[f]),
                 .bias(filter_bias[f]),
                 .valid_in(window_valid),
@@ -189,8 +203,10 @@ module cnn_top #(
     // ========================================================================
     
     // Load FC weights and biases
+    `ifndef RUNTIME_WEIGHTS
     `include "fc_weights.vh"
     `include "fc_bias.vh"
+    `endif
     
     // Simplified dense layer implementation
     // For full implementation, this needs proper weight memory and MAC units
@@ -0,0 +1,9 @@
+// Runtime-writable weights for the Verilator simulation server (RUNTIME_WEIGHTS)
+// Same names and layout as conv_weights.vh, conv_bias.vh, fc_weights.vh, fc_bias.vh;
+// written through the public scope by verilator/cnn_sim_server.cpp so new
+// weights need no rebuild
+
+reg [7:0] CONV_WEIGHTS [0:35] /*verilator public_flat_rw*/;
+reg [7:0] CONV_BIAS [0:3] /*verilator public_flat_rw*/;
+reg [7:0] FC_WEIGHTS [0:6759] /*verilator public_flat_rw*/;
+reg [7:0] FC_BIAS [0:9] /*verilator public_flat_rw*/;
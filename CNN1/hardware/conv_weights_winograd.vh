@@ -0,0 +1,18 @@
+// Automatically generated weight parameters for CONV_WEIGHTS_WINOGRAD
+// Bit width: 8
+// Generated from quantize_weights.py
+
+// Total weights: 64
+// Original shape: (4, 4, 4)
+
+parameter [7:0] CONV_WEIGHTS_WINOGRAD [0:63] = '{
+    8'h24, 8'h24, 8'hF8, 8'hF8, 8'hF2, 8'hE4, 8'hE4, 8'hD6,
+    8'hEE, 8'hFC, 8'hF4, 8'h02, 8'hBC, 8'hBC, 8'hE0, 8'hE0,
+    8'hD8, 8'h0E, 8'hF2, 8'h28, 8'hF8, 8'h11, 8'hE7, 8'h00,
+    8'hF8, 8'hFF, 8'hFD, 8'h04, 8'h18, 8'h02, 8'hF2, 8'hDC,
+    8'hDC, 8'hDE, 8'h16, 8'h18, 8'h02, 8'h01, 8'h11, 8'h10,
+    8'h0E, 8'h01, 8'h0D, 8'h00, 8'h34, 8'h24, 8'h08, 8'hF8,
+    8'h0C, 8'h2C, 8'h04, 8'h24, 8'hD8, 8'hED, 8'hF3, 8'h08,
+    8'hF4, 8'hD9, 8'hF7, 8'hDC, 8'hC0, 8'h9A, 8'hE6, 8'hC0
+};
+
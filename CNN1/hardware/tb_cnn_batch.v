@@ -0,0 +1,138 @@
+/*
+ * Batch Regression Testbench for cnn_top
+ *
+ * Streams many MNIST images through the full pipeline in one simulation:
+ *   +STIM=<file>        packed stimulus, one image per line
+ *                       (784 pixels x 8 bits, pixel 0 in bits [7:0])
+ *   +NUM_IMAGES=<n>     number of lines to run
+ *   +FIRST_INDEX=<k>    index printed for the first image (shard offset)
+ *   +FEATURES           also dump the feature buffer when features_ready rises
+ *
+ * Output, one line per image (parsed by python/rtl_regression.py):
+ *   FEATURES <index> <feature0> ... <feature675>   (+FEATURES only)
+ *   RESULT <index> <predicted_class> <score0> ... <score9> <cycles>
+ *   TIMEOUT <index>
+ *
+ * cnn_top counters do not restart between images, so the DUT is reset
+ * before every image.
+ */
+
+`timescale 1ns/1ps
+
+module tb_cnn_batch();
+
+    parameter IMG_SIZE = 28;
+    parameter PIXEL_WIDTH = 8;
+    parameter NUM_CLASSES = 10;
+    parameter MAX_IMAGES = 10000;
+    parameter TIMEOUT_CYCLES = 5000;
+    parameter CLK_PERIOD = 10;
+
+    localparam NUM_PIXELS = IMG_SIZE * IMG_SIZE;
+
+    // Signals
+    reg clk, rst_n, start;
+    reg [PIXEL_WIDTH-1:0] pixel_in;
+    reg pixel_valid;
+
+    wire signed [31:0] class_scores [0:NUM_CLASSES-1];
+    wire [3:0] predicted_class;
+    wire done;
+
+    // Packed stimulus: one image per entry
+    reg [NUM_PIXELS*PIXEL_WIDTH-1:0] stimulus [0:MAX_IMAGES-1];
+    reg [1023:0] stim_file;
+
+    integer num_images, first_index;
+    integer img, p, cycles;
+    integer dump_features, feature;
+    reg features_dumped;
+
+    cnn_top #(
+        .IMG_SIZE(IMG_SIZE),
+        .PIXEL_WIDTH(PIXEL_WIDTH),
+        .NUM_CLASSES(NUM_CLASSES)
+    ) dut (
+        .clk(clk),
+        .rst_n(rst_n),
+        .start(start),
+        .pixel_in(pixel_in),
+        .pixel_valid(pixel_valid),
+        .class_scores(class_scores),
+        .predicted_class(predicted_class),
+        .done(done)
+    );
+
+    // Clock generation
+    initial begin
+        clk = 0;
+        forever #(CLK_PERIOD/2) clk = ~clk;
+    end
+
+    initial begin
+        if (!$value$plusargs("STIM=%s", stim_file)) begin
+            $display("ERROR: missing +STIM=<file>");
+            $finish;
+        end
+        if (!$value$plusargs("NUM_IMAGES=%d", num_images)) num_images = 1;
+        if (!$value$plusargs("FIRST_INDEX=%d", first_index)) first_index = 0;
+        dump_features = $test$plusargs("FEATURES");
+
+        $readmemh(stim_file, stimulus, 0, num_images - 1);
+
+        rst_n = 0;
+        start = 0;
+        pixel_in = 0;
+        pixel_valid = 0;
+
+        for (img = 0; img < num_images; img = img + 1) begin
+            // Reset between images
+            rst_n = 0;
+            start = 0;
+            features_dumped = 0;
+            repeat (3) @(posedge clk);
+            rst_n = 1;
+            start = 1;
+            @(posedge clk);
+
+            // Stream 28x28 pixels, one per cycle
+            for (p = 0; p < NUM_PIXELS; p = p + 1) begin
+                pixel_in = stimulus[img][p*PIXEL_WIDTH +: PIXEL_WIDTH];
+                pixel_valid = 1;
+                @(posedge clk);
+            end
+            pixel_valid = 0;
+
+            // Wait for the dense layer
+            cycles = NUM_PIXELS;
+            while (!done && cycles < TIMEOUT_CYCLES) begin
+                @(posedge clk);
+                cycles = cycles + 1;
+            end
+
+            if (done) begin
+                $display("RESULT %0d %0d %0d %0d %0d %0d %0d %0d %0d %0d %0d %0d %0d",
+                         first_index + img, predicted_class,
+                         class_scores[0], class_scores[1], class_scores[2], class_scores[3],
+                         class_scores[4], class_scores[5], class_scores[6], class_scores[7],
+                         class_scores[8], class_scores[9], cycles);
+            end else begin
+                $display("TIMEOUT %0d", first_index + img);
+            end
+        end
+
+        $finish;
+    end
+
+    // +FEATURES: feature buffer contents once features_ready is set
+    always @(posedge clk) begin
+        if (dump_features && rst_n && dut.features_ready && !features_dumped) begin
+            $write("FEATURES %0d", first_index + img);
+            for (feature = 0; feature < 676; feature = feature + 1)
+                $write(" %0d", dut.feature_buffer[feature]);
+            $write("\n");
+            features_dumped = 1;
+        end
+    end
+
+endmodule
@@ -0,0 +1,114 @@
+// Persistent Verilator simulation server for cnn_top
+//
+// Line protocol on stdin; replies on stdout start with '@':
+//   CONV_W <36 ints> | CONV_B <4 ints> | FC_W <6760 ints> | FC_B <10 ints>  -> @OK
+//   IMAGE <784 pixels>      -> @RESULT <class> <score0> ... <score9> <cycles> | @TIMEOUT
+//   QUIT
+//
+// IMAGE mirrors tb_cnn_batch.v: reset, raise start, stream one pixel per
+// cycle, then wait for done.
+
+#include <cstdint>
+#include <iostream>
+#include <sstream>
+#include <string>
+#include "verilated.h"
+#include "verilated_syms.h"
+#include "Vcnn_top.h"
+
+static const int NUM_PIXELS = 28 * 28;
+static const int NUM_CLASSES = 10;
+static const int TIMEOUT_CYCLES = 5000;
+
+static Vcnn_top* top;
+
+static void tick() {
+    top->clk = 0;
+    top->eval();
+    top->clk = 1;
+    top->eval();
+}
+
+// Write `count` 8-bit values from the stream into a public weight array
+static bool load_array(const VerilatedScope* scope, const char* name, int count, std::istringstream& in) {
+    const VerilatedVar* var = scope->varFind(name);
+    if (!var) return false;
+    CData* data = static_cast<CData*>(var->datap());
+    int value;
+    for (int i = 0; i < count; i++) {
+        if (!(in >> value)) return false;
+        data[i] = static_cast<CData>(value & 0xFF);
+    }
+    return true;
+}
+
+int main(int argc, char** argv) {
+    VerilatedContext* contextp = new VerilatedContext;
+    contextp->commandArgs(argc, argv);
+    top = new Vcnn_top{contextp};
+
+    const VerilatedScope* scope = contextp->scopeFind("TOP.cnn_top");
+    if (!scope) {
+        std::cout << "@ERROR cnn_top scope not found (build with +define+RUNTIME_WEIGHTS)" << std::endl;
+        return 1;
+    }
+
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::istringstream in(line);
+        std::string cmd;
+        in >> cmd;
+
+        if (cmd == "CONV_W" || cmd == "CONV_B" || cmd == "FC_W" || cmd == "FC_B") {
+            bool ok;
+            if (cmd == "CONV_W") ok = load_array(scope, "CONV_WEIGHTS", 36, in);
+            else if (cmd == "CONV_B") ok = load_array(scope, "CONV_BIAS", 4, in);
+            else if (cmd == "FC_W") ok = load_array(scope, "FC_WEIGHTS", 6760, in);
+            else ok = load_array(scope, "FC_BIAS", NUM_CLASSES, in);
+            std::cout << (ok ? "@OK" : "@ERROR bad " + cmd) << std::endl;
+        } else if (cmd == "IMAGE") {
+            int pixels[NUM_PIXELS];
+            for (int p = 0; p < NUM_PIXELS; p++) in >> pixels[p];
+
+            // Reset between images
+            top->rst_n = 0;
+            top->start = 0;
+            top->pixel_valid = 0;
+            for (int i = 0; i < 3; i++) tick();
+            top->rst_n = 1;
+            top->start = 1;
+            tick();
+
+            for (int p = 0; p < NUM_PIXELS; p++) {
+                top->pixel_in = pixels[p] & 0xFF;
+                top->pixel_valid = 1;
+                tick();
+            }
+            top->pixel_valid = 0;
+
+            int cycles = NUM_PIXELS;
+            while (!top->done && cycles < TIMEOUT_CYCLES) {
+                tick();
+                cycles++;
+            }
+
+            if (top->done) {
+                std::cout << "@RESULT " << static_cast<int>(top->predicted_class);
+                for (int c = 0; c < NUM_CLASSES; c++)
+                    std::cout << " " << static_cast<int32_t>(top->class_scores[c]);
+                std::cout << " " << cycles << std::endl;
+            } else {
+                std::cout << "@TIMEOUT" << std::endl;
+            }
+        } else if (cmd == "QUIT") {
+            break;
+        } else if (!cmd.empty()) {
+            std::cout << "@ERROR unknown command " << cmd << std::endl;
+        }
+    }
+
+    top->final();
+    delete top;
+    delete contextp;
+    return 0;
+}
@@ -0,0 +1,396 @@
+"""
+End-to-End Benchmark Suite
+- Fixed-seed scenarios across the CNN1, SNN1 and SNN2 pipelines:
+    train         train_model's step (Adam, cross-entropy, batch 64): images/sec
+    quantize      quantize_and_export wall time and .vh emission rate
+    inference     quantized inference: host_engine.py and integer_reference.py images/sec
+    hardware_eval SNN2 FastWeightOptimizer.evaluate_hardware evaluations/sec
+                  (uncached and cache hits; needs iverilog)
+    snn1_lif      SNN1 LIF_Neuron steps/sec, SNN_XOR.simulate steps/sec and the
+                  lif_population.py engine on a batch of 4096 XOR simulations
+    startup       cold start of a fresh interpreter: torch.load vs the .npz
+                  weight store, and importing quantize_weights
+- Each metric is the median of several repeats; scenarios that write files
+  run in a temporary copy of the tree, so exported weights are untouched
+- SNN scenarios run in a fresh interpreter inside their own project
+  directory, so no SNN directory is ever put ahead of CNN1/python
+- Results are written as JSON and compared with a stored baseline: a metric
+  more than `threshold` worse than the baseline is reported as a regression
+  (exit code 1)
+- A scenario that raises, or that no longer reports a metric the baseline
+  has, is a failure (exit code 1); a baseline is never saved from a run
+  with errors
+
+Usage: python benchmark.py [scenario ...] [--quick] [--save-baseline]
+                           [--baseline=path] [--output=path] [--threshold=0.15]
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import integer_reference as ref
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SNN1_DIR = os.path.join(SCRIPT_DIR, '..', '..', 'SNN1', 'software')
+SNN2_DIR = os.path.join(SCRIPT_DIR, '..', '..', 'SNN2_AER')
+
+BASELINE = '../data/benchmarks/baseline.json'
+OUTPUT = '../data/benchmarks/latest.json'
+SEED = 0
+THRESHOLD = 0.15
+
+
+def measure(fn, repeats=3, warmup=1):
+    """Median wall time (s) of fn() over `repeats` runs after `warmup` runs"""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def metric(value, unit, higher_is_better=True):
+    return {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+
+
+def load_images(train=False):
+    """MNIST uint8 images; falls back to the test split when training images are missing"""
+    try:
+        return ref.load_mnist_uint8('../data/MNIST/raw', train=train)
+    except (FileNotFoundError, ValueError):
+        return ref.load_mnist_uint8('../data/MNIST/raw')
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def bench_train(quick=False):
+    import torch
+    import torch.nn as nn
+    import torch.optim as optim
+    from train_mnist_cnn import SimpleMNISTCNN
+
+    torch.manual_seed(SEED)
+    images, labels = load_images(train=True)
+    num_batches = 20 if quick else 100
+    x = torch.from_numpy((images[:64 * num_batches] / 255.0 - ref.MNIST_MEAN) / ref.MNIST_STD).float().unsqueeze(1)
+    y = torch.from_numpy(labels[:64 * num_batches].astype(np.int64))
+
+    model = SimpleMNISTCNN()
+    criterion = nn.CrossEntropyLoss()
+    optimizer = optim.Adam(model.parameters(), lr=0.001)
+
+    def epoch():
+        model.train()
+        for data, target in zip(x.split(64), y.split(64)):
+            optimizer.zero_grad()
+            loss = criterion(model(data), target)
+            loss.backward()
+            optimizer.step()
+
+    seconds = measure(epoch, repeats=2 if quick else 3)
+    return {'images_per_sec': metric(len(x) / seconds, 'images/s'),
+            'threads': metric(torch.get_num_threads(), 'threads', None)}
+
+
+def bench_quantize(quick=False):
+    import quantize_weights
+
+    model_path = os.path.abspath('../data/mnist_cnn_model.pth')
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ['python', 'hardware', 'data']:
+            os.makedirs(os.path.join(tmp, name))
+        with working_directory(os.path.join(tmp, 'python')), contextlib.redirect_stdout(io.StringIO()):
+            export = measure(lambda: quantize_weights.quantize_and_export(model_path), repeats=2 if quick else 3)
+
+            fc_weights = np.random.default_rng(SEED).integers(-128, 128, size=(10, 676))
+            emit = measure(lambda: quantize_weights.save_weights_to_verilog(
+                fc_weights, '../hardware/fc_weights.vh', 'FC_WEIGHTS', 8), repeats=5)
+
+    return {'export_seconds': metric(export, 's', False),
+            'vh_values_per_sec': metric(fc_weights.size / emit, 'values/s')}
+
+
+def bench_inference(quick=False):
+    from host_engine import HostEngine
+
+    images, labels = load_images()
+    images = images[:2000 if quick else 10000]
+    engine = HostEngine.from_artifacts('../hardware')
+    params = ref.load_exported_params('../hardware')
+
+    host = measure(lambda: engine.predict(images), repeats=3)
+    reference = measure(lambda: ref.evaluate(images, labels[:len(images)], params), repeats=1 if quick else 3)
+    return {'host_engine_images_per_sec': metric(len(images) / host, 'images/s'),
+            'integer_reference_images_per_sec': metric(len(images) / reference, 'images/s')}
+
+
+def run_in_project(project_dir, scenario, quick=False):
+    """
+    Run benchmark.<scenario>(quick) in a fresh interpreter started in project_dir
+
+    project_dir leads the child's sys.path as it does for the project's own
+    scripts, and this directory is only appended, so same-named modules
+    (quantize_weights.py, verilator_backend.py) resolve to the project's copies.
+    """
+    code = (f"import json, os, sys; sys.path[0] = os.getcwd(); sys.path.append({SCRIPT_DIR!r}); "
+            f"import benchmark; print(json.dumps(benchmark.{scenario}({quick!r})))")
+    result = subprocess.run([sys.executable, '-c', code], cwd=project_dir, capture_output=True, text=True)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit code {result.returncode}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_hardware_eval(quick=False):
+    if shutil.which('iverilog') is None:
+        return {'skipped': 'iverilog not found'}
+    return run_in_project(os.path.join(SNN2_DIR, 'python'), 'hardware_eval', quick)
+
+
+def hardware_eval(quick=False):
+    """SNN2 part of bench_hardware_eval; runs inside SNN2_AER/python (run_in_project)"""
+    hardware = os.path.join(SNN2_DIR, 'hardware')
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copytree(hardware, os.path.join(tmp, 'hardware'), ignore=shutil.ignore_patterns('build'))
+        os.makedirs(os.path.join(tmp, 'python'))
+        manual = os.path.join(tmp, 'hardware', 'weight_parameters_manual.vh')
+        if not os.path.exists(manual):
+            shutil.copy(os.path.join(tmp, 'hardware', 'weight_parameters.vh'), manual)
+
+        import fast_optimize
+
+        with working_directory(os.path.join(tmp, 'python')), contextlib.redirect_stdout(io.StringIO()):
+            optimizer = fast_optimize.FastWeightOptimizer()
+            rng = np.random.default_rng(SEED)
+            candidates = [rng.integers(-10, 11, size=(8, 3)) for _ in range(2 if quick else 5)]
+
+            start = time.perf_counter()
+            for weights in candidates:
+                optimizer.evaluate_hardware(weights)
+            uncached = (time.perf_counter() - start) / len(candidates)
+
+            start = time.perf_counter()
+            for weights in candidates:
+                optimizer.evaluate_hardware(weights)
+            cached = (time.perf_counter() - start) / len(candidates)
+
+    return {'evaluations_per_sec': metric(1.0 / uncached, 'evals/s'),
+            'cached_evaluations_per_sec': metric(1.0 / cached, 'evals/s')}
+
+
+def bench_snn1_lif(quick=False):
+    return run_in_project(SNN1_DIR, 'snn1_lif', quick)
+
+
+def snn1_lif(quick=False):
+    """SNN1 part of bench_snn1_lif; runs inside SNN1/software (run_in_project)"""
+    from model_xor import LIF_Neuron, SNN_XOR
+    import lif_population
+
+    steps = 20000 if quick else 100000
+    currents = np.random.default_rng(SEED).integers(0, 6, size=steps).tolist()
+
+    def run_neuron():
+        neuron = LIF_Neuron(threshold=15, leak=1)
+        for t, current in enumerate(currents):
+            neuron.step(current, t)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        snn = SNN_XOR()
+        patterns = [(0, 0), (0, 1), (1, 0), (1, 1)]
+        time_steps = 50
+        runs = 5 if quick else 25
+
+        def run_network():
+            for _ in range(runs):
+                for i0, i1 in patterns:
+                    snn.simulate(i0, i1, time_steps)
+
+        neuron_time = measure(run_neuron)
+        network_time = measure(run_network)
+
+        population = lif_population.xor_network(snn, 4096)
+        spikes = lif_population.input_spikes(np.tile(patterns, (1024, 1)), time_steps)
+        population_time = measure(lambda: population.run(spikes))
+
+    return {'neuron_steps_per_sec': metric(steps / neuron_time, 'steps/s'),
+            'network_steps_per_sec': metric(runs * len(patterns) * time_steps / network_time, 'steps/s'),
+            'population_network_steps_per_sec': metric(population.batch * time_steps / population_time, 'steps/s')}
+
+
+def bench_startup(quick=False):
+    import weight_store
+
+    seconds = weight_store.startup_report('../data/mnist_cnn_model.pth', repeats=1 if quick else 3)
+    return {f'{name}_seconds': metric(value, 's', False) for name, value in seconds.items()}
+
+
+SCENARIOS = {
+    'train': bench_train,
+    'quantize': bench_quantize,
+    'inference': bench_inference,
+    'hardware_eval': bench_hardware_eval,
+    'snn1_lif': bench_snn1_lif,
+    'startup': bench_startup,
+}
+
+
+def environment():
+    info = {'python': platform.python_version(), 'numpy': np.__version__,
+            'platform': platform.platform(), 'cpus': os.cpu_count(), 'seed': SEED}
+    try:
+        import torch
+        info['torch'] = torch.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def run(names, quick=False):
+    """Run the named scenarios; failures are recorded, not raised"""
+    results = {}
+    for name in names:
+        print(f"  {name} ...", flush=True)
+        try:
+            results[name] = SCENARIOS[name](quick)
+        except Exception as exc:
+            results[name] = {'error': f"{type(exc).__name__}: {exc}"}
+    return {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'quick': quick,
+            'environment': environment(), 'scenarios': results}
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Relative change of every metric present in both runs
+
+    Returns:
+        list of (scenario, metric, current, baseline, change, regressed); change
+        is positive when the current run is better
+    """
+    rows = []
+    for scenario, metrics in results['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(scenario, {})
+        for name, m in metrics.items():
+            if not isinstance(m, dict) or m.get('higher_is_better') is None:
+                continue
+            if not isinstance(base.get(name), dict) or not base[name]['value']:
+                continue
+            ratio = m['value'] / base[name]['value']
+            change = ratio - 1.0 if m['higher_is_better'] else 1.0 / ratio - 1.0
+            rows.append((scenario, name, m['value'], base[name]['value'], change, change < -threshold))
+    return rows
+
+
+def failures(results, baseline=None):
+    """
+    Errored scenarios and baseline metrics missing from the current run
+
+    Only scenarios that were run are checked, so a subset run is not a failure.
+
+    Returns:
+        list of (scenario, metric or None, reason)
+    """
+    found = []
+    for scenario, metrics in results['scenarios'].items():
+        if 'error' in metrics:
+            found.append((scenario, None, metrics['error']))
+            continue
+        base = (baseline or {}).get('scenarios', {}).get(scenario, {})
+        for name, m in base.items():
+            if isinstance(m, dict) and not isinstance(metrics.get(name), dict):
+                found.append((scenario, name, metrics.get('skipped', 'missing from this run')))
+    return found
+
+
+def print_results(results):
+    for scenario, metrics in results['scenarios'].items():
+        print(f"\n{scenario}:")
+        for name, m in metrics.items():
+            if isinstance(m, dict):
+                print(f"  {name:<36} {m['value']:>14,.2f} {m['unit']}")
+            else:
+                print(f"  {name:<36} {m}")
+
+
+if __name__ == '__main__':
+    instrument.setup()
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    options = dict(a[2:].split('=', 1) for a in sys.argv[1:] if a.startswith('--') and '=' in a)
+    quick = '--quick' in sys.argv
+    baseline_path = options.get('baseline', BASELINE)
+    output_path = options.get('output', OUTPUT)
+    threshold = float(options.get('threshold', THRESHOLD))
+    names = args or list(SCENARIOS)
+
+    print("\n" + "="*60)
+    print("Benchmark Suite" + (" (quick)" if quick else ""))
+    print("="*60)
+
+    results = run(names, quick)
+    print_results(results)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output_path}")
+
+    errors = failures(results)
+    if errors:
+        print(f"\n✗ {len(errors)} scenario(s) failed:")
+        for scenario, _, reason in errors:
+            print(f"  {scenario}: {reason}")
+        print()
+        sys.exit(1)
+
+    if '--save-baseline' in sys.argv:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {baseline_path}\n")
+        sys.exit(0)
+
+    if not os.path.exists(baseline_path):
+        print(f"No baseline at {baseline_path} (create one with --save-baseline)\n")
+        sys.exit(0)
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, threshold)
+    missing = failures(results, baseline)
+
+    print(f"\nComparison with {baseline_path} (regression: > {100 * threshold:.0f}% worse):")
+    print(f"  {'metric':<46} {'current':>12} {'baseline':>12} {'change':>8}")
+    for scenario, name, current, base, change, regressed in rows:
+        print(f"  {scenario + '.' + name:<46} {current:>12,.2f} {base:>12,.2f} "
+              f"{100 * change:>+7.1f}%{'  ✗ REGRESSION' if regressed else ''}")
+
+    for scenario, name, reason in missing:
+        print(f"  {scenario + '.' + name:<46} {'-':>12} {'':>12} {'':>8}  ✗ MISSING ({reason})")
+
+    regressions = [row for row in rows if row[5]]
+    failed = bool(regressions or missing)
+    print(f"\n{'✗' if failed else '✓'} {len(regressions)} regression(s) in {len(rows)} metrics, "
+          f"{len(missing)} baseline metric(s) missing\n")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,286 @@
+"""
+Cycle-Level Throughput Model of cnn_top
+- Follows the valid/start handshakes of line_buffer, conv_unit, max_pool,
+  the feature buffer and dense_layer cycle by cycle
+- Streams images back to back and reports latency, initiation interval (II),
+  per-stage occupancy, input stall cycles and images/sec at a given clock
+- Compares the current single feature buffer with a double-buffered variant
+  that overlaps the dense phase with the next image's conv/pool
+
+Assumptions (RTL timing, not its open issues):
+  - one pixel per `pixel_interval` cycles while the input is not stalled
+  - max_pool emits on conv rows 0, 2, ..., 24 at odd columns (current RTL)
+  - dense_layer consumes feature i in ACCUMULATE cycle i; cnn_top leaves
+    fc_feature_idx undriven, so the model assumes it follows feature_count
+  - line_buffer and max_pool counters restart for every image
+"""
+
+import math
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+IMG_SIZE = 28
+KERNEL_SIZE = 3
+NUM_FILTERS = 4
+NUM_CLASSES = 10
+
+# Register stages between events (cycles)
+LINE_BUFFER_LATENCY = 1     # window/window_valid registered
+CONV_LATENCY = 1            # conv_out/valid_out registered
+POOL_LATENCY = 1            # data_out/valid_out registered
+FEATURES_READY_LATENCY = 1  # features_ready set after the 169th pool write
+FC_START_LATENCY = 1        # fc_start registered from features_ready
+DENSE_IDLE_CYCLES = 1       # IDLE -> ACCUMULATE on start
+DENSE_DONE_CYCLES = 1       # DONE state raises done
+DENSE_RELEASE_CYCLES = 2    # done -> fc_start low -> back to IDLE
+
+STAGES = ['input', 'line_buffer', 'conv', 'pool', 'dense']
+
+
+def image_schedule(img_size=IMG_SIZE, pixel_interval=1, dense_parallelism=1,
+                   num_filters=NUM_FILTERS, num_classes=NUM_CLASSES, streaming_dense=False,
+                   kernel_size=KERNEL_SIZE):
+    """
+    Event times for one image, relative to its first pixel (cycle 0)
+
+    Args:
+        img_size: input image width/height
+        pixel_interval: cycles between accepted pixels
+        dense_parallelism: features consumed per ACCUMULATE cycle
+        num_filters: parallel conv/pool channels
+        num_classes: dense outputs (one ADD_BIAS cycle each)
+        streaming_dense: dense_layer accumulates the num_filters features of each
+                         pool_valid pulse as they arrive (stream-order FC weights,
+                         no feature buffer); dense_parallelism is ignored
+        kernel_size: conv kernel width/height (line_buffer rows)
+
+    Returns:
+        dict with per-stage valid cycles and the dense phase boundaries
+    """
+    conv_size = img_size - kernel_size + 1
+    pool_size = conv_size // 2
+    num_features = pool_size * pool_size * num_filters
+
+    pixel_cycles = [p * pixel_interval for p in range(img_size * img_size)]
+
+    window_cycles = []
+    pool_cycles = []
+    for y in range(kernel_size - 1, img_size):
+        for x in range(kernel_size - 1, img_size):
+            t = pixel_cycles[y * img_size + x] + LINE_BUFFER_LATENCY
+            window_cycles.append(t)
+            row, col = y - kernel_size + 1, x - kernel_size + 1
+            # Odd feature-map sizes drop the last row/column, like nn.MaxPool2d
+            if row % 2 == 0 and col % 2 == 1 and row < 2 * pool_size and col < 2 * pool_size:
+                pool_cycles.append(t + CONV_LATENCY + POOL_LATENCY)
+    conv_cycles = [t + CONV_LATENCY for t in window_cycles]
+
+    if streaming_dense:
+        # Accumulate on every pool_valid; bias phase follows the last group
+        features_ready = pool_cycles[-1]
+        dense_start = pool_cycles[0]
+        accumulate_cycles = pool_cycles[-1] - pool_cycles[0] + 1
+    else:
+        features_ready = pool_cycles[-1] + FEATURES_READY_LATENCY
+        accumulate_cycles = math.ceil(num_features / dense_parallelism)
+        dense_start = features_ready + FC_START_LATENCY + DENSE_IDLE_CYCLES
+
+    return {
+        'pixels': pixel_cycles,
+        'windows': window_cycles,
+        'conv': conv_cycles,
+        'pool': pool_cycles,
+        'num_features': num_features,
+        'streaming_dense': streaming_dense,
+        'first_feature_write': pool_cycles[0],
+        'features_ready': features_ready,
+        'dense_start': dense_start,
+        'accumulate_cycles': accumulate_cycles,
+        # ADD_BIAS walks all classes plus one cycle to leave the state
+        'dense_cycles': accumulate_cycles + num_classes + 1 + DENSE_DONE_CYCLES,
+        # Cycles with MAC work (streaming dense idles between pool_valid pulses)
+        'dense_busy_cycles': (len(pool_cycles) if streaming_dense else accumulate_cycles)
+                             + num_classes + 1 + DENSE_DONE_CYCLES,
+    }
+
+
+def simulate_stream(num_images=8, feature_buffers=1, clock_mhz=100.0, **schedule_kwargs):
+    """
+    Stream images back to back through cnn_top
+
+    The input stalls when the next image would overwrite a feature buffer that
+    dense_layer has not finished reading. Dense runs of consecutive images are
+    serialized on the single dense_layer instance.
+
+    Args:
+        num_images: images streamed back to back
+        feature_buffers: 1 = current RTL, 2 = double-buffered (dense overlaps conv)
+        clock_mhz: clock used for time / throughput figures
+        **schedule_kwargs: forwarded to image_schedule()
+
+    Returns:
+        dict with per-image timing, steady-state II, occupancy and stall info
+    """
+    sched = image_schedule(**schedule_kwargs)
+    input_span = sched['pixels'][-1] + 1
+
+    images = []
+    for i in range(num_images):
+        # Input port is free once the previous image has been streamed in
+        earliest = images[-1]['start'] + input_span if images else 0
+        start = earliest
+        stall_reason = None
+
+        # Feature buffer reuse: image i writes the buffer used by image i - B
+        if i >= feature_buffers and not sched['streaming_dense']:
+            owner = images[i - feature_buffers]
+            free_at = owner['read_end'] + 1
+            if start + sched['first_feature_write'] < free_at:
+                start = free_at - sched['first_feature_write']
+                stall_reason = 'feature_buffer'
+
+        ready = start + sched['features_ready']
+        dense_start = start + sched['dense_start']
+        if images and dense_start < images[-1]['dense_free']:
+            dense_start = images[-1]['dense_free']
+            stall_reason = stall_reason or 'dense_busy'
+
+        read_end = dense_start + sched['accumulate_cycles'] - 1
+        done = dense_start + sched['dense_cycles']
+        images.append({
+            'start': start,
+            'input_stall': start - earliest,
+            'stall_reason': stall_reason,
+            'features_ready': ready,
+            'dense_start': dense_start,
+            'read_end': read_end,
+            'done': done,
+            'dense_free': done + DENSE_RELEASE_CYCLES,
+            'latency': done - start,
+        })
+
+    total_cycles = images[-1]['dense_free']
+    if num_images > 1:
+        ii = (images[-1]['start'] - images[0]['start']) / (num_images - 1)
+    else:
+        ii = total_cycles
+
+    # Busy cycles per stage (valid outputs; dense counts its whole active phase)
+    busy = {
+        'input': len(sched['pixels']),
+        'line_buffer': len(sched['windows']),
+        'conv': len(sched['conv']),
+        'pool': len(sched['pool']),
+        'dense': sched['dense_busy_cycles'],
+    }
+    occupancy = {stage: min(1.0, busy[stage] / ii) for stage in STAGES}
+
+    return {
+        'schedule': sched,
+        'images': images,
+        'feature_buffers': feature_buffers,
+        'clock_mhz': clock_mhz,
+        'initiation_interval': ii,
+        'latency': images[0]['latency'],
+        'total_cycles': total_cycles,
+        'images_per_sec': clock_mhz * 1e6 / ii,
+        'busy_cycles': busy,
+        'occupancy': occupancy,
+        'bottleneck': _bottleneck(images, busy, input_span),
+        'stall_cycles': sum(img['input_stall'] for img in images),
+    }
+
+
+def _bottleneck(images, busy, input_span):
+    """Stage that sets the initiation interval"""
+    reasons = [img['stall_reason'] for img in images if img['stall_reason']]
+    if 'feature_buffer' in reasons:
+        return 'dense (holds the feature buffer)'
+    if 'dense_busy' in reasons:
+        return 'dense'
+    return max(STAGES, key=lambda s: input_span if s == 'input' else busy[s])
+
+
+def print_timeline(result, num_images=2, cycles_per_char=50):
+    """ASCII Gantt chart of the first images (one row per stage and image)"""
+    sched = result['schedule']
+    num_images = min(num_images, len(result['images']))
+    width = math.ceil(result['images'][num_images - 1]['dense_free'] / cycles_per_char)
+
+    for idx, img in enumerate(result['images'][:num_images]):
+        spans = {
+            'input': (img['start'], img['start'] + sched['pixels'][-1]),
+            'line_buffer': (img['start'] + sched['windows'][0], img['start'] + sched['windows'][-1]),
+            'conv': (img['start'] + sched['conv'][0], img['start'] + sched['conv'][-1]),
+            'pool': (img['start'] + sched['pool'][0], img['start'] + sched['pool'][-1]),
+            'dense': (img['dense_start'], img['done']),
+        }
+        for stage in STAGES:
+            first, last = spans[stage]
+            row = [' '] * width
+            for c in range(first // cycles_per_char, last // cycles_per_char + 1):
+                row[c] = str(idx)
+            print(f"  {stage:<12}|{''.join(row)}|")
+        print()
+    print(f"  (1 char = {cycles_per_char} cycles)")
+
+
+def print_report(result):
+    """Latency, II, throughput and occupancy summary"""
+    clock = result['clock_mhz']
+    sched = result['schedule']
+
+    if sched['streaming_dense']:
+        print("\nStreaming dense (stream-order FC weights, no feature buffer)")
+    else:
+        print(f"\nFeature buffers: {result['feature_buffers']}")
+    print(f"  Single-image latency: {result['latency']:,} cycles "
+          f"({result['latency'] / clock:.2f} us @ {clock:.0f} MHz)")
+    print(f"    features ready at cycle {sched['features_ready']}, "
+          f"dense phase {sched['dense_cycles']} cycles")
+    print(f"  Initiation interval:  {result['initiation_interval']:,.0f} cycles")
+    print(f"  Throughput:           {result['images_per_sec']:,.0f} images/sec")
+    print(f"  Input stall cycles:   {result['stall_cycles']:,} over {len(result['images'])} images")
+
+    reasons = {img['stall_reason'] for img in result['images'] if img['stall_reason']}
+    if reasons:
+        print(f"  Stalls caused by:     {', '.join(sorted(reasons))}")
+    print(f"  Bottleneck stage:     {result['bottleneck']}")
+
+    print("  Occupancy (busy cycles / II):")
+    for stage in STAGES:
+        print(f"    {stage:<12} {result['busy_cycles'][stage]:5d} cycles  "
+              f"{100 * result['occupancy'][stage]:5.1f}%")
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    clock_mhz = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+    num_images = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    print("\n" + "="*60)
+    print("cnn_top Cycle Model - Back-to-Back Images")
+    print("="*60)
+
+    current = simulate_stream(num_images, feature_buffers=1, clock_mhz=clock_mhz)
+    overlapped = simulate_stream(num_images, feature_buffers=2, clock_mhz=clock_mhz)
+
+    print_report(current)
+    print("\nTimeline (current RTL, single feature buffer):")
+    print_timeline(current)
+
+    print_report(overlapped)
+    print("\nTimeline (double-buffered features, dense overlaps next conv):")
+    print_timeline(overlapped)
+
+    streaming = simulate_stream(num_images, clock_mhz=clock_mhz, streaming_dense=True)
+    print_report(streaming)
+
+    speedup = current['initiation_interval'] / overlapped['initiation_interval']
+    print(f"\nOverlapping dense with the next image's conv: {speedup:.2f}x throughput")
+    print(f"Streaming dense: latency {current['latency']:,} -> {streaming['latency']:,} cycles, "
+          f"no {streaming['schedule']['num_features']}-entry feature buffer\n")
@@ -0,0 +1,171 @@
+"""
+Dense-Layer Parallelism Explorer
+- Splits FC_WEIGHTS into P banked weight ROMs for a dense_layer with P MAC lanes
+- Lane l handles features l, l+P, l+2P, ...; each bank word holds the 10 class
+  weights of one feature, so every lane reads one word per cycle
+- Predicts cycles/image and throughput with cycle_model.py
+- Reads the exported fc_bank*.mem files back, replays the banked schedule
+  lane by lane and checks it against the integer reference dense layer
+
+Bank word layout (NUM_CLASSES x 8 bits): class c in bits [8c+7:8c]
+"""
+
+import glob
+import math
+import os
+import sys
+import numpy as np
+import integer_reference as ref
+import cycle_model
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+NUM_FEATURES = 676
+NUM_CLASSES = 10
+
+
+def bank_fc_weights(fc_w, num_lanes):
+    """
+    Partition FC weights into per-lane banks
+
+    Args:
+        fc_w: int array [NUM_CLASSES, NUM_FEATURES]
+        num_lanes: parallel MAC lanes P
+
+    Returns:
+        int64 array [P, depth, NUM_CLASSES]; bank[l, c] holds the class weights
+        of feature c*P + l (zero padded past the last feature)
+    """
+    num_classes, num_features = fc_w.shape
+    depth = math.ceil(num_features / num_lanes)
+    padded = np.zeros((num_classes, depth * num_lanes), dtype=np.int64)
+    padded[:, :num_features] = fc_w
+    return padded.T.reshape(depth, num_lanes, num_classes).transpose(1, 0, 2)
+
+
+def pack_bank_words(bank, weight_width=8):
+    """Pack [depth, NUM_CLASSES] weights into one integer word per address"""
+    mask = (1 << weight_width) - 1
+    return [sum((int(w) & mask) << (weight_width * c) for c, w in enumerate(row)) for row in bank]
+
+
+def unpack_bank_words(words, num_classes=NUM_CLASSES, weight_width=8):
+    """Inverse of pack_bank_words: [depth] words -> signed [depth, num_classes] weights"""
+    mask = (1 << weight_width) - 1
+    fields = [[(word >> (weight_width * c)) & mask for c in range(num_classes)] for word in words]
+    return ref.wrap_signed(fields, weight_width)
+
+
+def read_banks(filenames, num_classes=NUM_CLASSES, weight_width=8):
+    """Load fc_bank<l>.mem files ($readmemh images) into the bank_fc_weights() layout"""
+    banks = []
+    for filename in filenames:
+        with open(filename) as f:
+            words = [int(line, 16) for line in f if line.strip() and not line.startswith('//')]
+        banks.append(unpack_bank_words(words, num_classes, weight_width))
+    return np.array(banks)
+
+
+def banked_dense(features, banks, fc_b, acc_width=ref.FC_ACC_WIDTH):
+    """
+    dense_layer with P lanes: one bank word per lane per cycle
+
+    Args:
+        features: pooled features [N, NUM_FEATURES]
+        banks: output of bank_fc_weights()
+        fc_b: accumulator-scale biases [NUM_CLASSES]
+
+    Returns:
+        class scores [N, NUM_CLASSES]
+    """
+    num_lanes, depth, num_classes = banks.shape
+    features = np.asarray(features, dtype=np.int64)
+    acc = np.zeros((features.shape[0], num_classes), dtype=np.int64)
+    for cycle in range(depth):
+        for lane in range(num_lanes):
+            idx = cycle * num_lanes + lane
+            if idx < features.shape[1]:
+                acc += features[:, idx, None] * banks[lane, cycle][None, :]
+    return ref.wrap_signed(acc + np.asarray(fc_b, dtype=np.int64)[None, :], acc_width)
+
+
+def export_banks(banks, hardware_dir='../hardware', weight_width=8):
+    """Write fc_bank<l>.mem for every lane, removing banks from a previous export"""
+    from quantize_weights import save_weights_to_mem
+
+    for stale in glob.glob(os.path.join(hardware_dir, 'fc_bank*.mem')):
+        os.remove(stale)
+
+    num_lanes, depth, num_classes = banks.shape
+    filenames = []
+    for lane in range(num_lanes):
+        filename = os.path.join(hardware_dir, f'fc_bank{lane}.mem')
+        words = np.array(pack_bank_words(banks[lane], weight_width), dtype=object)
+        save_weights_to_mem(words, filename, f'FC_BANK{lane} (lane {lane} of {num_lanes})',
+                            weight_width * num_classes)
+        filenames.append(filename)
+    return filenames
+
+
+def lane_report(num_lanes, clock_mhz=100.0, feature_buffers=1):
+    """Predicted timing and datapath cost for P lanes"""
+    result = cycle_model.simulate_stream(8, feature_buffers, clock_mhz, dense_parallelism=num_lanes)
+    depth = math.ceil(NUM_FEATURES / num_lanes)
+    return {
+        'lanes': num_lanes,
+        'dense_cycles': result['schedule']['dense_cycles'],
+        'latency': result['latency'],
+        'initiation_interval': result['initiation_interval'],
+        'images_per_sec': result['images_per_sec'],
+        'multipliers': NUM_CLASSES * num_lanes,
+        'bank_depth': depth,
+        'padding': depth * num_lanes - NUM_FEATURES,
+    }
+
+
+def validate_banks(filenames, params, images):
+    """Replay of the exported bank files must equal the integer reference dense layer bit for bit"""
+    banks = read_banks(filenames)
+    features = ref.pooled_features(images, params)
+    expected = ref.dense(features, params['fc_w'], params['fc_b'])
+    return np.array_equal(banked_dense(features, banks, params['fc_b']), expected)
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    num_lanes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    clock_mhz = float(sys.argv[2]) if len(sys.argv) > 2 else 100.0
+
+    print("\n" + "="*60)
+    print("Dense-Layer Parallelism Explorer")
+    print("="*60)
+
+    params = ref.load_exported_params('../hardware')
+    images, labels = ref.load_mnist_uint8('../data/MNIST/raw')
+
+    print(f"\nPredicted timing @ {clock_mhz:.0f} MHz (single / double feature buffer):")
+    print(f"  {'P':>4} {'dense':>6} {'latency':>8} {'II (1 buf)':>11} {'img/s (1 buf)':>14} "
+          f"{'img/s (2 buf)':>14} {'mults':>6} {'depth':>6}")
+    for lanes in [1, 2, 4, 8, 13, 26, 52]:
+        single = lane_report(lanes, clock_mhz, feature_buffers=1)
+        double = lane_report(lanes, clock_mhz, feature_buffers=2)
+        print(f"  {lanes:>4} {single['dense_cycles']:>6} {single['latency']:>8} "
+              f"{single['initiation_interval']:>11,.0f} {single['images_per_sec']:>14,.0f} "
+              f"{double['images_per_sec']:>14,.0f} {single['multipliers']:>6} {single['bank_depth']:>6}")
+
+    banks = bank_fc_weights(params['fc_w'], num_lanes)
+    filenames = export_banks(banks, '../hardware')
+    assert validate_banks(filenames, params, images[:500]), "exported banks do not match integer reference"
+    print(f"\n✓ {num_lanes}-lane banks read back from .mem match the integer reference (500 images)")
+
+    accuracy, _ = ref.evaluate(images, labels, params)
+    print(f"  Integer reference accuracy: {accuracy:.2f}%")
+
+    report = lane_report(num_lanes, clock_mhz)
+    print(f"\nGenerated {len(filenames)} banks ({report['bank_depth']} x {8 * NUM_CLASSES}-bit words, "
+          f"{report['padding']} padding entries):")
+    for filename in filenames:
+        print(f"  - {filename}")
+    print()
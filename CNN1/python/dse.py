@@ -0,0 +1,291 @@
+"""
+Design-Space Exploration: Architecture x Quantization x Parallelism
+- Sweeps conv filter count, kernel size, weight bit width (Qm.n) and dense
+  parallelism P around the SimpleMNISTCNN / cnn_top template
+- Stage 1: trains every architecture once (early stopping on a validation
+  split of the MNIST training set), in a process pool
+- Stage 2: quantizes every (architecture, bit width) pair and scores it with
+  the integer numerics reference (integer_reference.py) on the test set; the
+  conv accumulator is sized so it never wraps
+- Stage 3: estimates resources / f_max (resource_model.py) and images/sec
+  (cycle_model.py, clock = min(100 MHz, f_max)) for every P
+- Reports the Pareto front of accuracy vs images/sec vs resource cost
+  (largest utilization fraction on the device) over the points that fit
+
+Trained models (.pth) and scored points are cached under ../data/dse/,
+keyed by a hash of their configuration, so re-runs and extended grids only
+compute what is new.
+
+Usage: python dse.py [max_epochs] [workers] [--quick]
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import cycle_model
+import integer_reference as ref
+import resource_model
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import sim_cache
+import instrument
+
+DSE_DIR = '../data/dse'
+DATA_ROOT = '../data/MNIST/raw'
+
+FILTERS = [2, 4, 8]
+KERNELS = [3, 5]
+BITS = [(4, 3), (6, 4), (8, 4)]       # (num_bits, num_frac_bits); Q2.2 zeroes most FC weights
+PARALLELISM = [1, 2, 4, 8]
+
+VALIDATION_SIZE = 5000
+PATIENCE = 2
+SEED = 0
+
+
+def train_architecture(job):
+    """
+    Train one SimpleMNISTCNN variant with early stopping (process-pool worker)
+
+    Args:
+        job: dict with num_filters, kernel_size, max_epochs, train_limit, path
+
+    Returns:
+        dict with epochs run, best validation accuracy and the model path
+    """
+    import torch
+    import torch.nn as nn
+    import torch.optim as optim
+    from train_mnist_cnn import SimpleMNISTCNN
+
+    torch.set_num_threads(1)  # one core per worker
+    torch.manual_seed(SEED)
+
+    images, labels = ref.load_mnist_uint8(DATA_ROOT, train=True)
+    x = torch.from_numpy((images / 255.0 - ref.MNIST_MEAN) / ref.MNIST_STD).float().unsqueeze(1)
+    y = torch.from_numpy(labels.astype(np.int64))
+    x_val, y_val = x[-VALIDATION_SIZE:], y[-VALIDATION_SIZE:]
+    x_train, y_train = x[:-VALIDATION_SIZE][:job['train_limit']], y[:-VALIDATION_SIZE][:job['train_limit']]
+
+    model = SimpleMNISTCNN(job['num_filters'], job['kernel_size'])
+    optimizer = optim.Adam(model.parameters(), lr=0.001)
+    criterion = nn.CrossEntropyLoss()
+
+    best_acc, best_state, stale, epochs = -1.0, None, 0, 0
+    for epoch in range(job['max_epochs']):
+        model.train()
+        for idx in torch.randperm(len(x_train)).split(64):
+            optimizer.zero_grad()
+            criterion(model(x_train[idx]), y_train[idx]).backward()
+            optimizer.step()
+        epochs = epoch + 1
+
+        model.eval()
+        with torch.no_grad():
+            val_acc = 100.0 * (model(x_val).argmax(dim=1) == y_val).float().mean().item()
+        if val_acc > best_acc:
+            best_acc, stale = val_acc, 0
+            best_state = {k: v.clone() for k, v in model.state_dict().items()}
+        else:
+            stale += 1
+            if stale >= PATIENCE:
+                break
+
+    # Write-then-rename so concurrent runs never load a partial file
+    tmp = job['path'] + f'.{os.getpid()}.tmp'
+    torch.save(best_state, tmp)
+    os.replace(tmp, job['path'])
+    return {'path': job['path'], 'epochs': epochs, 'val_accuracy': best_acc}
+
+
+def score_quantization(job):
+    """
+    Integer-model test accuracy of one (architecture, bit width) pair (process-pool worker)
+
+    Args:
+        job: dict with path, num_filters, kernel_size, num_bits, num_frac_bits
+    """
+    import torch
+
+    torch.set_num_threads(1)
+    state = torch.load(job['path'])
+    params = ref.quantize_params(state['conv1.weight'].numpy(), state['conv1.bias'].numpy(),
+                                 state['fc.weight'].numpy(), state['fc.bias'].numpy(),
+                                 job['num_bits'], job['num_frac_bits'])
+    config = point_config(job['num_filters'], job['kernel_size'], job['num_bits'], 1)
+    images, labels = ref.load_mnist_uint8(DATA_ROOT)
+    accuracy, _ = ref.evaluate(images, labels, params, conv_acc_width=config['conv_acc_width'])
+    return accuracy
+
+
+def point_config(num_filters, kernel_size, num_bits, dense_parallelism):
+    """resource_model configuration of a design point (plain multiplier datapath)"""
+    config = dict(resource_model.DEFAULT_CONFIG, num_filters=num_filters, kernel_size=kernel_size,
+                  weight_width=num_bits, dense_parallelism=dense_parallelism)
+    config['conv_acc_width'] = resource_model.min_conv_acc_width(config)
+    return config
+
+
+def hardware_metrics(config, device='xc7a35t'):
+    """Resources, f_max and images/sec of one configuration"""
+    estimate = resource_model.estimate(config, device)
+    clock = min(100.0, estimate['f_max_mhz'])
+    stream = cycle_model.simulate_stream(8, config['feature_buffers'], clock,
+                                         kernel_size=config['kernel_size'],
+                                         num_filters=config['num_filters'],
+                                         dense_parallelism=config['dense_parallelism'])
+    return {
+        'lut': estimate['total']['lut'],
+        'ff': estimate['total']['ff'],
+        'dsp': estimate['total']['dsp'],
+        'bram18': estimate['total']['bram18'],
+        'resource_cost': max(estimate['utilization'].values()),
+        'f_max_mhz': estimate['f_max_mhz'],
+        'clock_mhz': clock,
+        'latency_cycles': stream['latency'],
+        'initiation_interval': stream['initiation_interval'],
+        'images_per_sec': stream['images_per_sec'],
+        'fits': estimate['fits'],
+    }
+
+
+def pareto_front(points):
+    """
+    Indices of the non-dominated points that fit on the device
+
+    Objectives: maximize accuracy and images_per_sec, minimize resource_cost.
+    """
+    candidates = [i for i, p in enumerate(points) if p['fits']]
+    objectives = np.array([[points[i]['accuracy'], points[i]['images_per_sec'],
+                            -points[i]['resource_cost']] for i in candidates]).reshape(-1, 3)
+    front = []
+    for row, objective in enumerate(objectives):
+        dominated = np.all(objectives >= objective, axis=1) & np.any(objectives > objective, axis=1)
+        if not dominated.any():
+            front.append(candidates[row])
+    return sorted(front, key=lambda i: (-points[i]['accuracy'], -points[i]['images_per_sec']))
+
+
+def run_dse(filters=FILTERS, kernels=KERNELS, bits=BITS, parallelism=PARALLELISM,
+            max_epochs=10, workers=None, train_limit=None, device='xc7a35t', directory=DSE_DIR):
+    """
+    Run the three DSE stages
+
+    Returns:
+        points: list of dicts, one per (filters, kernel, bits, P)
+        front: indices of the Pareto-optimal points
+    """
+    os.makedirs(directory, exist_ok=True)
+    cache = sim_cache.SimulationCache(os.path.join(directory, 'points'))
+    context = multiprocessing.get_context('spawn')
+
+    # Stage 1: train every architecture that is not cached yet
+    architectures = [(f, k) for f in filters for k in kernels]
+    trained = {}
+    jobs = []
+    for f, k in architectures:
+        spec = {'num_filters': f, 'kernel_size': k, 'max_epochs': max_epochs,
+                'train_limit': train_limit, 'validation': VALIDATION_SIZE,
+                'patience': PATIENCE, 'seed': SEED}
+        key = sim_cache.hash_inputs(data=[json.dumps(spec, sort_keys=True)], namespace='dse-train')
+        path = os.path.join(directory, f'model_{key[:16]}.pth')
+        meta = cache.get(key)
+        if meta is not None and os.path.exists(path):
+            trained[(f, k)] = meta
+        else:
+            jobs.append((key, dict(spec, path=path)))
+
+    print(f"Stage 1: {len(architectures)} architectures, {len(jobs)} to train")
+    if jobs:
+        with instrument.stage('train architectures', jobs=len(jobs)), \
+                ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            for (key, job), meta in zip(jobs, pool.map(train_architecture, [job for _, job in jobs])):
+                cache.put(key, meta)
+                trained[(job['num_filters'], job['kernel_size'])] = meta
+                print(f"  F={job['num_filters']} K={job['kernel_size']}: {meta['epochs']} epochs, "
+                      f"validation {meta['val_accuracy']:.2f}%")
+
+    # Stage 2: integer accuracy per (architecture, bit width), keyed by the model contents
+    accuracy = {}
+    jobs = []
+    for (f, k), meta in trained.items():
+        for num_bits, num_frac_bits in bits:
+            job = {'path': meta['path'], 'num_filters': f, 'kernel_size': k,
+                   'num_bits': num_bits, 'num_frac_bits': num_frac_bits}
+            key = sim_cache.hash_inputs(files=[meta['path']], namespace='dse-score',
+                                        data=[json.dumps(job, sort_keys=True)])
+            cached = cache.get(key)
+            if cached is not None:
+                accuracy[(f, k, num_bits, num_frac_bits)] = cached
+            else:
+                jobs.append((key, job))
+
+    print(f"Stage 2: {len(trained) * len(bits)} quantized models, {len(jobs)} to score")
+    if jobs:
+        with instrument.stage('score quantization', jobs=len(jobs)), \
+                ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            for (key, job), acc in zip(jobs, pool.map(score_quantization, [job for _, job in jobs])):
+                cache.put(key, acc)
+                accuracy[(job['num_filters'], job['kernel_size'], job['num_bits'], job['num_frac_bits'])] = acc
+
+    # Stage 3: analytic hardware estimates (cheap, run in-process)
+    points = []
+    for (f, k, num_bits, num_frac_bits), acc in sorted(accuracy.items()):
+        for lanes in parallelism:
+            config = point_config(f, k, num_bits, lanes)
+            points.append(dict(num_filters=f, kernel_size=k, num_bits=num_bits,
+                               num_frac_bits=num_frac_bits, dense_parallelism=lanes,
+                               conv_acc_width=config['conv_acc_width'], accuracy=acc,
+                               **hardware_metrics(config, device)))
+    print(f"Stage 3: {len(points)} design points estimated on {device}")
+
+    return points, pareto_front(points)
+
+
+def print_points(points, indices):
+    print(f"  {'F':>2} {'K':>2} {'Q':>5} {'P':>3} {'acc %':>7} {'img/s':>9} {'MHz':>5} "
+          f"{'LUT':>6} {'DSP':>4} {'BRAM18':>6} {'cost':>6}")
+    for i in indices:
+        p = points[i]
+        q = f"{p['num_bits'] - p['num_frac_bits']}.{p['num_frac_bits']}"
+        print(f"  {p['num_filters']:>2} {p['kernel_size']:>2} {q:>5} {p['dense_parallelism']:>3} "
+              f"{p['accuracy']:>7.2f} {p['images_per_sec']:>9,.0f} {p['clock_mhz']:>5.0f} "
+              f"{p['lut']:>6,} {p['dsp']:>4} {p['bram18']:>6} {100 * p['resource_cost']:>5.1f}%")
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    quick = '--quick' in sys.argv
+    max_epochs = int(args[0]) if len(args) > 0 else (1 if quick else 10)
+    workers = int(args[1]) if len(args) > 1 else None
+
+    print("\n" + "="*60)
+    print("Design-Space Exploration - Architecture x Quantization x P")
+    print("="*60)
+
+    if quick:
+        grid = dict(filters=[2, 4], kernels=[3], bits=[(4, 3), (8, 4)], parallelism=[1, 4],
+                    train_limit=10000)
+    else:
+        grid = dict(filters=FILTERS, kernels=KERNELS, bits=BITS, parallelism=PARALLELISM)
+
+    start = time.perf_counter()
+    points, front = run_dse(max_epochs=max_epochs, workers=workers, **grid)
+    elapsed = time.perf_counter() - start
+
+    fitting = sum(p['fits'] for p in points)
+    print(f"\n{len(points)} points ({fitting} fit), {len(front)} on the Pareto front "
+          f"({elapsed:.1f} s)\n")
+    print("Pareto front (accuracy / images per sec / resource cost):")
+    print_points(points, front)
+
+    results_path = os.path.join(DSE_DIR, 'results.json')
+    with open(results_path, 'w') as f:
+        json.dump({'points': points, 'pareto_front': front}, f, indent=2)
+    print(f"\nAll points written to {results_path}\n")
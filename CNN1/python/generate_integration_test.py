@@ -8,6 +8,10 @@ import numpy as np
 from torchvision import datasets, transforms
 from train_mnist_cnn import SimpleMNISTCNN
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
 
 
 def load_test_image(index=0):
@@ -118,6 +122,7 @@ def generate_verilog_testbench_data(image_index=0):
 
 
 if __name__ == '__main__':
+    instrument.setup()
     # Generate test data for several images
     for idx in [0, 1, 2, 3, 4]:
         generate_verilog_testbench_data(idx)
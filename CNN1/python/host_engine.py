@@ -0,0 +1,189 @@
+"""
+Host-Side Integer Inference Engine for SimpleMNISTCNN (serving fallback)
+- Same numerics as integer_reference.py: uint8 pixels, int8
+  weights, 20-bit conv accumulator, 32-bit dense accumulator, wrap-around
+- Loads only the exported artifacts (.vh / .mem + quantization_info.json);
+  imports NumPy only, no torch
+- im2col conv and dense as GEMMs; ReLU and 2x2 pooling as array ops
+- Batched API (scores / predict) plus a CPU benchmark of images/sec and
+  latency per batch size
+
+The GEMMs run on BLAS in floating point, which is exact here: conv products
+sum to < 2^19 (float32 mantissa: 24 bits) and dense sums to < 2^36
+(float64 mantissa: 53 bits). Wrap-around is applied on the integer result.
+
+Usage: python host_engine.py [hardware_dir] [--rtl-biases]
+"""
+
+import json
+import os
+import sys
+import time
+import numpy as np
+import integer_reference as ref
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+BATCH_SIZES = [1, 8, 32, 128, 512, 2048]
+
+
+def read_mem(filename, width, signed=True):
+    """Read a $readmemh ROM image written by quantize_weights.save_weights_to_mem"""
+    with open(filename) as f:
+        values = [int(line.split('//')[0], 16) for line in f if line.split('//')[0].strip()]
+    return ref.wrap_signed(values, width) if signed else np.asarray(values, dtype=np.int64)
+
+
+class HostEngine:
+    """Batched integer CNN (integer_reference numerics); weights are kept in GEMM-ready layouts"""
+
+    def __init__(self, conv_w, conv_b, fc_w, fc_b, img_size=ref.IMG_SIZE,
+                 conv_acc_width=ref.CONV_ACC_WIDTH, fc_acc_width=ref.FC_ACC_WIDTH):
+        conv_w = np.asarray(conv_w, dtype=np.int64)
+        self.num_filters = conv_w.shape[0]
+        self.kernel_size = int(round(np.sqrt(conv_w.shape[1])))
+        self.img_size = img_size
+        self.conv_size = img_size - self.kernel_size + 1
+        self.pool_size = self.conv_size // 2
+        self.conv_acc_width = conv_acc_width
+        self.fc_acc_width = fc_acc_width
+
+        self.conv_w = conv_w.astype(np.int8)
+        self.conv_b = np.asarray(conv_b, dtype=np.int32)
+        self.fc_w = np.asarray(fc_w, dtype=np.int8)
+        self.fc_b = np.asarray(fc_b, dtype=np.int64)
+
+        # GEMM operands: im2col taps x filters, and FC weights permuted to the
+        # (row, col, filter) order the pooled NHWC maps flatten to
+        self._conv_gemm = np.ascontiguousarray(conv_w.T, dtype=np.float32)
+        order = ref.stream_order(self.num_filters, self.pool_size)
+        self._fc_gemm = np.ascontiguousarray(self.fc_w[:, order].T, dtype=np.float64)
+
+    @classmethod
+    def from_artifacts(cls, hardware_dir='../hardware', quant_info='../data/quantization_info.json',
+                       rtl_biases=False):
+        """
+        Load the exported weights without torch
+
+        Args:
+            hardware_dir: conv_weights.vh, conv_bias.vh, fc_weights.vh, fc_bias.vh
+                          (+ fc_weight_index.mem / fc_codebook.mem in codebook mode)
+            quant_info: quantization_info.json (fixed-point format, codebook)
+            rtl_biases: keep the raw Q4.4 biases unscaled (the bias handling of cnn_top;
+                        its other deviations are not modelled, see
+                        integer_reference.rtl_forward), instead of folding them
+                        to accumulator scale
+        """
+        num_bits, num_frac_bits, codebook = 8, 4, None
+        if os.path.exists(quant_info):
+            with open(quant_info) as f:
+                info = json.load(f)
+            num_bits, num_frac_bits = info['num_bits'], info['num_frac_bits']
+            codebook = info['layers'].get('fc', {}).get('codebook')
+
+        params = ref.load_exported_params(hardware_dir, num_frac_bits, fold_biases=not rtl_biases)
+        if codebook:
+            # Shared FC weights: index ROM into the codebook ROM
+            index = read_mem(os.path.join(hardware_dir, 'fc_weight_index.mem'), codebook['index_bits'], signed=False)
+            values = read_mem(os.path.join(hardware_dir, 'fc_codebook.mem'), num_bits)
+            params['fc_w'] = values[index].reshape(params['fc_w'].shape)
+        return cls(params['conv_w'], params['conv_b'], params['fc_w'], params['fc_b'])
+
+    def features(self, images):
+        """conv (im2col GEMM) -> relu -> 2x2 max pool: int32 [N, pool*pool*F] in stream order"""
+        images = np.asarray(images, dtype=np.float32)
+        n, k, c = len(images), self.kernel_size, self.conv_size
+        cols = np.lib.stride_tricks.sliding_window_view(images, (k, k), axis=(1, 2))
+        cols = cols.reshape(n * c * c, k * k)
+
+        acc = (cols @ self._conv_gemm).astype(np.int32)
+        acc = acc.reshape(n, c, c, self.num_filters) + self.conv_b
+        # Two's complement wrap to conv_acc_width: shift the sign bit up and back
+        shift = 32 - self.conv_acc_width
+        acc = (acc << shift) >> shift
+        np.maximum(acc, 0, out=acc)
+
+        # 2x2 pooling as the max of four strided views (odd edges dropped)
+        e = 2 * self.pool_size
+        pooled = np.maximum(np.maximum(acc[:, 0:e:2, 0:e:2], acc[:, 0:e:2, 1:e:2]),
+                            np.maximum(acc[:, 1:e:2, 0:e:2], acc[:, 1:e:2, 1:e:2]))
+        return pooled.reshape(n, -1)
+
+    def scores(self, images):
+        """Class scores [N, 10], dense accumulator wrapped to fc_acc_width"""
+        acc = np.rint(self.features(images) @ self._fc_gemm).astype(np.int64) + self.fc_b
+        return ref.wrap_signed(acc, self.fc_acc_width)
+
+    def predict(self, images, batch_size=512):
+        """Predicted classes [N], processed in batches"""
+        return np.concatenate([self.scores(images[i:i + batch_size]).argmax(axis=1)
+                               for i in range(0, len(images), batch_size)])
+
+    def classify(self, image):
+        """Single 28x28 uint8 image -> (class, scores)"""
+        scores = self.scores(np.asarray(image)[None])[0]
+        return int(scores.argmax()), scores
+
+
+def benchmark(engine, images, batch_sizes=BATCH_SIZES, min_time=0.5):
+    """
+    Images/sec and per-batch latency for each batch size
+
+    Returns:
+        list of dicts: batch_size, images_per_sec, latency_ms (median), p99_ms
+    """
+    results = []
+    for batch_size in batch_sizes:
+        batch = images[:batch_size]
+        engine.scores(batch)  # warm-up
+        latencies = []
+        start = time.perf_counter()
+        while time.perf_counter() - start < min_time or len(latencies) < 5:
+            t0 = time.perf_counter()
+            engine.scores(batch)
+            latencies.append(time.perf_counter() - t0)
+        latencies = np.array(latencies)
+        results.append({
+            'batch_size': len(batch),
+            'images_per_sec': len(batch) / latencies.mean(),
+            'latency_ms': 1000 * float(np.median(latencies)),
+            'p99_ms': 1000 * float(np.percentile(latencies, 99)),
+        })
+    return results
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    hardware_dir = args[0] if args else '../hardware'
+    rtl_biases = '--rtl-biases' in sys.argv
+
+    print("\n" + "="*60)
+    print("Host Integer Inference Engine (NumPy, no torch)")
+    print("="*60)
+
+    engine = HostEngine.from_artifacts(hardware_dir, rtl_biases=rtl_biases)
+    images, labels = ref.load_mnist_uint8('../data/MNIST/raw')
+    print(f"Weights: {hardware_dir} ({'raw Q4.4 biases, unscaled' if rtl_biases else 'folded biases'})")
+
+    # Must reproduce the integer reference model score for score
+    params = {'conv_w': engine.conv_w, 'conv_b': engine.conv_b, 'fc_w': engine.fc_w, 'fc_b': engine.fc_b}
+    sample = images[:1000]
+    assert np.array_equal(engine.scores(sample), ref.forward(sample, params)), \
+        "host engine does not match integer_reference"
+    print("✓ Scores match integer_reference.py bit for bit")
+
+    predictions = engine.predict(images)
+    print(f"Accuracy: {100.0 * (predictions == labels).mean():.2f}% on {len(images)} images")
+
+    print(f"\n{'batch':>7} {'images/s':>12} {'latency ms':>11} {'p99 ms':>8}")
+    for row in benchmark(engine, images):
+        print(f"{row['batch_size']:>7} {row['images_per_sec']:>12,.0f} "
+              f"{row['latency_ms']:>11.3f} {row['p99_ms']:>8.3f}")
+
+    start = time.perf_counter()
+    ref.evaluate(images, labels, params)
+    reference_rate = len(images) / (time.perf_counter() - start)
+    print(f"\ninteger_reference.evaluate: {reference_rate:,.0f} images/sec (int64 einsum)\n")
@@ -0,0 +1,368 @@
+"""
+Asyncio MNIST Inference Server with Dynamic Micro-Batching
+- Accepts classification requests over a local TCP socket
+- Coalesces queued requests into micro-batches: a batch is dispatched when
+  it reaches max_batch or when its oldest request has waited max_wait_ms
+- One batch in flight at a time, like a single accelerator; backends:
+    host   - host_engine.HostEngine (integer_reference numerics, no torch)
+    torch  - the float SimpleMNISTCNN
+    fpga   - cnn_top stand-in: host engine scores, delayed by the batch time
+             from cycle_model.py (latency + II per extra image) plus a
+             per-batch transfer overhead
+- Exports p50/p99 latency, throughput and batch-size metrics ('S' request),
+  and includes an open-loop load generator to size max_batch / max_wait_ms
+
+Protocol (little endian):
+    'I' + uint32 request id + 784 uint8 pixels -> JSON line {id, class, scores}
+                                                  or {id, error} if the backend raised
+    'S'                                        -> JSON line of server metrics
+
+Usage: python inference_server.py [host|torch|fpga] [max_batch] [max_wait_ms] [--serve] [--port=N]
+"""
+
+import asyncio
+import collections
+import json
+import os
+import sys
+import time
+import numpy as np
+import cycle_model
+import integer_reference as ref
+from host_engine import HostEngine
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+IMAGE_BYTES = ref.IMG_SIZE * ref.IMG_SIZE
+DEFAULT_PORT = 5555
+
+
+class HostBackend:
+    """Batched integer inference on the CPU"""
+
+    name = 'host'
+
+    def __init__(self, hardware_dir='../hardware'):
+        self.engine = HostEngine.from_artifacts(hardware_dir)
+
+    def infer(self, images):
+        return self.engine.scores(images)
+
+
+class TorchBackend:
+    """Float PyTorch model (normalized input), for comparison with the integer path"""
+
+    name = 'torch'
+
+    def __init__(self, model_path='../data/mnist_cnn_model.pth'):
+        import torch
+        from train_mnist_cnn import SimpleMNISTCNN
+
+        self.torch = torch
+        self.model = SimpleMNISTCNN()
+        self.model.load_state_dict(torch.load(model_path, map_location='cpu'))
+        self.model.eval()
+
+    def infer(self, images):
+        x = self.torch.from_numpy((images / 255.0 - ref.MNIST_MEAN) / ref.MNIST_STD).float().unsqueeze(1)
+        with self.torch.no_grad():
+            return self.model(x).numpy()
+
+
+class SimulatedAccelerator:
+    """
+    cnn_top stand-in: results from the host engine, timing from cycle_model.py
+
+    A batch of n images occupies the accelerator for the cycle model's
+    back-to-back stream time (first-image latency + (n - 1) x II) at
+    clock_mhz, plus overhead_us for the host <-> board transfer.
+    """
+
+    name = 'fpga'
+
+    def __init__(self, hardware_dir='../hardware', clock_mhz=100.0, feature_buffers=1, overhead_us=50.0):
+        self.engine = HostEngine.from_artifacts(hardware_dir)
+        self.clock_mhz = clock_mhz
+        self.feature_buffers = feature_buffers
+        self.overhead_us = overhead_us
+        self._cycles = {}
+
+    def batch_cycles(self, n):
+        if n not in self._cycles:
+            stream = cycle_model.simulate_stream(n, self.feature_buffers, self.clock_mhz)
+            self._cycles[n] = stream['images'][-1]['done'] - stream['images'][0]['start']
+        return self._cycles[n]
+
+    def batch_seconds(self, n):
+        return self.batch_cycles(n) / (self.clock_mhz * 1e6) + self.overhead_us * 1e-6
+
+    def infer(self, images):
+        start = time.perf_counter()
+        scores = self.engine.scores(images)
+        remaining = self.batch_seconds(len(images)) - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        return scores
+
+
+BACKENDS = {'host': HostBackend, 'torch': TorchBackend, 'fpga': SimulatedAccelerator}
+
+
+class Metrics:
+    """Request latencies (sliding window), batch sizes and throughput"""
+
+    def __init__(self, window=10000):
+        self.latencies = collections.deque(maxlen=window)
+        self.batch_sizes = collections.Counter()
+        self.completed = 0
+        self.failed = 0
+        self.start = time.perf_counter()
+
+    def record_batch(self, latencies):
+        self.latencies.extend(latencies)
+        self.batch_sizes[len(latencies)] += 1
+        self.completed += len(latencies)
+
+    def snapshot(self):
+        latencies = np.array(self.latencies) * 1000
+        batches = sum(self.batch_sizes.values())
+        elapsed = time.perf_counter() - self.start
+        return {
+            'completed': self.completed,
+            'failed': self.failed,
+            'throughput': self.completed / elapsed if elapsed > 0 else 0.0,
+            'p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else None,
+            'batches': batches,
+            'mean_batch': self.completed / batches if batches else 0.0,
+            'batch_sizes': {str(k): v for k, v in sorted(self.batch_sizes.items())},
+        }
+
+
+class InferenceServer:
+    """Socket front end + micro-batcher around one backend"""
+
+    def __init__(self, backend, max_batch=32, max_wait_ms=2.0):
+        self.backend = backend
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.metrics = Metrics()
+        self.queue = None
+        self.server = None
+        self._batcher = None
+        self._clients = {}   # handler task -> its StreamWriter
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        self.queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        self.server = await asyncio.start_server(self._handle_client, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop accepting, let connected clients drain (1 s, then close them), then stop the batcher"""
+        self.server.close()
+        if self._clients:
+            _, lingering = await asyncio.wait(self._clients, timeout=1.0)
+            for client in lingering:
+                self._clients[client].close()
+            await asyncio.gather(*lingering, return_exceptions=True)
+        await self.server.wait_closed()
+        self._batcher.cancel()
+        await asyncio.gather(self._batcher, return_exceptions=True)
+
+    async def _handle_client(self, reader, writer):
+        client = asyncio.current_task()
+        self._clients[client] = writer
+        client.add_done_callback(lambda task: self._clients.pop(task, None))
+        write_lock = asyncio.Lock()
+        pending = set()
+        try:
+            while True:
+                op = await reader.readexactly(1)
+                if op == b'I':
+                    request_id = int.from_bytes(await reader.readexactly(4), 'little')
+                    pixels = await reader.readexactly(IMAGE_BYTES)
+                    image = np.frombuffer(pixels, dtype=np.uint8).reshape(ref.IMG_SIZE, ref.IMG_SIZE)
+                    task = asyncio.create_task(self._respond(request_id, image, writer, write_lock))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                elif op == b'S':
+                    async with write_lock:
+                        writer.write(json.dumps(self.metrics.snapshot()).encode() + b'\n')
+                        await writer.drain()
+                else:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            writer.close()
+
+    async def _respond(self, request_id, image, writer, write_lock):
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((image, future, time.perf_counter()))
+        try:
+            scores = await future
+        except Exception as exc:
+            line = json.dumps({'id': request_id, 'error': f"{type(exc).__name__}: {exc}"})
+        else:
+            line = json.dumps({'id': request_id, 'class': int(np.argmax(scores)),
+                               'scores': [float(s) for s in scores]})
+        async with write_lock:
+            writer.write(line.encode() + b'\n')
+            await writer.drain()
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = batch[0][2] + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            images = np.stack([image for image, _, _ in batch])
+            try:
+                scores = await loop.run_in_executor(None, self.backend.infer, images)
+            except Exception as exc:
+                for _, future, _ in batch:
+                    future.set_exception(exc)
+                self.metrics.failed += len(batch)
+                continue
+            done = time.perf_counter()
+            for (_, future, arrived), row in zip(batch, scores):
+                future.set_result(row)
+            self.metrics.record_batch([done - arrived for _, _, arrived in batch])
+
+
+async def load_test(port, images, rate, duration=2.0, connections=4, host='127.0.0.1', seed=0):
+    """
+    Open-loop Poisson load against a running server
+
+    Returns:
+        dict with client-side p50/p99 latency (ms), throughput, error replies and the server metrics
+    """
+    rng = np.random.default_rng(seed)
+    streams = [await asyncio.open_connection(host, port) for _ in range(connections)]
+    sent = {}
+    latencies = []
+    errors = []
+
+    async def read_responses(reader, expected):
+        for _ in range(expected):
+            reply = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent[reply['id']])
+            if 'error' in reply:
+                errors.append(reply['error'])
+
+    num_requests = max(1, int(rate * duration))
+    arrivals = np.cumsum(rng.exponential(1.0 / rate, num_requests))
+    per_connection = [len(range(c, num_requests, connections)) for c in range(connections)]
+    readers = [asyncio.create_task(read_responses(r, n)) for (r, _), n in zip(streams, per_connection)]
+
+    start = time.perf_counter()
+    for i, at in enumerate(arrivals):
+        delay = start + at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        writer = streams[i % connections][1]
+        sent[i] = time.perf_counter()
+        writer.write(b'I' + i.to_bytes(4, 'little') + images[i % len(images)].tobytes())
+    await asyncio.gather(*readers)
+    elapsed = time.perf_counter() - start
+
+    reader, writer = streams[0]
+    writer.write(b'S')
+    server_metrics = json.loads(await reader.readline())
+    for _, writer in streams:
+        writer.close()
+        await writer.wait_closed()
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests': num_requests,
+        'errors': len(errors),
+        'throughput': num_requests / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'server': server_metrics,
+    }
+
+
+async def sweep(backend, images, rates, settings, duration=2.0):
+    """Load test every (max_batch, max_wait_ms) setting at every offered rate"""
+    rows = []
+    for max_batch, max_wait_ms in settings:
+        for rate in rates:
+            server = InferenceServer(backend, max_batch, max_wait_ms)
+            port = await server.start(port=0)
+            result = await load_test(port, images, rate, duration)
+            await server.stop()
+            rows.append(dict(result, max_batch=max_batch, max_wait_ms=max_wait_ms, rate=rate))
+    return rows
+
+
+async def serve(backend, max_batch, max_wait_ms, port):
+    server = InferenceServer(backend, max_batch, max_wait_ms)
+    port = await server.start(port=port)
+    print(f"Listening on 127.0.0.1:{port} (Ctrl-C to stop)")
+    while True:
+        await asyncio.sleep(10)
+        m = server.metrics.snapshot()
+        if m['completed']:
+            print(f"  {m['completed']} requests, {m['throughput']:.0f} req/s, "
+                  f"p50 {m['p50_ms']:.2f} ms, p99 {m['p99_ms']:.2f} ms, mean batch {m['mean_batch']:.1f}")
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    options = dict(a[2:].split('=', 1) for a in sys.argv[1:] if a.startswith('--') and '=' in a)
+    backend_name = args[0] if len(args) > 0 else 'fpga'
+    max_batch = int(args[1]) if len(args) > 1 else None
+    max_wait_ms = float(args[2]) if len(args) > 2 else None
+
+    print("\n" + "="*60)
+    print(f"Micro-Batching Inference Server - backend: {backend_name}")
+    print("="*60)
+
+    backend = BACKENDS[backend_name]()
+
+    if '--serve' in sys.argv:
+        try:
+            asyncio.run(serve(backend, max_batch or 32, max_wait_ms or 2.0,
+                              int(options.get('port', DEFAULT_PORT))))
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    images, _ = ref.load_mnist_uint8('../data/MNIST/raw')
+    if isinstance(backend, SimulatedAccelerator):
+        single = backend.batch_seconds(1) * 1000
+        print(f"Stand-in timing: {single:.3f} ms for 1 image, "
+              f"{backend.batch_seconds(32) * 1000:.3f} ms for 32 @ {backend.clock_mhz:.0f} MHz")
+
+    if max_batch:
+        settings = [(max_batch, max_wait_ms if max_wait_ms is not None else 2.0)]
+    else:
+        settings = [(1, 0.0), (8, 1.0), (32, 2.0), (32, 5.0)]
+    rates = [1000, 4000]
+
+    print(f"\n{'batch':>6} {'wait ms':>8} {'offered':>8} {'req/s':>8} {'p50 ms':>8} "
+          f"{'p99 ms':>8} {'mean batch':>11}")
+    for row in asyncio.run(sweep(backend, images[:2000], rates, settings)):
+        print(f"{row['max_batch']:>6} {row['max_wait_ms']:>8.1f} {row['rate']:>8} "
+              f"{row['throughput']:>8.0f} {row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+              f"{row['server']['mean_batch']:>11.1f}")
+    print()
@@ -0,0 +1,450 @@
+"""
+Integer Reference Model of the CNN Numerics
+- Integer datapath of the intended design with NumPy arithmetic
+- Batched: processes the whole MNIST test set at once
+- No torch import, so it can check exported weights on any machine
+
+Datapath:
+  raw pixels (uint8, 0-255) -> 3x3 conv (Q4.4 weights, ACC_WIDTH=20)
+  -> relu -> 2x2 max pool (stride 2) -> dense (Q4.4 weights, ACC_WIDTH=32)
+
+cnn_top receives raw 0-255 pixels, while the float model was trained on
+normalized inputs. The normalization offset and the float biases are therefore
+folded into accumulator-scale biases (see fold_conv_bias / fold_fc_bias).
+
+This is the accuracy reference for the exported weights, not a model of the
+current RTL. cnn_top as written deviates from it; rtl_forward() models those
+deviations cycle for cycle (checked against Verilator, see rtl_regression.py):
+  - conv_unit declares its window port signed: pixels >= 128 count as p - 256
+  - conv_unit adds the raw Q4.4 bias, sign-extended, with no folding
+  - line_buffer: the last window column reads a stale row_buf_1/row_buf_2 tap
+  - max_pool starts with odd_row = 0: output row 0 pools conv row 0 with zeros,
+    output row k pools conv rows 2k-1 and 2k, conv row 25 is never used
+  - dense_layer never multiplies feature i with weight [c][i] (see rtl_dense)
+"""
+
+import gzip
+import os
+import re
+import sys
+import numpy as np
+import cycle_model
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+# MNIST normalization used by every training/inference script
+MNIST_MEAN = 0.1307
+MNIST_STD = 0.3081
+
+IMG_SIZE = 28
+PIXEL_WIDTH = 8
+KERNEL_SIZE = 3
+CONV_FILTERS = 4
+CONV_ACC_WIDTH = 20
+FC_ACC_WIDTH = 32
+
+
+@instrument.stage('load MNIST')
+def load_mnist_uint8(root='../data/MNIST/raw', train=False):
+    """
+    Load MNIST images as raw uint8 pixels straight from the idx files
+
+    Args:
+        root: directory containing the (optionally gzipped) idx files
+        train: load the training split instead of the test split
+
+    Returns:
+        images: uint8 array [N, 28, 28]
+        labels: uint8 array [N]
+    """
+    prefix = 'train' if train else 't10k'
+
+    def read_idx(name, offset):
+        path = os.path.join(root, name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return np.frombuffer(f.read(), dtype=np.uint8, offset=offset)
+        with gzip.open(path + '.gz', 'rb') as f:
+            return np.frombuffer(f.read(), dtype=np.uint8, offset=offset)
+
+    images = read_idx(f'{prefix}-images-idx3-ubyte', 16).reshape(-1, IMG_SIZE, IMG_SIZE)
+    labels = read_idx(f'{prefix}-labels-idx1-ubyte', 8)
+    return images, labels
+
+
+def read_verilog_params(filename):
+    """
+    Read a parameter array written by quantize_weights.save_weights_to_verilog
+
+    Returns:
+        int64 array of the values, sign-extended from the declared bit width
+    """
+    with open(filename) as f:
+        text = f.read()
+    matches = re.findall(r"(\d+)'h([0-9A-Fa-f]+)", text.split('=', 1)[1])
+    width = int(matches[0][0])
+    return wrap_signed([int(h, 16) for _, h in matches], width)
+
+
+def load_exported_params(hardware_dir='../hardware', num_frac_bits=4, fold_biases=True):
+    """
+    Integer reference parameters straight from the exported .vh files (no torch)
+
+    Args:
+        hardware_dir: directory with conv_weights.vh, conv_bias.vh, fc_weights.vh, fc_bias.vh
+        num_frac_bits: fractional bits of the exported values
+        fold_biases: dequantize the Q4.4 biases and fold them to accumulator scale;
+                     False keeps the raw Q4.4 biases exactly as the current RTL adds them
+    """
+    conv_w = read_verilog_params(os.path.join(hardware_dir, 'conv_weights.vh')).reshape(-1, KERNEL_SIZE ** 2)
+    conv_b = read_verilog_params(os.path.join(hardware_dir, 'conv_bias.vh'))
+    fc_b = read_verilog_params(os.path.join(hardware_dir, 'fc_bias.vh'))
+    fc_w = read_verilog_params(os.path.join(hardware_dir, 'fc_weights.vh')).reshape(len(fc_b), -1)
+    if fold_biases:
+        conv_b = fold_conv_bias(conv_b / 2 ** num_frac_bits, conv_w, num_frac_bits)
+        fc_b = fold_fc_bias(fc_b / 2 ** num_frac_bits, num_frac_bits)
+    return {'conv_w': conv_w, 'conv_b': conv_b, 'fc_w': fc_w, 'fc_b': fc_b}
+
+
+def wrap_signed(values, width):
+    """Two's complement wrap-around of an integer array to `width` bits"""
+    values = np.asarray(values, dtype=np.int64)
+    half = 1 << (width - 1)
+    return ((values + half) & ((1 << width) - 1)) - half
+
+
+def fold_conv_bias(conv_bias, conv_weights_q, num_frac_bits=4):
+    """
+    Conv bias at accumulator scale (raw pixel x Q4.4 weight)
+
+    Float conv on normalized input x = (p/255 - mean)/std equals
+    (sum(p*w) - 255*mean*sum(w)) / (255*std) + b, so both the bias and the
+    normalization offset are expressed in units of one raw pixel x weight LSB.
+
+    Args:
+        conv_bias: float biases [F]
+        conv_weights_q: quantized conv weights [F, 9]
+        num_frac_bits: fractional bits of the weights
+    """
+    pixel_scale = 255.0 * MNIST_STD
+    offset = 255.0 * MNIST_MEAN
+    scale = 2 ** num_frac_bits
+    conv_weights_q = np.asarray(conv_weights_q, dtype=np.int64).reshape(len(conv_bias), -1)
+    return np.round(scale * pixel_scale * np.asarray(conv_bias)
+                    - offset * conv_weights_q.sum(axis=1)).astype(np.int64)
+
+
+def fold_fc_bias(fc_bias, num_frac_bits=4):
+    """FC bias at accumulator scale (conv accumulator x Q4.4 weight)"""
+    scale = 2 ** num_frac_bits
+    return np.round(np.asarray(fc_bias) * scale * scale * 255.0 * MNIST_STD).astype(np.int64)
+
+
+def quantize_params(conv_weight, conv_bias, fc_weight, fc_bias, num_bits=8, num_frac_bits=4):
+    """
+    Build integer reference parameters from float arrays
+
+    Weights are rounded to the exported fixed-point format; biases are folded
+    to accumulator scale.
+
+    Returns:
+        dict with 'conv_w' [F, 9], 'conv_b' [F], 'fc_w' [10, F*169], 'fc_b' [10]
+    """
+    scale = 2 ** num_frac_bits
+    max_val = 2 ** (num_bits - 1) - 1
+    min_val = -(2 ** (num_bits - 1))
+
+    conv_w = np.clip(np.round(np.asarray(conv_weight) * scale), min_val, max_val).astype(np.int64)
+    conv_w = conv_w.reshape(conv_w.shape[0], -1)
+    fc_w = np.clip(np.round(np.asarray(fc_weight) * scale), min_val, max_val).astype(np.int64)
+
+    return {
+        'conv_w': conv_w,
+        'conv_b': fold_conv_bias(conv_bias, conv_w, num_frac_bits),
+        'fc_w': fc_w,
+        'fc_b': fold_fc_bias(fc_bias, num_frac_bits),
+    }
+
+
+def extract_windows(images, kernel_size=KERNEL_SIZE):
+    """All 3x3 windows in line_buffer order: [N, 26, 26, 9] (row-major taps)"""
+    images = np.asarray(images, dtype=np.int64)
+    windows = np.lib.stride_tricks.sliding_window_view(images, (kernel_size, kernel_size), axis=(1, 2))
+    out_size = images.shape[1] - kernel_size + 1
+    return windows.reshape(images.shape[0], out_size, out_size, kernel_size * kernel_size)
+
+
+def conv_relu(images, conv_w, conv_b, acc_width=CONV_ACC_WIDTH):
+    """conv_unit + relu for all filters: [N, F, 26, 26] (kernel size from conv_w [F, K*K])"""
+    kernel_size = int(round(np.sqrt(np.shape(conv_w)[1])))
+    windows = extract_windows(images, kernel_size)
+    acc = np.einsum('nyxk,fk->nfyx', windows, np.asarray(conv_w, dtype=np.int64))
+    acc = wrap_signed(acc + np.asarray(conv_b, dtype=np.int64)[None, :, None, None], acc_width)
+    return np.maximum(acc, 0)
+
+
+def conv_relu_shift_add(images, shift_codes, conv_b, acc_width=CONV_ACC_WIDTH):
+    """
+    Shift-add conv_unit + relu for power-of-two weights: [N, F, 26, 26]
+
+    Args:
+        shift_codes: int array [F, 9, terms, 3] of (enable, negative, shift);
+                     each weight is sum(+/-(1 << shift)) over enabled terms
+    """
+    windows = extract_windows(images)
+    shift_codes = np.asarray(shift_codes, dtype=np.int64)
+    num_filters = shift_codes.shape[0]
+    acc = np.zeros((windows.shape[0], num_filters) + windows.shape[1:3], dtype=np.int64)
+    for f in range(num_filters):
+        for k in range(windows.shape[-1]):
+            for enable, negative, shift in shift_codes[f, k]:
+                if enable:
+                    term = windows[..., k] << shift
+                    acc[:, f] += -term if negative else term
+    acc = wrap_signed(acc + np.asarray(conv_b, dtype=np.int64)[None, :, None, None], acc_width)
+    return np.maximum(acc, 0)
+
+
+def max_pool(feature_maps):
+    """2x2 stride-2 max pooling: [N, F, H, W] -> [N, F, H/2, W/2] (odd edges dropped)"""
+    n, f, h, w = feature_maps.shape
+    feature_maps = feature_maps[:, :, :h // 2 * 2, :w // 2 * 2]
+    return feature_maps.reshape(n, f, h // 2, 2, w // 2, 2).max(axis=(3, 5))
+
+
+def dense(features, fc_w, fc_b, acc_width=FC_ACC_WIDTH):
+    """dense_layer: [N, 676] x [10, 676]^T + bias -> [N, 10]"""
+    acc = np.asarray(features, dtype=np.int64) @ np.asarray(fc_w, dtype=np.int64).T
+    return wrap_signed(acc + np.asarray(fc_b, dtype=np.int64)[None, :], acc_width)
+
+
+def pooled_features(images, params, acc_width=CONV_ACC_WIDTH):
+    """Pooled feature vectors in PyTorch flatten order [channel][row][col]: [N, F*169]"""
+    pooled = max_pool(conv_relu(images, params['conv_w'], params['conv_b'], acc_width))
+    return pooled.reshape(pooled.shape[0], -1)
+
+
+def stream_order(num_filters=CONV_FILTERS, pool_size=13):
+    """
+    Feature permutation from PyTorch flatten order to max_pool output order
+
+    The 4 max_pool instances emit one value each per pool_valid pulse, in raster
+    order over the 13x13 grid, so stream index (row*13 + col)*F + f carries
+    PyTorch feature f*169 + row*13 + col.
+
+    Returns:
+        int array perm with stream_features = features[:, perm]
+    """
+    positions = pool_size * pool_size
+    return np.arange(num_filters * positions).reshape(num_filters, positions).T.flatten()
+
+
+def schedule_stream_order(num_filters=CONV_FILTERS):
+    """
+    stream_order() derived from the max_pool emission schedule of cycle_model.py
+
+    Every pool_valid cycle is traced back through the pipeline latencies to the
+    pixel that completed its window, giving the conv row/column of the emission
+    (rows 0, 2, ..., 24, odd columns) and hence its 13x13 output position.
+    """
+    sched = cycle_model.image_schedule(num_filters=num_filters)
+    lag = cycle_model.LINE_BUFFER_LATENCY + cycle_model.CONV_LATENCY + cycle_model.POOL_LATENCY
+    conv_size = IMG_SIZE - KERNEL_SIZE + 1
+    pool_size = conv_size // 2
+    order = []
+    for t in sched['pool']:
+        y, x = divmod(sched['pixels'].index(t - lag), IMG_SIZE)
+        row, col = (y - KERNEL_SIZE + 1) // 2, (x - KERNEL_SIZE + 1) // 2
+        order += [f * pool_size * pool_size + row * pool_size + col for f in range(num_filters)]
+    return np.array(order)
+
+
+def stream_features(images, params):
+    """Pooled features in the order they leave the pooling stage: [N, F*169]"""
+    pooled = max_pool(conv_relu(images, params['conv_w'], params['conv_b']))
+    return pooled.transpose(0, 2, 3, 1).reshape(pooled.shape[0], -1)
+
+
+def streaming_dense(features, fc_w_stream, fc_b, group_size=CONV_FILTERS, acc_width=FC_ACC_WIDTH):
+    """
+    dense_layer accumulating on the fly, one pool_valid group at a time
+
+    Args:
+        features: stream-order features [N, F*169]
+        fc_w_stream: stream-order FC weights [10, F*169]
+        group_size: features arriving per pool_valid pulse
+    """
+    features = np.asarray(features, dtype=np.int64)
+    fc_w_stream = np.asarray(fc_w_stream, dtype=np.int64)
+    acc = np.zeros((features.shape[0], fc_w_stream.shape[0]), dtype=np.int64)
+    for start in range(0, features.shape[1], group_size):
+        group = slice(start, start + group_size)
+        acc += features[:, group] @ fc_w_stream[:, group].T
+    return wrap_signed(acc + np.asarray(fc_b, dtype=np.int64)[None, :], acc_width)
+
+
+def forward(images, params, conv_acc_width=CONV_ACC_WIDTH):
+    """Full integer forward pass: uint8 images [N, 28, 28] -> class scores [N, 10]"""
+    return dense(pooled_features(images, params, conv_acc_width), params['fc_w'], params['fc_b'])
+
+
+@instrument.stage('integer evaluate')
+def evaluate(images, labels, params, batch_size=1000, conv_acc_width=CONV_ACC_WIDTH):
+    """
+    Batched integer-reference accuracy
+
+    Returns:
+        accuracy in percent
+        predicted classes [N]
+    """
+    predictions = np.empty(len(images), dtype=np.int64)
+    for start in range(0, len(images), batch_size):
+        scores = forward(images[start:start + batch_size], params, conv_acc_width)
+        predictions[start:start + batch_size] = scores.argmax(axis=1)
+    accuracy = 100.0 * (predictions == np.asarray(labels)).mean()
+    return accuracy, predictions
+
+
+# ----------------------------------------------------------------------------
+# cnn_top as written
+# ----------------------------------------------------------------------------
+
+def rtl_windows(images):
+    """
+    line_buffer windows as conv_unit sees them: [N, 26, 26, 9], signed 8-bit
+
+    At x = 27 the end-of-row shift copies row_buf_2[27] into row_buf_1 on the
+    same edge that writes it, so the last window column takes taps 2 and 5 from
+    one row earlier (taps of image row -1 read the reset value 0).
+    """
+    images = np.asarray(images, dtype=np.int64)
+    windows = extract_windows(images).copy()
+    last = images.shape[2] - 1
+    out_rows = windows.shape[1]
+    windows[:, :, -1, 2] = np.pad(images[:, :out_rows - 1, last], ((0, 0), (1, 0)))
+    windows[:, :, -1, 5] = images[:, :out_rows, last]
+    return wrap_signed(windows, PIXEL_WIDTH)
+
+
+def rtl_conv_relu(images, conv_w, conv_b, acc_width=CONV_ACC_WIDTH):
+    """
+    conv_unit + relu as instantiated in cnn_top: [N, F, 26, 26]
+
+    Args:
+        conv_w: exported conv weights [F, 9]
+        conv_b: raw exported Q4.4 biases [F] (load_exported_params(fold_biases=False))
+    """
+    acc = np.einsum('nyxk,fk->nfyx', rtl_windows(images), np.asarray(conv_w, dtype=np.int64))
+    acc = wrap_signed(acc + np.asarray(conv_b, dtype=np.int64)[None, :, None, None], acc_width)
+    return np.maximum(acc, 0)
+
+
+def rtl_max_pool(feature_maps):
+    """
+    max_pool.v output grid: [N, F, H, W] -> [N, F, H/2, W/2]
+
+    odd_row resets to 0, so the first conv row is paired with the zeroed
+    row_buffer and emits; row pairs are (-1, 0), (1, 2), ..., (H-3, H-2).
+    Emission order is raster order over the output grid.
+    """
+    n, f, h, w = feature_maps.shape
+    top = np.concatenate([np.zeros_like(feature_maps[:, :, :1]), feature_maps[:, :, 1:h - 2:2]], axis=2)
+    rows = np.maximum(top, feature_maps[:, :, 0:h - 1:2])
+    return rows[:, :, :, :w // 2 * 2].reshape(n, f, h // 2, w // 2, 2).max(axis=4)
+
+
+def rtl_features(images, params):
+    """feature_buffer contents when features_ready rises: [N, F*169] (PyTorch flatten order)"""
+    pooled = rtl_max_pool(rtl_conv_relu(images, params['conv_w'], params['conv_b']))
+    return pooled.reshape(pooled.shape[0], -1)
+
+
+def rtl_fc_hold_cycles(img_size=IMG_SIZE):
+    """
+    ACCUMULATE products that still see the first pool output in feature_buffer[0]
+
+    After the image, window_valid stays high and conv_unit repeats its last
+    window. max_pool buffers conv row 25 and keeps going, so a wrapped write
+    overwrites feature_buffer[0] img_size + 2 cycles after the last real one
+    (2 line_buffer gap cycles, 26 buffered values, 2 columns). ACCUMULATE starts
+    FC_START_LATENCY + DENSE_IDLE_CYCLES after features_ready, whose own cycle
+    is matched by the current_feature register.
+    """
+    return img_size + 2 - (cycle_model.FC_START_LATENCY + cycle_model.DENSE_IDLE_CYCLES)
+
+
+def rtl_dense(feature_maps, fc_w, fc_b, acc_width=FC_ACC_WIDTH):
+    """
+    dense_layer as cnn_top drives it: [N, 10]
+
+    - fc_feature_idx is never driven, so every product reads feature_buffer[0]
+    - weight_addr keeps only the last loop iteration (class OUTPUT_SIZE-1),
+      one cycle behind current_feature: product j uses fc_w[9][j], j < 675
+    - all accumulators add the same product, so every class gets one sum
+    - ADD_BIAS reads bias_addr one cycle late: class c gets fc_b[max(c-1, 0)]
+
+    Args:
+        feature_maps: rtl_conv_relu output [N, F, 26, 26] (for the wrapped pool write)
+        fc_w: exported FC weights [10, 676]
+        fc_b: raw exported Q4.4 biases [10]
+    """
+    fc_w = np.asarray(fc_w, dtype=np.int64)
+    num_classes, num_inputs = fc_w.shape
+    first = rtl_max_pool(feature_maps)[:, 0, 0, 0]
+    last_row = feature_maps[:, 0, -1]
+    wrapped = np.maximum(np.maximum(last_row[:, 0], last_row[:, 1]), last_row[:, -1])
+
+    products = np.arange(num_inputs - 1)
+    feature = np.where(products < rtl_fc_hold_cycles(), first[:, None], wrapped[:, None])
+    acc = wrap_signed(feature @ fc_w[num_classes - 1, :num_inputs - 1], acc_width)
+    bias = np.asarray(fc_b, dtype=np.int64)[np.maximum(np.arange(num_classes) - 1, 0)]
+    return wrap_signed(acc[:, None] + bias[None, :], acc_width)
+
+
+def rtl_forward(images, params):
+    """
+    cnn_top class_scores for uint8 images [N, 28, 28] -> [N, 10]
+
+    Args:
+        params: raw exported parameters, load_exported_params(fold_biases=False)
+    """
+    feature_maps = rtl_conv_relu(images, params['conv_w'], params['conv_b'])
+    return rtl_dense(feature_maps, params['fc_w'], params['fc_b'])
+
+
+if __name__ == '__main__':
+    import weight_store
+    instrument.setup()
+
+    print("\n" + "="*60)
+    print("Integer Reference Model - MNIST Test Set")
+    print("="*60)
+
+    state = weight_store.load_weights('../data/mnist_cnn_model.pth')
+
+    params = quantize_params(state['conv1.weight'], state['conv1.bias'],
+                             state['fc.weight'], state['fc.bias'])
+    images, labels = load_mnist_uint8('../data/MNIST/raw')
+    accuracy, _ = evaluate(images, labels, params)
+
+    # Exported stream-order FC weights must follow the max_pool emission schedule
+    # and give the same scores without a feature buffer
+    exported = load_exported_params()
+    fc_w_stream = read_verilog_params('../hardware/fc_weights_stream.vh').reshape(exported['fc_w'].shape)
+    assert np.array_equal(fc_w_stream, exported['fc_w'][:, schedule_stream_order()]), \
+        "fc_weights_stream.vh does not follow the max_pool emission order"
+    sample = images[:500]
+    assert np.array_equal(streaming_dense(stream_features(sample, exported), fc_w_stream, exported['fc_b']),
+                          forward(sample, exported)), "stream-order FC layout mismatch"
+
+    # cnn_top as written, from the exported .vh files
+    rtl_scores = rtl_forward(images, load_exported_params(fold_biases=False))
+    rtl_accuracy = 100.0 * (rtl_scores.argmax(axis=1) == labels).mean()
+
+    print(f"Images: {len(images)}")
+    print(f"Integer reference accuracy: {accuracy:.2f}%")
+    print(f"cnn_top (RTL as written):   {rtl_accuracy:.2f}% "
+          f"(predicts {len(np.unique(rtl_scores.argmax(axis=1)))} distinct class(es), see rtl_dense)")
+    print(f"✓ fc_weights_stream.vh follows the max_pool emission schedule "
+          f"and matches the buffered dense layer\n")
@@ -2,13 +2,20 @@
 Weight Quantization Script for FPGA Implementation
 Converts floating-point weights to fixed-point integers
 Exports to Verilog-compatible format (.vh files)
+
+The export reads the float weights from the NumPy weight store (weight_store.py)
+and imports torch only for fine-tuning.
 """
 
-import torch
 import numpy as np
 import json
 import os
-from train_mnist_cnn import SimpleMNISTCNN
+import sys
+from integer_reference import stream_order
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+import weight_store
 
 
 def analyze_weight_distribution(weights, name):
@@ -56,6 +63,187 @@ def quantize_to_fixed_point(weights, num_bits=8, num_frac_bits=4):
     return quantized, scale
 
 
+def codebook_quantize(weights, num_clusters=16, num_bits=8, num_frac_bits=4, max_iterations=50):
+    """
+    Weight-sharing (codebook) quantization using 1-D k-means
+    
+    Every weight is replaced by one of num_clusters shared values. The shared
+    values are rounded to the same fixed-point format as the regular weights,
+    so the datapath multiplies by CODEBOOK[INDEX[addr]] instead of WEIGHTS[addr].
+    
+    Args:
+        weights: numpy array of floating-point weights
+        num_clusters: codebook size (16 -> 4-bit indices)
+        num_bits: bit width of each codebook entry
+        num_frac_bits: fractional bits of each codebook entry
+        max_iterations: k-means iteration limit
+    
+    Returns:
+        indices (same shape as weights, uint8)
+        codebook of quantized integers (length num_clusters)
+        scale factor used
+    """
+    flat = weights.flatten().astype(np.float64)
+    
+    # Quantile initialization keeps clusters dense where the weights are dense
+    centroids = np.quantile(flat, (np.arange(num_clusters) + 0.5) / num_clusters)
+    
+    for _ in range(max_iterations):
+        assignment = np.abs(flat[:, None] - centroids[None, :]).argmin(axis=1)
+        new_centroids = centroids.copy()
+        for k in range(num_clusters):
+            members = flat[assignment == k]
+            if len(members) > 0:
+                new_centroids[k] = members.mean()
+        if np.allclose(new_centroids, centroids):
+            break
+        centroids = new_centroids
+    
+    # Snap centroids onto the fixed-point grid; merged entries free up slots
+    codebook_q, scale = quantize_to_fixed_point(centroids, num_bits, num_frac_bits)
+    codebook_q = np.unique(codebook_q.astype(np.int32))
+    
+    # Refill freed slots greedily with the grid values that cut the error most
+    candidates, _ = quantize_to_fixed_point(flat, num_bits, num_frac_bits)
+    candidates = np.setdiff1d(np.unique(candidates.astype(np.int32)), codebook_q)
+    while len(codebook_q) < num_clusters and len(candidates) > 0:
+        errors = [np.square(flat[:, None] - np.append(codebook_q, c)[None, :] / scale).min(axis=1).sum()
+                  for c in candidates]
+        best = int(np.argmin(errors))
+        codebook_q = np.sort(np.append(codebook_q, candidates[best]))
+        candidates = np.delete(candidates, best)
+    
+    # Re-assign each weight to the nearest representable codebook value
+    indices = np.abs(flat[:, None] - codebook_q[None, :] / scale).argmin(axis=1)
+    
+    codebook = np.zeros(num_clusters, dtype=np.int32)
+    codebook[:len(codebook_q)] = codebook_q
+    
+    return indices.astype(np.uint8).reshape(weights.shape), codebook, scale
+
+
+def power_of_two_levels(num_terms=1, num_bits=8):
+    """
+    All integers expressible as a sum of num_terms signed powers of two
+    
+    Args:
+        num_terms: 1 (single shift) or 2 (shift-add of two shifts)
+        num_bits: weight bit width (levels are clipped to its signed range)
+    
+    Returns:
+        sorted numpy array of representable integer levels (includes 0)
+    """
+    max_val = 2 ** (num_bits - 1) - 1
+    min_val = -(2 ** (num_bits - 1))
+    terms = [0] + [sign * (1 << k) for k in range(num_bits - 1) for sign in (1, -1)]
+    
+    levels = set(terms)
+    for _ in range(num_terms - 1):
+        levels = {a + b for a in levels for b in terms}
+    
+    return np.array(sorted(v for v in levels if min_val <= v <= max_val))
+
+
+def quantize_to_power_of_two(weights, num_terms=1, num_bits=8, num_frac_bits=4):
+    """
+    Quantize weights to the nearest sum of num_terms signed powers of two
+    
+    Returns:
+        quantized weights as integers (Q format set by num_frac_bits)
+        scale factor used
+    """
+    scale = 2 ** num_frac_bits
+    levels = power_of_two_levels(num_terms, num_bits)
+    nearest = np.abs(weights[..., None] * scale - levels).argmin(axis=-1)
+    return levels[nearest].astype(np.int32), scale
+
+
+def encode_shift_terms(weights_q, num_terms=1):
+    """
+    Decompose power-of-two weights into shift terms
+    
+    Returns:
+        int array [..., num_terms, 3] of (enable, negative, shift) per term
+    """
+    terms = [sign * (1 << k) for k in range(8) for sign in (1, -1)]
+    flat = np.asarray(weights_q).flatten()
+    codes = np.zeros((len(flat), num_terms, 3), dtype=np.int32)
+    
+    for i, value in enumerate(flat):
+        value = int(value)
+        if value == 0:
+            parts = []
+        elif value in terms:
+            parts = [value]
+        else:
+            parts = next(([a, value - a] for a in terms if value - a in terms), None)
+        assert parts is not None and len(parts) <= num_terms, \
+            f"{value} is not a sum of {num_terms} powers of two"
+        
+        for t, term in enumerate(parts):
+            codes[i, t] = (1, 1 if term < 0 else 0, abs(term).bit_length() - 1)
+    
+    return codes.reshape(np.shape(weights_q) + (num_terms, 3))
+
+
+def pack_shift_codes(codes):
+    """
+    Pack (enable, negative, shift[2:0]) terms into one integer per weight
+    
+    Term t occupies bits [5*t+4 : 5*t] as {enable, negative, shift[2:0]}.
+    """
+    codes = np.asarray(codes)
+    packed = np.zeros(codes.shape[:-2], dtype=np.int64)
+    for t in range(codes.shape[-2]):
+        term = (codes[..., t, 0] << 4) | (codes[..., t, 1] << 3) | codes[..., t, 2]
+        packed |= term.astype(np.int64) << (5 * t)
+    return packed
+
+
+def ternarize_weights(weights, threshold_factor=0.7):
+    """
+    Threshold-based ternarization with one scaling factor per output channel
+    
+    Same rule as TernaryProjection in train_mnist_cnn.py:
+    delta = threshold_factor * mean(|w|), alpha = mean(|w|) above delta.
+    
+    Returns:
+        codes in {-1, 0, +1} (int8, same shape as weights)
+        alpha per output channel (float)
+        delta per output channel (float)
+    """
+    flat = weights.reshape(weights.shape[0], -1)
+    delta = threshold_factor * np.abs(flat).mean(axis=1, keepdims=True)
+    mask = np.abs(flat) > delta
+    alpha = (np.abs(flat) * mask).sum(axis=1, keepdims=True) / np.maximum(mask.sum(axis=1, keepdims=True), 1)
+    codes = (np.sign(flat) * mask).astype(np.int8).reshape(weights.shape)
+    return codes, alpha.flatten(), delta.flatten()
+
+
+@instrument.stage('write .mem')
+def save_weights_to_mem(values, filename, name, width=8):
+    """
+    Save integer values as a Verilog $readmemh ROM image (.mem)
+    
+    Args:
+        values: numpy array of integers (signed values are two's complement)
+        filename: output .mem filename
+        name: ROM name for the header comment
+        width: bit width of each entry
+    """
+    flat_values = values.flatten()
+    instrument.count('values written', len(flat_values))
+    digits = (width + 3) // 4
+    mask = (1 << width) - 1
+    
+    with open(filename, 'w') as f:
+        f.write(f"// {name}: {len(flat_values)} x {width}-bit entries\n")
+        f.write(f"// Generated from quantize_weights.py ($readmemh format)\n")
+        for val in flat_values:
+            f.write(f"{int(val) & mask:0{digits}X}\n")
+
+
+@instrument.stage('write .vh')
 def save_weights_to_verilog(weights, filename, name, width=8):
     """
     Save quantized weights to Verilog header file (.vh)
@@ -73,6 +261,7 @@ def save_weights_to_verilog(weights, filename, name, width=8):
         
         # Flatten weights for easier access
         flat_weights = weights.flatten()
+        instrument.count('values written', len(flat_weights))
         
         f.write(f"// Total weights: {len(flat_weights)}\n")
         f.write(f"// Original shape: {weights.shape}\n\n")
@@ -81,15 +270,14 @@ def save_weights_to_verilog(weights, filename, name, width=8):
         f.write(f"parameter [{width-1}:0] {name} [0:{len(flat_weights)-1}] = '{{\n")
         
         # Write weights in groups of 8 per line for readability
+        digits = (width + 3) // 4
+        mask = (1 << width) - 1
         for i in range(0, len(flat_weights), 8):
             group = flat_weights[i:i+8]
             # Convert to hex (handle signed integers properly)
-            if width == 8:
-                hex_values = [f"{int(val) & 0xFF:02X}" for val in group]
-            else:  # 16-bit
-                hex_values = [f"{int(val) & 0xFFFF:04X}" for val in group]
+            hex_values = [f"{int(val) & mask:0{digits}X}" for val in group]
             
-            line = "    " + ", ".join([f"8'h{h}" if width == 8 else f"16'h{h}" for h in hex_values])
+            line = "    " + ", ".join([f"{width}'h{h}" for h in hex_values])
             if i + 8 < len(flat_weights):
                 line += ","
             f.write(line + "\n")
@@ -108,14 +296,19 @@ def save_weights_to_text(weights, filename, name):
             f.write(f"{w}\n")
 
 
-def quantize_and_export(model_path='../data/mnist_cnn_model.pth', num_bits=8, num_frac_bits=4):
+def quantize_and_export(model_path='../data/mnist_cnn_model.pth', num_bits=8, num_frac_bits=4,
+                        fc_codebook_size=None, conv_pow2_terms=None):
     """
     Main quantization pipeline
     
     Args:
-        model_path: path to trained PyTorch model
+        model_path: trained model (.pth, read through its .npz weight store, or .npz)
         num_bits: bit width for quantization (8 or 16)
         num_frac_bits: number of fractional bits for fixed-point
+        fc_codebook_size: if set, also export a weight-sharing codebook of this
+                          size for the FC layer (index ROM + codebook ROM)
+        conv_pow2_terms: if set (1 or 2), constrain conv weights to sums of this
+                         many signed powers of two and export shift codes
     """
     print("\n" + "="*60)
     print("Weight Quantization for FPGA Implementation")
@@ -123,9 +316,8 @@ def quantize_and_export(model_path='../data/mnist_cnn_model.pth', num_bits=8, nu
     
     # Load trained model
     print(f"\nLoading model from {model_path}...")
-    model = SimpleMNISTCNN()
-    model.load_state_dict(torch.load(model_path, map_location='cpu'))
-    model.eval()
+    with instrument.stage('load model'):
+        state = weight_store.load_weights(model_path)
     
     print(f"✓ Model loaded successfully")
     print(f"\nQuantization settings:")
@@ -149,13 +341,17 @@ def quantize_and_export(model_path='../data/mnist_cnn_model.pth', num_bits=8, nu
     print("1. Convolutional Layer Weights")
     print("-"*60)
     
-    conv_weights = model.conv1.weight.detach().cpu().numpy()  # Shape: [4, 1, 3, 3]
-    conv_bias = model.conv1.bias.detach().cpu().numpy()       # Shape: [4]
+    conv_weights = state['conv1.weight']  # Shape: [4, 1, 3, 3]
+    conv_bias = state['conv1.bias']       # Shape: [4]
     
     analyze_weight_distribution(conv_weights, "Conv Weights")
     analyze_weight_distribution(conv_bias, "Conv Bias")
     
-    conv_w_quant, conv_w_scale = quantize_to_fixed_point(conv_weights, num_bits, num_frac_bits)
+    if conv_pow2_terms:
+        conv_w_quant, conv_w_scale = quantize_to_power_of_two(conv_weights, conv_pow2_terms,
+                                                              num_bits, num_frac_bits)
+    else:
+        conv_w_quant, conv_w_scale = quantize_to_fixed_point(conv_weights, num_bits, num_frac_bits)
     conv_b_quant, conv_b_scale = quantize_to_fixed_point(conv_bias, num_bits, num_frac_bits)
     
     print(f"\n✓ Quantized conv weights: {conv_w_quant.shape}, dtype: {conv_w_quant.dtype}")
@@ -172,13 +368,29 @@ def quantize_and_export(model_path='../data/mnist_cnn_model.pth', num_bits=8, nu
         'scale': float(conv_w_scale)
     }
     
+    if conv_pow2_terms:
+        # Shift codes let conv_unit replace its 9 multipliers with shifters
+        shift_codes = encode_shift_terms(conv_w_quant, conv_pow2_terms)
+        save_weights_to_verilog(pack_shift_codes(shift_codes), '../hardware/conv_shifts.vh',
+                                'CONV_SHIFTS', 5 * conv_pow2_terms)
+        
+        print(f"\n✓ Power-of-two conv weights ({conv_pow2_terms} term(s)): "
+              f"{sorted(set(conv_w_quant.flatten().tolist()))}")
+        print(f"  Shift codes: {5 * conv_pow2_terms} bits/weight, "
+              f"term t = bits [5t+4:5t] = {{enable, negative, shift[2:0]}}")
+        
+        quantization_info['layers']['conv1']['power_of_two'] = {
+            'num_terms': int(conv_pow2_terms),
+            'code_bits': 5 * conv_pow2_terms
+        }
+    
     # 2. Quantize FC Layer weights
     print("\n" + "-"*60)
     print("2. Fully Connected Layer Weights")
     print("-"*60)
     
-    fc_weights = model.fc.weight.detach().cpu().numpy()  # Shape: [10, 676]
-    fc_bias = model.fc.bias.detach().cpu().numpy()       # Shape: [10]
+    fc_weights = state['fc.weight']  # Shape: [10, 676]
+    fc_bias = state['fc.bias']       # Shape: [10]
     
     analyze_weight_distribution(fc_weights, "FC Weights")
     analyze_weight_distribution(fc_bias, "FC Bias")
@@ -194,12 +406,47 @@ def quantize_and_export(model_path='../data/mnist_cnn_model.pth', num_bits=8, nu
     save_weights_to_verilog(fc_b_quant, '../hardware/fc_bias.vh', 'FC_BIAS', num_bits)
     save_weights_to_text(fc_w_quant, '../data/fc_weights.txt', 'FC Weights')
     
+    # Same weights in max_pool output order, for a dense layer without feature buffer
+    save_weights_to_verilog(fc_w_quant[:, stream_order()], '../hardware/fc_weights_stream.vh',
+                            'FC_WEIGHTS_STREAM', num_bits)
+    
     quantization_info['layers']['fc'] = {
         'weights_shape': list(fc_weights.shape),
         'bias_shape': list(fc_bias.shape),
-        'scale': float(fc_w_scale)
+        'scale': float(fc_w_scale),
+        'stream_order': 'feature (row*13 + col)*4 + filter'
     }
     
+    # 3. Optional codebook (weight-sharing) quantization of the FC layer
+    if fc_codebook_size:
+        print("\n" + "-"*60)
+        print(f"3. FC Codebook Quantization ({fc_codebook_size} shared values)")
+        print("-"*60)
+        
+        fc_indices, fc_codebook, cb_scale = codebook_quantize(fc_weights, fc_codebook_size,
+                                                              num_bits, num_frac_bits)
+        index_bits = max(1, int(np.ceil(np.log2(fc_codebook_size))))
+        fc_w_shared = fc_codebook[fc_indices]
+        
+        print(f"\n✓ Codebook: {fc_codebook.tolist()}")
+        print(f"  Index width: {index_bits} bits")
+        print(f"  Quantization error: {np.abs(fc_weights - fc_w_shared/cb_scale).mean():.6f}")
+        
+        dense_bits = fc_weights.size * num_bits
+        shared_bits = fc_weights.size * index_bits + fc_codebook_size * num_bits
+        print(f"  FC weight memory: {dense_bits} bits -> {shared_bits} bits "
+              f"({100.0 * shared_bits / dense_bits:.1f}%)")
+        
+        save_weights_to_mem(fc_indices, '../hardware/fc_weight_index.mem', 'FC_WEIGHT_INDEX', index_bits)
+        save_weights_to_mem(fc_codebook, '../hardware/fc_codebook.mem', 'FC_CODEBOOK', num_bits)
+        
+        quantization_info['layers']['fc']['codebook'] = {
+            'size': int(fc_codebook_size),
+            'index_bits': index_bits,
+            'values': fc_codebook.tolist(),
+            'memory_bits': shared_bits
+        }
+    
     # Save quantization info
     with open('../data/quantization_info.json', 'w') as f:
         json.dump(quantization_info, f, indent=4)
@@ -210,20 +457,254 @@ def quantize_and_export(model_path='../data/mnist_cnn_model.pth', num_bits=8, nu
     print(f"\nGenerated files:")
     print(f"  - ../hardware/conv_weights.vh")
     print(f"  - ../hardware/conv_bias.vh")
+    if conv_pow2_terms:
+        print(f"  - ../hardware/conv_shifts.vh")
     print(f"  - ../hardware/fc_weights.vh")
     print(f"  - ../hardware/fc_bias.vh")
+    print(f"  - ../hardware/fc_weights_stream.vh")
+    if fc_codebook_size:
+        print(f"  - ../hardware/fc_weight_index.mem")
+        print(f"  - ../hardware/fc_codebook.mem")
     print(f"  - ../data/quantization_info.json")
     print(f"\n✓ Ready for Verilog implementation!")
     
     return quantization_info
 
 
+def float_accuracy(images, labels, state, batch_size=1000):
+    """Accuracy in percent of the float model (NumPy forward pass of SimpleMNISTCNN)"""
+    import integer_reference as ref
+    
+    conv_w, conv_b = state['conv1.weight'][:, 0], state['conv1.bias']
+    correct = 0
+    for start in range(0, len(images), batch_size):
+        x = (images[start:start + batch_size] / 255.0 - ref.MNIST_MEAN) / ref.MNIST_STD
+        windows = np.lib.stride_tricks.sliding_window_view(x, conv_w.shape[1:], axis=(1, 2))
+        conv = np.maximum(np.einsum('nyxij,fij->nfyx', windows, conv_w) + conv_b[None, :, None, None], 0)
+        pooled = ref.max_pool(conv).reshape(len(x), -1)
+        logits = pooled @ state['fc.weight'].T + state['fc.bias']
+        correct += int((logits.argmax(axis=1) == labels[start:start + batch_size]).sum())
+    return 100.0 * correct / len(images)
+
+
+def report_codebook_accuracy(quantization_info, model_path='../data/mnist_cnn_model.pth'):
+    """Compare float, Q4.4 and codebook FC accuracy (Q4.4 runs on the integer reference)"""
+    import integer_reference as ref
+    
+    codebook = np.array(quantization_info['layers']['fc']['codebook']['values'])
+    fc_indices = np.array([int(line, 16) for line in open('../hardware/fc_weight_index.mem')
+                           if not line.startswith('//')])
+    
+    images, labels = ref.load_mnist_uint8('../data/MNIST/raw')
+    state = weight_store.load_weights(model_path)
+    acc_float = float_accuracy(images, labels, state)
+    
+    params = ref.quantize_params(state['conv1.weight'], state['conv1.bias'],
+                                 state['fc.weight'], state['fc.bias'])
+    acc_fixed, _ = ref.evaluate(images, labels, params)
+    params['fc_w'] = codebook[fc_indices].reshape(params['fc_w'].shape).astype(np.int64)
+    acc_shared, _ = ref.evaluate(images, labels, params)
+    
+    print("\n" + "-"*60)
+    print("Codebook Accuracy Impact")
+    print("-"*60)
+    print(f"  Float:              {acc_float:.2f}%")
+    print(f"  Q4.4:               {acc_fixed:.2f}%")
+    print(f"  Q4.4 + FC codebook: {acc_shared:.2f}% ({acc_shared - acc_fixed:+.2f} vs Q4.4)")
+    
+    return acc_float, acc_fixed, acc_shared
+
+
+def finetune_power_of_two(num_terms=1, epochs=2, model_path='../data/mnist_cnn_model.pth',
+                          output_path='../data/mnist_cnn_pow2.pth', num_bits=8, num_frac_bits=4):
+    """Quantization-aware fine-tuning with conv weights projected onto power-of-two levels"""
+    import torch
+    from train_mnist_cnn import SimpleMNISTCNN, finetune_with_conv_levels
+    
+    model = SimpleMNISTCNN()
+    model.load_state_dict(torch.load(model_path, map_location='cpu'))
+    
+    levels = power_of_two_levels(num_terms, num_bits)
+    model, accuracy = finetune_with_conv_levels(model, levels, 2 ** num_frac_bits, epochs=epochs)
+    
+    torch.save(model.state_dict(), output_path)
+    weight_store.convert(output_path)
+    print(f"\n✓ Fine-tuned model saved to {output_path} ({accuracy:.2f}%)")
+    return output_path
+
+
+def export_ternary(model_path='../data/mnist_cnn_ternary.pth', threshold_factor=0.7):
+    """
+    Export a ternary-weight model: 2-bit code ROMs plus scaling factors
+    
+    Codes are 2-bit two's complement (01 = +1, 11 = -1, 00 = 0). Scaling
+    factors and float biases go to ternary_info.json for ternary_engine.py.
+    """
+    state = weight_store.load_weights(model_path)
+    
+    ternary_info = {'threshold_factor': threshold_factor, 'layers': {}}
+    
+    for layer in ['conv1', 'fc']:
+        weights = state[f'{layer}.weight']
+        codes, alpha, delta = ternarize_weights(weights, threshold_factor)
+        save_weights_to_mem(codes, f'../hardware/{layer}_ternary.mem', f'{layer.upper()}_TERNARY', 2)
+        
+        print(f"\n{layer}: {codes.size} weights, {100.0 * (codes == 0).mean():.1f}% zero, "
+              f"alpha range [{alpha.min():.4f}, {alpha.max():.4f}]")
+        
+        ternary_info['layers'][layer] = {
+            'shape': list(weights.shape),
+            'codes': codes.flatten().tolist(),
+            'alpha': alpha.tolist(),
+            'delta': delta.tolist(),
+            'bias': state[f'{layer}.bias'].tolist()
+        }
+    
+    with open('../data/ternary_info.json', 'w') as f:
+        json.dump(ternary_info, f)
+    
+    print(f"\nGenerated files:")
+    print(f"  - ../hardware/conv1_ternary.mem")
+    print(f"  - ../hardware/fc_ternary.mem")
+    print(f"  - ../data/ternary_info.json")
+    
+    return ternary_info
+
+
+def export_winograd(quantization_info, tolerance=0.0, hardware_dir='../hardware', data_dir='../data'):
+    """
+    Export Winograd F(2x2,3x3) transformed conv weights (U = G g G^T)
+    
+    The extra fractional bits of U are chosen by winograd.choose_extra_frac_bits:
+    the fewest whose worst-case conv output error is within `tolerance` LSBs.
+    Layout: [filter][4][4] row-major, CONV_WEIGHTS_WINOGRAD in conv_weights_winograd.vh.
+    The format goes to winograd_info.json, which the default export leaves alone.
+    """
+    import integer_reference as ref
+    import winograd
+    
+    num_frac_bits = quantization_info['num_frac_bits']
+    conv_w = ref.load_exported_params(hardware_dir, num_frac_bits, fold_biases=False)['conv_w']
+    extra = winograd.choose_extra_frac_bits(conv_w, tolerance)
+    u = winograd.transform_weights(conv_w, extra)
+    width = winograd.signed_width(u)
+    
+    save_weights_to_verilog(u, f'{hardware_dir}/conv_weights_winograd.vh', 'CONV_WEIGHTS_WINOGRAD', width)
+    
+    print("\n" + "-"*60)
+    print("Winograd F(2x2, 3x3) Conv Weights")
+    print("-"*60)
+    print(f"  Format: Q{width - num_frac_bits - extra}.{num_frac_bits + extra} "
+          f"({width} bits, {extra} extra fractional bits)")
+    print(f"  Worst-case output error: {winograd.error_bound(conv_w, extra):g} LSB")
+    print(f"  Multiplies per 2x2 tile: 36 -> 16 per filter")
+    
+    winograd_info = {
+        'tile': [winograd.TILE, winograd.TILE],
+        'output_tile': [winograd.OUT_TILE, winograd.OUT_TILE],
+        'extra_frac_bits': extra,
+        'frac_bits': num_frac_bits + extra,
+        'width': width
+    }
+    with open(f'{data_dir}/winograd_info.json', 'w') as f:
+        json.dump(winograd_info, f, indent=4)
+    
+    print(f"  - {hardware_dir}/conv_weights_winograd.vh")
+    print(f"  - {data_dir}/winograd_info.json")
+    
+    return winograd_info
+
+
+def report_power_of_two_accuracy(num_terms, pow2_model_path='../data/mnist_cnn_pow2.pth',
+                                 model_path='../data/mnist_cnn_model.pth', num_bits=8, num_frac_bits=4):
+    """Confirm the power-of-two accuracy cost with the integer numerics reference"""
+    import integer_reference as ref
+    
+    images, labels = ref.load_mnist_uint8('../data/MNIST/raw')
+    results = {}
+    
+    for name, path in [('Q4.4 baseline', model_path), ('pow2 (no fine-tune)', model_path),
+                       ('pow2 (fine-tuned)', pow2_model_path)]:
+        state = weight_store.load_weights(path)
+        params = ref.quantize_params(state['conv1.weight'], state['conv1.bias'],
+                                     state['fc.weight'], state['fc.bias'], num_bits, num_frac_bits)
+        
+        if name.startswith('pow2'):
+            conv_w_pow2, _ = quantize_to_power_of_two(state['conv1.weight'], num_terms,
+                                                      num_bits, num_frac_bits)
+            params['conv_w'] = conv_w_pow2.reshape(params['conv_w'].shape).astype(np.int64)
+            params['conv_b'] = ref.fold_conv_bias(state['conv1.bias'], params['conv_w'], num_frac_bits)
+            
+            # The shift-add datapath must match the multiplier datapath bit for bit
+            codes = encode_shift_terms(params['conv_w'], num_terms)
+            sample = images[:100]
+            assert np.array_equal(ref.conv_relu_shift_add(sample, codes, params['conv_b']),
+                                  ref.conv_relu(sample, params['conv_w'], params['conv_b'])), \
+                "shift-add conv does not match multiplier conv"
+        
+        results[name], _ = ref.evaluate(images, labels, params)
+    
+    print("\n" + "-"*60)
+    print(f"Power-of-Two Conv Accuracy ({num_terms} term(s), integer reference)")
+    print("-"*60)
+    for name, acc in results.items():
+        print(f"  {name:<22} {acc:.2f}%")
+    print(f"  Multipliers replaced: 36 conv multipliers -> {36 * num_terms} shifters")
+    
+    return results
+
+
 if __name__ == '__main__':
+    instrument.setup()
+    
+    # Optional modes:
+    #   `python quantize_weights.py codebook [size]`   adds FC weight sharing
+    #   `python quantize_weights.py pow2 [terms] [epochs]` power-of-two conv weights
+    #   `python quantize_weights.py ternary [epochs]`      ternary conv + FC weights
+    #   `python quantize_weights.py winograd [tolerance]`  adds Winograd F(2x2,3x3) conv weights
+    mode = sys.argv[1] if len(sys.argv) > 1 else None
+    
+    if mode == 'ternary':
+        import torch
+        from train_mnist_cnn import SimpleMNISTCNN, finetune_ternary
+        
+        model = SimpleMNISTCNN()
+        model.load_state_dict(torch.load('../data/mnist_cnn_model.pth', map_location='cpu'))
+        model, accuracy = finetune_ternary(model, epochs=int(sys.argv[2]) if len(sys.argv) > 2 else 3)
+        torch.save(model.state_dict(), '../data/mnist_cnn_ternary.pth')
+        weight_store.convert('../data/mnist_cnn_ternary.pth')
+        print(f"\n✓ Ternary model saved to ../data/mnist_cnn_ternary.pth ({accuracy:.2f}%)")
+        
+        export_ternary('../data/mnist_cnn_ternary.pth')
+        print("\n→ Next step: python ternary_engine.py\n")
+        sys.exit(0)
+    
+    fc_codebook_size = None
+    conv_pow2_terms = None
+    model_path = '../data/mnist_cnn_model.pth'
+    
+    if mode == 'codebook':
+        fc_codebook_size = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    elif mode == 'pow2':
+        conv_pow2_terms = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+        epochs = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+        model_path = finetune_power_of_two(conv_pow2_terms, epochs)
+    
     # Run quantization with 8-bit fixed-point (4 integer bits, 4 fractional bits)
     quantization_info = quantize_and_export(
-        model_path='../data/mnist_cnn_model.pth',
+        model_path=model_path,
         num_bits=8,
-        num_frac_bits=4
+        num_frac_bits=4,
+        fc_codebook_size=fc_codebook_size,
+        conv_pow2_terms=conv_pow2_terms
     )
     
+    if fc_codebook_size:
+        report_codebook_accuracy(quantization_info)
+    if conv_pow2_terms:
+        report_power_of_two_accuracy(conv_pow2_terms, pow2_model_path=model_path)
+    if mode == 'winograd':
+        export_winograd(quantization_info, float(sys.argv[2]) if len(sys.argv) > 2 else 0.0)
+        print("\n→ Accuracy and multiplier report: python winograd.py")
+    
     print("\n→ Next step: Start implementing hardware modules in Verilog\n")
@@ -0,0 +1,341 @@
+"""
+Analytic FPGA Resource and Timing Estimator for cnn_top
+- Counts multipliers, adders, registers and memories module by module
+  (line_buffer, conv_unit x NUM_FILTERS, relu, max_pool, feature buffer,
+  FC weight ROM, dense_layer, argmax) for a given parameterization
+- Maps them to 7-series primitives: DSP48E1, RAMB18/RAMB36, LUT6 (incl.
+  LUTRAM) and flip-flops
+- Estimates the critical path of each register-to-register stage and the
+  resulting f_max
+- Checks a configuration against a device, so design-space sweeps can
+  prune points without running synthesis
+
+First-order model: constants are typical Artix-7 (-1) figures, good for
+comparing configurations, not a substitute for a synthesis report.
+
+Usage: python resource_model.py [device] [dense_parallelism]
+"""
+
+import json
+import math
+import os
+import sys
+import cycle_model
+import integer_reference as ref
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+DEVICES = {
+    'xc7a35t': {'lut': 20800, 'ff': 41600, 'dsp': 90, 'bram36': 50},
+    'xc7a100t': {'lut': 63400, 'ff': 126800, 'dsp': 240, 'bram36': 135},
+    'xc7z020': {'lut': 53200, 'ff': 106400, 'dsp': 220, 'bram36': 140},
+}
+
+DEFAULT_CONFIG = {
+    'img_size': ref.IMG_SIZE,
+    'kernel_size': ref.KERNEL_SIZE,
+    'num_filters': ref.CONV_FILTERS,
+    'num_classes': 10,
+    'pixel_width': 8,
+    'weight_width': 8,
+    'conv_acc_width': ref.CONV_ACC_WIDTH,
+    'fc_acc_width': ref.FC_ACC_WIDTH,
+    'dense_parallelism': 1,
+    'feature_buffers': 1,
+    'conv_mode': 'multiply',   # 'multiply', 'power_of_two' or 'ternary'
+    'pow2_terms': 1,
+    'fc_index_bits': None,     # codebook FC weights: ROM stores indices
+}
+
+# DSP48E1 multiplier port widths (signed)
+DSP_A_WIDTH = 25
+DSP_B_WIDTH = 18
+
+# Memories up to this size go to distributed LUTRAM (64 x 1 bit per LUT)
+LUTRAM_MAX_BITS = 2048
+RAMB18_SHAPES = [(16384, 1), (8192, 2), (4096, 4), (2048, 9), (1024, 18), (512, 36)]
+
+# Delays in ns (Artix-7, speed grade -1)
+T_CLK_Q = 0.45
+T_SETUP = 0.10
+T_ROUTE = 0.45
+T_LUT = 0.12
+T_CARRY4 = 0.11
+T_DSP_COMB = 3.90     # A/B -> P with no internal pipeline registers
+T_BRAM_CLK_Q = 2.10
+T_LUTRAM = 1.00
+
+
+def load_config(model_info='../data/model_info.json', quant_info='../data/quantization_info.json',
+                **overrides):
+    """
+    Configuration of the exported model (architecture + quantization)
+
+    Keyword arguments override any DEFAULT_CONFIG entry (e.g. dense_parallelism=4).
+    """
+    config = dict(DEFAULT_CONFIG)
+    if os.path.exists(model_info):
+        with open(model_info) as f:
+            arch = json.load(f)['architecture']
+        config['num_filters'] = arch['conv1']['out_channels']
+        config['kernel_size'] = arch['conv1']['kernel_size']
+        config['num_classes'] = arch['fc']['out_features']
+    if os.path.exists(quant_info):
+        with open(quant_info) as f:
+            info = json.load(f)
+        config['weight_width'] = info['num_bits']
+        conv = info['layers'].get('conv1', {})
+        fc = info['layers'].get('fc', {})
+        if 'power_of_two' in conv:
+            config['conv_mode'] = 'power_of_two'
+            config['pow2_terms'] = conv['power_of_two']['num_terms']
+        if 'codebook' in fc:
+            config['fc_index_bits'] = fc['codebook']['index_bits']
+    config.update(overrides)
+    return config
+
+
+def derived_sizes(config):
+    """Feature-map sizes implied by the configuration"""
+    conv_size = config['img_size'] - config['kernel_size'] + 1
+    pool_size = conv_size // 2
+    return {
+        'conv_size': conv_size,
+        'pool_size': pool_size,
+        'num_features': pool_size * pool_size * config['num_filters'],
+        'taps': config['kernel_size'] ** 2,
+    }
+
+
+def min_conv_acc_width(config):
+    """Bits needed so taps x (pixel * weight) + bias never wraps (worst case magnitude)"""
+    taps = config['kernel_size'] ** 2
+    max_pixel = 2 ** config['pixel_width'] - 1
+    max_weight = 2 ** (config['weight_width'] - 1)
+    worst = taps * max_pixel * max_weight + max_weight
+    return math.ceil(math.log2(worst + 1)) + 1
+
+
+def memory_cost(depth, width):
+    """(ramb18, lutram_luts) for a depth x width memory"""
+    if depth * width <= LUTRAM_MAX_BITS:
+        return 0, math.ceil(depth / 64) * width
+    ramb18 = min(math.ceil(depth / d) * math.ceil(width / w) for d, w in RAMB18_SHAPES)
+    return ramb18, 0
+
+
+def multiplier_cost(a_width, b_width, mode='multiply', terms=1):
+    """(dsp, lut) of one a x b signed product"""
+    if mode == 'ternary':
+        return 0, a_width + 1                      # conditional negate, merged into the adder
+    if mode == 'power_of_two':
+        shift_bits = max(1, math.ceil(math.log2(b_width)))
+        return 0, terms * (a_width + b_width) * shift_bits // 2 + (terms - 1) * (a_width + b_width)
+    a, b = max(a_width, b_width), min(a_width, b_width)
+    return math.ceil(a / DSP_A_WIDTH) * math.ceil(b / DSP_B_WIDTH), 0
+
+
+def counter_bits(n):
+    return max(1, math.ceil(math.log2(max(n, 2))))
+
+
+def estimate_resources(config):
+    """
+    Per-module resource estimate
+
+    Returns:
+        dict module -> {'lut', 'ff', 'dsp', 'bram18'} plus 'total'
+    """
+    c = config
+    s = derived_sizes(c)
+    F, P, C = c['num_filters'], c['dense_parallelism'], c['num_classes']
+    acc, fc_acc, ww = c['conv_acc_width'], c['fc_acc_width'], c['weight_width']
+    modules = {}
+
+    # line_buffer: K row buffers of img_size pixels, K x K window registers
+    ramb, luts = memory_cost(c['img_size'], c['pixel_width'])
+    modules['line_buffer'] = {
+        'lut': c['kernel_size'] * luts + 4 * counter_bits(c['img_size']) + 16,
+        'ff': s['taps'] * c['pixel_width'] + 2 * counter_bits(c['img_size']) + 1,
+        'dsp': 0,
+        'bram18': c['kernel_size'] * ramb,
+    }
+
+    # conv_unit x F: taps products, adder tree (taps - 1 adders) + bias add, output register
+    dsp, mult_luts = multiplier_cost(c['pixel_width'] + 1, ww, c['conv_mode'], c['pow2_terms'])
+    modules['conv'] = {
+        'lut': F * (s['taps'] * mult_luts + s['taps'] * acc),
+        'ff': F * (acc + 1),
+        'dsp': F * s['taps'] * dsp,
+        'bram18': 0,
+    }
+
+    modules['relu'] = {'lut': F * acc, 'ff': 0, 'dsp': 0, 'bram18': 0}
+
+    # max_pool x F: one row buffer of conv outputs, three window registers, three comparators
+    ramb, luts = memory_cost(s['conv_size'], acc)
+    modules['pool'] = {
+        'lut': F * (luts + 3 * acc + 2 * counter_bits(s['conv_size']) + 8),
+        'ff': F * (4 * acc + 2 * counter_bits(s['conv_size']) + 2),
+        'dsp': 0,
+        'bram18': F * ramb,
+    }
+
+    # Feature buffer: P banks (one read port per lane), x feature_buffers
+    depth = math.ceil(s['num_features'] / P)
+    ramb, luts = memory_cost(depth, acc)
+    modules['feature_buffer'] = {
+        'lut': c['feature_buffers'] * P * luts + 2 * counter_bits(s['num_features']),
+        'ff': counter_bits(s['num_features']) + 1,
+        'dsp': 0,
+        'bram18': c['feature_buffers'] * P * ramb,
+    }
+
+    # FC weight ROM: P banks, each word holds the C class weights of one feature (dense_banks.py)
+    word_bits = C * (c['fc_index_bits'] or ww)
+    ramb, luts = memory_cost(depth, word_bits)
+    codebook_luts = C * ww * 2 ** c['fc_index_bits'] // 64 if c['fc_index_bits'] else 0
+    modules['fc_weights'] = {'lut': P * luts + codebook_luts, 'ff': 0, 'dsp': 0, 'bram18': P * ramb}
+
+    # dense_layer: P x C MACs, per-class adder tree over lanes + accumulator, scores
+    dsp, mult_luts = multiplier_cost(acc, ww)
+    modules['dense'] = {
+        'lut': P * C * mult_luts + C * P * fc_acc + 3 * counter_bits(s['num_features']) + 24,
+        'ff': 2 * C * fc_acc + acc * P + counter_bits(s['num_features']) + counter_bits(C) + 4,
+        'dsp': P * C * dsp,
+        'bram18': 0,
+    }
+
+    # argmax over class scores: chained compare + select
+    modules['argmax'] = {'lut': (C - 1) * (2 * fc_acc + 4), 'ff': 0, 'dsp': 0, 'bram18': 0}
+
+    modules['total'] = {key: sum(m[key] for m in modules.values()) for key in ['lut', 'ff', 'dsp', 'bram18']}
+    return modules
+
+
+def adder_delay(width):
+    return T_LUT + T_ROUTE + math.ceil(width / 4) * T_CARRY4
+
+
+def multiplier_delay(mode):
+    if mode == 'ternary':
+        return T_LUT + T_ROUTE
+    if mode == 'power_of_two':
+        return 2 * (T_LUT + T_ROUTE)
+    return T_DSP_COMB + T_ROUTE
+
+
+def critical_paths(config):
+    """
+    Register-to-register delay (ns) of each stage
+
+    Returns:
+        dict stage -> ns, sorted slowest first
+    """
+    c = config
+    taps = c['kernel_size'] ** 2
+    P = c['dense_parallelism']
+    paths = {
+        'line_buffer': T_CLK_Q + T_LUTRAM + T_ROUTE + T_SETUP,
+        'conv': (T_CLK_Q + T_ROUTE + multiplier_delay(c['conv_mode']) +
+                 (math.ceil(math.log2(taps)) + 1) * adder_delay(c['conv_acc_width']) + T_SETUP),
+        'pool': T_CLK_Q + 2 * adder_delay(c['conv_acc_width']) + T_LUT + T_ROUTE + T_SETUP,
+        'dense': (T_BRAM_CLK_Q + T_ROUTE + multiplier_delay('multiply') +
+                  (math.ceil(math.log2(P)) + 1) * adder_delay(c['fc_acc_width']) + T_SETUP),
+        'argmax': (T_CLK_Q + (c['num_classes'] - 1) * (adder_delay(c['fc_acc_width']) + T_LUT + T_ROUTE)
+                   + T_SETUP),
+    }
+    return dict(sorted(paths.items(), key=lambda item: -item[1]))
+
+
+def utilization(total, device='xc7a35t'):
+    """Fraction of each device resource used"""
+    limits = DEVICES[device]
+    return {
+        'lut': total['lut'] / limits['lut'],
+        'ff': total['ff'] / limits['ff'],
+        'dsp': total['dsp'] / limits['dsp'],
+        'bram36': total['bram18'] / 2 / limits['bram36'],
+    }
+
+
+def estimate(config, device='xc7a35t', clock_mhz=100.0):
+    """
+    Resources, timing and feasibility of one configuration
+
+    Returns:
+        dict with 'modules', 'total', 'utilization', 'critical_paths',
+        'critical_path', 'f_max_mhz', 'fits', 'meets_timing', 'feasible',
+        'min_conv_acc_width'
+    """
+    modules = estimate_resources(config)
+    paths = critical_paths(config)
+    critical = max(paths.values())
+    usage = utilization(modules['total'], device)
+    fits = all(value <= 1.0 for value in usage.values())
+    meets_timing = 1000.0 / critical >= clock_mhz
+    return {
+        'modules': modules,
+        'total': modules['total'],
+        'utilization': usage,
+        'critical_paths': paths,
+        'critical_path': (next(iter(paths)), critical),
+        'f_max_mhz': 1000.0 / critical,
+        'fits': fits,
+        'meets_timing': meets_timing,
+        'feasible': fits and meets_timing,
+        'min_conv_acc_width': min_conv_acc_width(config),
+    }
+
+
+def print_report(config, result, device):
+    print(f"\n{'Module':<16} {'LUT':>7} {'FF':>7} {'DSP':>5} {'RAMB18':>7}")
+    print("-" * 46)
+    for name, m in result['modules'].items():
+        if name == 'total':
+            print("-" * 46)
+        print(f"{name:<16} {m['lut']:>7,} {m['ff']:>7,} {m['dsp']:>5} {m['bram18']:>7}")
+
+    limits = DEVICES[device]
+    usage = result['utilization']
+    print(f"\nUtilization on {device}:")
+    print(f"  LUT {usage['lut']*100:5.1f}% of {limits['lut']:,}   FF {usage['ff']*100:5.1f}% of {limits['ff']:,}")
+    print(f"  DSP {usage['dsp']*100:5.1f}% of {limits['dsp']}   BRAM36 {usage['bram36']*100:5.1f}% of {limits['bram36']}")
+
+    print("\nCritical paths (ns):")
+    for stage, ns in result['critical_paths'].items():
+        print(f"  {stage:<12} {ns:5.2f}  ({1000.0 / ns:6.1f} MHz)")
+    stage, ns = result['critical_path']
+    print(f"  -> f_max ≈ {result['f_max_mhz']:.0f} MHz, limited by {stage}")
+
+    if config['conv_acc_width'] < result['min_conv_acc_width']:
+        print(f"\n⚠ conv_acc_width={config['conv_acc_width']} < {result['min_conv_acc_width']} bits needed")
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    device = sys.argv[1] if len(sys.argv) > 1 else 'xc7a35t'
+    dense_parallelism = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    print("\n" + "="*60)
+    print("FPGA Resource and Timing Estimate - cnn_top")
+    print("="*60)
+
+    config = load_config(dense_parallelism=dense_parallelism)
+    print("Configuration: " + ", ".join(f"{k}={v}" for k, v in config.items() if v is not None))
+
+    result = estimate(config, device)
+    print_report(config, result, device)
+
+    print(f"\nDense parallelism sweep on {device} (clock = min(100 MHz, f_max)):")
+    print(f"  {'P':>4} {'LUT':>7} {'DSP':>5} {'RAMB18':>7} {'f_max':>7} {'img/s':>10}  feasible")
+    for lanes in [1, 2, 4, 8, 13, 26, 52]:
+        point = estimate(load_config(dense_parallelism=lanes), device)
+        clock = min(100.0, point['f_max_mhz'])
+        stream = cycle_model.simulate_stream(8, 1, clock, dense_parallelism=lanes)
+        print(f"  {lanes:>4} {point['total']['lut']:>7,} {point['total']['dsp']:>5} "
+              f"{point['total']['bram18']:>7} {point['f_max_mhz']:>6.0f}M {stream['images_per_sec']:>10,.0f}  "
+              f"{'✓' if point['fits'] else '✗'}")
+    print()
@@ -0,0 +1,316 @@
+"""
+Parallel RTL Regression Runner for cnn_top
+- Compiles hardware/tb_cnn_batch.v once, with Verilator (--binary --timing)
+  or iverilog; Verilator is used when both are installed
+- Packs MNIST test images into stimulus files (one image per line)
+- Fans shards out over a process pool, one simulator process per shard,
+  selecting each shard's stimulus with +STIM / +NUM_IMAGES / +FIRST_INDEX
+- Passes when the RTL accuracy is within `--tolerance` points (default 1.0)
+  of the integer numerics reference (integer_reference.evaluate) and no
+  image timed out
+- --as-written: instead checks predicted class, all 10 scores and the
+  676-entry feature buffer (+FEATURES) bit for bit against
+  integer_reference.rtl_forward() / rtl_features(), the model of cnn_top as
+  written (raw Q4.4 biases and the deviations listed in integer_reference.py)
+- Reports RTL accuracy, disagreements and simulated images/sec
+- Caches parsed shard results keyed by the simulator, RTL, the weight headers
+  cnn_top includes and the stimulus (sim_cache.py), so unchanged shards are
+  not re-simulated
+
+The RTL dense layer as written never pairs feature i with weight i, so RTL
+accuracy sits near chance (~10%) against ~97% for the numerics reference and
+the default run fails; --as-written confirms the RTL does exactly what
+rtl_forward() predicts.
+
+Simulator notes:
+- Verilator is 2-state: the undriven fc_feature_idx reads 0, which is what
+  rtl_forward() models. Under iverilog it is x, so class_scores print as x
+  and predicted_class stays 0; those images are reported as undefined, not
+  as score mismatches.
+- Verilator needs the element-wise signed conv_window in cnn_top.v; iverilog
+  and Verilator see the same conv_unit arithmetic.
+
+Usage: python rtl_regression.py [num_images] [workers] [--no-cache] [--verilator | --iverilog]
+                                [--as-written] [--tolerance=1.0]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import integer_reference as ref
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import sim_cache
+import instrument
+from verilator_server import find_simulator
+
+HARDWARE_DIR = '../hardware'
+BUILD_DIR = '../hardware/build'
+TESTBENCH = 'tb_cnn_batch'
+RTL_SOURCES = ['tb_cnn_batch.v', 'cnn_top.v', 'line_buffer.v', 'conv_unit.v',
+               'relu.v', 'max_pool.v', 'dense_layer.v']
+WEIGHT_INCLUDES = ['conv_weights.vh', 'conv_bias.vh', 'fc_weights.vh', 'fc_bias.vh']   # `included by cnn_top.v
+CACHE_DIR = '../hardware/build/sim_cache'
+NUM_CLASSES = 10
+TOLERANCE = 1.0   # accuracy points the RTL may fall below the numerics reference
+
+
+def write_stimulus(images, filename):
+    """Packed stimulus: one line per image, 784 pixels x 8 bits, pixel 0 in the LSBs"""
+    with open(filename, 'w') as f:
+        for image in np.asarray(images, dtype=np.uint8):
+            f.write(image.flatten()[::-1].tobytes().hex().upper() + "\n")
+
+
+@instrument.stage('compile testbench')
+def compile_testbench(simulator='iverilog', hardware_dir=HARDWARE_DIR, build_dir=BUILD_DIR):
+    """Compile the batch testbench once; returns the command that runs it"""
+    os.makedirs(build_dir, exist_ok=True)
+    sources = [os.path.join(hardware_dir, name) for name in RTL_SOURCES]
+
+    if simulator == 'verilator':
+        obj_dir = os.path.abspath(os.path.join(build_dir, f'{TESTBENCH}_verilator'))
+        command = ['verilator', '--binary', '--timing', '-j', '0', '-Wno-fatal', '-Wno-lint', '-Wno-style',
+                   f'-I{hardware_dir}', '--top-module', TESTBENCH, '-Mdir', obj_dir] + sources
+        run = [os.path.join(obj_dir, f'V{TESTBENCH}')]
+    else:
+        output = os.path.abspath(os.path.join(build_dir, TESTBENCH))
+        command = ['iverilog', '-g2012', '-I', hardware_dir, '-o', output] + sources
+        run = ['vvp', '-n', output]
+
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{simulator} failed:\n{result.stderr}")
+    return run
+
+
+def parse_value(token):
+    """Decimal value from $display, or None for x/z"""
+    try:
+        return int(token)
+    except ValueError:
+        return None
+
+
+def parse_results(output):
+    """
+    Parse RESULT/FEATURES/TIMEOUT lines from the testbench
+
+    Returns:
+        dict index -> (predicted_class, scores [10], cycles, features [676] or None)
+        or None on timeout; x/z scores are None
+    """
+    results, features = {}, {}
+    for line in output.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] == 'RESULT' and len(fields) == NUM_CLASSES + 4:
+            values = [parse_value(v) for v in fields[1:]]
+            results[values[0]] = (values[1], values[2:2 + NUM_CLASSES], values[-1])
+        elif fields[0] == 'FEATURES':
+            features[int(fields[1])] = [parse_value(v) for v in fields[2:]]
+        elif fields[0] == 'TIMEOUT':
+            results[int(fields[1])] = None
+    return {idx: entry + (features.get(idx),) if entry else None for idx, entry in results.items()}
+
+
+def run_shard(args):
+    """Simulate one shard of images in its own simulator process"""
+    command, images, first_index, timeout = args
+
+    with tempfile.TemporaryDirectory() as workdir:
+        stim_file = os.path.join(workdir, 'stimulus.mem')
+        write_stimulus(images, stim_file)
+
+        start = time.perf_counter()
+        result = subprocess.run(command + [f'+STIM={stim_file}', f'+NUM_IMAGES={len(images)}',
+                                           f'+FIRST_INDEX={first_index}', '+FEATURES'],
+                                capture_output=True, text=True, cwd=workdir, timeout=timeout)
+        elapsed = time.perf_counter() - start
+
+    return parse_results(result.stdout), elapsed
+
+
+def shard_key(base_key, images, first_index):
+    """Cache key of one shard: RTL/weights digest + stimulus + index offset"""
+    return sim_cache.hash_inputs(data=[base_key, np.asarray(images, dtype=np.uint8), str(first_index)],
+                                 namespace=TESTBENCH)
+
+
+def run_regression(images, workers=None, shard_size=None, timeout=3600, cache=None, simulator=None):
+    """
+    Simulate all images across a process pool
+
+    Args:
+        cache: optional sim_cache.SimulationCache; shards whose RTL, weight
+            files and stimulus are unchanged are served from it
+        simulator: 'iverilog' or 'verilator' (default: find_simulator())
+
+    Returns:
+        results: dict index -> (predicted_class, scores, cycles, features) or None
+        wall_time: seconds from first shard launch to last shard finish
+    """
+    simulator = find_simulator(simulator)
+    workers = workers or os.cpu_count() or 1
+    shard_size = shard_size or int(np.ceil(len(images) / workers))
+    shards = [(images[i:i + shard_size], i) for i in range(0, len(images), shard_size)]
+
+    results = {}
+    start = time.perf_counter()
+
+    keys = {}
+    if cache is not None:
+        base_key = sim_cache.hash_inputs(
+            [os.path.join(HARDWARE_DIR, name) for name in RTL_SOURCES + WEIGHT_INCLUDES],
+            namespace=f'{TESTBENCH}/{simulator}')
+        pending = []
+        for shard_images, first_index in shards:
+            keys[first_index] = shard_key(base_key, shard_images, first_index)
+            cached = cache.get(keys[first_index])
+            if cached is None:
+                pending.append((shard_images, first_index))
+            else:
+                results.update({idx: tuple(entry) if entry else None for idx, entry in cached})
+        shards = pending
+
+    if shards:
+        command = compile_testbench(simulator)
+        jobs = [(command, shard_images, first_index, timeout) for shard_images, first_index in shards]
+        with instrument.stage('simulate shards', shards=len(jobs)), ProcessPoolExecutor(max_workers=workers) as pool:
+            for (_, first_index), (shard_results, _) in zip(shards, pool.map(run_shard, jobs)):
+                results.update(shard_results)
+                if cache is not None:
+                    cache.put(keys[first_index], [[idx, entry] for idx, entry in sorted(shard_results.items())])
+    return results, time.perf_counter() - start
+
+
+def compare_with_golden(results, labels, reference_pred, golden_scores=None, golden_features=None):
+    """
+    Check every simulated image against the numerics reference and, optionally,
+    bit for bit against the as-written RTL model
+
+    Args:
+        reference_pred: classes predicted by integer_reference.forward() [N]
+        golden_scores, golden_features: rtl_forward() / rtl_features() output, or
+            None to skip the bit-exact comparison
+
+    Images with x scores are listed as undefined and not counted as score
+    mismatches.
+
+    Returns:
+        dict with accuracy figures and lists of disagreeing / mismatching /
+        undefined / missing indices
+    """
+    disagree, class_mismatch, score_mismatch, feature_mismatch, undefined, missing = [], [], [], [], [], []
+    rtl_correct = 0
+
+    for idx in range(len(labels)):
+        entry = results.get(idx)
+        if entry is None:
+            missing.append(idx)
+            continue
+        predicted, scores, _, features = entry
+        rtl_correct += int(predicted == labels[idx])
+        if predicted != reference_pred[idx]:
+            disagree.append(idx)
+        if None in scores:
+            undefined.append(idx)
+        if golden_scores is None:
+            continue
+        if predicted != golden_scores[idx].argmax():
+            class_mismatch.append(idx)
+        if None not in scores and not np.array_equal(scores, golden_scores[idx]):
+            score_mismatch.append(idx)
+        if features is None or not np.array_equal(features, golden_features[idx]):
+            feature_mismatch.append(idx)
+
+    return {
+        'num_images': len(labels),
+        'rtl_accuracy': 100.0 * rtl_correct / len(labels),
+        'reference_accuracy': float(100.0 * (np.asarray(reference_pred) == labels).mean()),
+        'golden_accuracy': None if golden_scores is None else
+            float(100.0 * (golden_scores.argmax(axis=1) == labels).mean()),
+        'reference_disagreements': disagree,
+        'class_mismatches': class_mismatch,
+        'score_mismatches': score_mismatch,
+        'feature_mismatches': feature_mismatch,
+        'undefined': undefined,
+        'missing': missing,
+    }
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    options = dict(a[2:].split('=', 1) for a in sys.argv[1:] if a.startswith('--') and '=' in a)
+    num_images = int(args[0]) if len(args) > 0 else 10000
+    workers = int(args[1]) if len(args) > 1 else None
+    cache = None if '--no-cache' in sys.argv else sim_cache.SimulationCache(CACHE_DIR)
+    simulator = find_simulator('verilator' if '--verilator' in sys.argv else
+                               'iverilog' if '--iverilog' in sys.argv else None)
+    as_written = '--as-written' in sys.argv
+    tolerance = float(options.get('tolerance', TOLERANCE))
+
+    print("\n" + "="*60)
+    print("cnn_top RTL Regression" + (" (as-written model)" if as_written else ""))
+    print("="*60)
+
+    images, labels = ref.load_mnist_uint8('../data/MNIST/raw')
+    images, labels = images[:num_images], labels[:num_images].astype(np.int64)
+
+    _, reference_pred = ref.evaluate(images, labels, ref.load_exported_params(HARDWARE_DIR))
+    golden_scores = golden_features = None
+    if as_written:
+        params = ref.load_exported_params(HARDWARE_DIR, fold_biases=False)
+        golden_scores = ref.rtl_forward(images, params)
+        golden_features = ref.rtl_features(images, params)
+
+    print(f"Images: {len(images)}, workers: {workers or os.cpu_count()}, simulator: {simulator}")
+    results, wall_time = run_regression(images, workers, cache=cache, simulator=simulator)
+    report = compare_with_golden(results, labels, reference_pred, golden_scores, golden_features)
+
+    cycles = [entry[2] for entry in results.values() if entry is not None]
+    print(f"\nSimulated {len(results)} images in {wall_time:.1f}s "
+          f"({len(results) / wall_time:,.1f} images/sec)")
+    if cycles:
+        print(f"Cycles per image (testbench): {np.mean(cycles):.0f}")
+    if cache is not None:
+        print(f"Result cache: {cache.hits} shard hits, {cache.misses} misses")
+
+    print(f"\nNumerics reference accuracy:  {report['reference_accuracy']:.2f}% (integer_reference)")
+    print(f"RTL accuracy:                 {report['rtl_accuracy']:.2f}%")
+    print(f"Class disagreements:          {len(report['reference_disagreements'])} (vs numerics reference)")
+    if as_written:
+        print(f"As-written model accuracy:    {report['golden_accuracy']:.2f}% (rtl_forward)")
+        print(f"Feature buffer mismatches:    {len(report['feature_mismatches'])}")
+        print(f"Class mismatches:             {len(report['class_mismatches'])}")
+        print(f"Score mismatches:             {len(report['score_mismatches'])}")
+    print(f"Undefined (x) scores:         {len(report['undefined'])}")
+    print(f"Timeouts / missing:           {len(report['missing'])}")
+    if report['undefined']:
+        print("  x scores come from the undriven fc_feature_idx under a 4-state simulator")
+
+    if as_written:
+        for idx in report['score_mismatches'][:5]:
+            predicted, scores, _, _ = results[idx]
+            print(f"\n  Image {idx} (label {labels[idx]}):")
+            print(f"    RTL:    class {predicted}, scores {scores}")
+            print(f"    Golden: class {golden_scores[idx].argmax()}, scores {golden_scores[idx].tolist()}")
+        passed = not (report['score_mismatches'] or report['feature_mismatches'] or report['missing'])
+        compared = report['num_images'] - len(report['undefined']) - len(report['missing'])
+        print(f"\n{'✓ RTL matches the as-written model' if passed else '✗ RTL differs from the as-written model'}"
+              f" ({compared} images with defined scores compared)\n")
+    else:
+        shortfall = report['reference_accuracy'] - report['rtl_accuracy']
+        passed = not report['missing'] and shortfall <= tolerance
+        print(f"\n{'✓' if passed else '✗'} RTL accuracy is {shortfall:.2f} points below the numerics "
+              f"reference (tolerance {tolerance:g})")
+        print(f"{'✓ RTL regression passed' if passed else '✗ RTL regression FAILED'}\n")
+    sys.exit(0 if passed else 1)
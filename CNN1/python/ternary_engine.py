@@ -0,0 +1,238 @@
+"""
+Bit-Packed Ternary Inference Engine (NumPy)
+- Multiplier-free inference for the ternary-weight SimpleMNISTCNN variant
+- Each weight is two bits: a +1 mask bit and a -1 mask bit
+- Activations are split into bit-planes, so every dot product becomes
+  AND + popcount (XNOR-net style) instead of multiply-accumulate
+- Runs the full MNIST test set and reports accuracy, throughput and memory
+
+Produce the model first with: python quantize_weights.py ternary
+"""
+
+import json
+import os
+import sys
+import time
+import numpy as np
+import integer_reference as ref
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+ACT_BITS = 8
+PIXEL_BITS = 8
+
+# Fallback popcount table for NumPy < 2.0 (no np.bitwise_count)
+_POPCOUNT_LUT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(words):
+    """Number of set bits in each element of an unsigned integer array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    as_bytes = words.view(np.uint8).reshape(words.shape + (words.dtype.itemsize,))
+    return _POPCOUNT_LUT[as_bytes].sum(axis=-1)
+
+
+def pack_bits(bits):
+    """Pack a boolean array along its last axis into uint64 words"""
+    packed = np.packbits(bits, axis=-1, bitorder='little')
+    pad = (-packed.shape[-1]) % 8
+    if pad:
+        packed = np.concatenate([packed, np.zeros(packed.shape[:-1] + (pad,), dtype=np.uint8)], axis=-1)
+    return np.ascontiguousarray(packed).view('<u8')
+
+
+def bit_planes(values, num_bits):
+    """Unsigned integers [..., L] -> boolean bit-planes [..., num_bits, L] (LSB first)"""
+    values = np.asarray(values, dtype=np.uint32)
+    shifts = np.arange(num_bits, dtype=np.uint32)[:, None]
+    return ((values[..., None, :] >> shifts) & 1).astype(bool)
+
+
+def packed_dot(planes, plus, minus):
+    """
+    Ternary dot products from packed bit-planes
+
+    Args:
+        planes: uint64 [N, B, W] packed activation bit-planes (B bits, W words)
+        plus: uint64 [O, W] packed +1 weight masks
+        minus: uint64 [O, W] packed -1 weight masks
+
+    Returns:
+        int64 [N, O] = sum_b 2^b * (popcount(plane_b & plus) - popcount(plane_b & minus))
+    """
+    acc = np.zeros((planes.shape[0], plus.shape[0]), dtype=np.int64)
+    for b in range(planes.shape[1]):
+        plane = planes[:, b, None, :]
+        pos = popcount(plane & plus[None]).sum(axis=-1, dtype=np.int64)
+        neg = popcount(plane & minus[None]).sum(axis=-1, dtype=np.int64)
+        acc += (pos - neg) << b
+    return acc
+
+
+def window_words(images, num_bits=PIXEL_BITS):
+    """
+    Pack every 3x3 window of every pixel bit-plane into one word
+
+    Returns:
+        uint16 [N, num_bits, 26, 26]; bit k of a word is tap k (row-major) of
+        the window, taken from bit-plane b of the pixels
+    """
+    images = np.asarray(images, dtype=np.uint16)
+    shifts = np.arange(num_bits, dtype=np.uint16)[None, :, None, None]
+    planes = (images[:, None] >> shifts) & 1
+    out = images.shape[1] - ref.KERNEL_SIZE + 1
+
+    words = np.zeros(planes.shape[:2] + (out, out), dtype=np.uint16)
+    for k in range(ref.KERNEL_SIZE * ref.KERNEL_SIZE):
+        ky, kx = divmod(k, ref.KERNEL_SIZE)
+        words |= planes[:, :, ky:ky + out, kx:kx + out] << np.uint16(k)
+    return words
+
+
+class TernaryEngine:
+    """Ternary SimpleMNISTCNN with bit-packed weights"""
+
+    def __init__(self, ternary_info, act_bits=ACT_BITS):
+        conv = ternary_info['layers']['conv1']
+        fc = ternary_info['layers']['fc']
+        self.act_bits = act_bits
+
+        self.conv_codes = np.array(conv['codes'], dtype=np.int64).reshape(conv['shape'][0], -1)
+        self.fc_codes = np.array(fc['codes'], dtype=np.int64).reshape(fc['shape'][0], -1)
+        taps = np.arange(self.conv_codes.shape[1])
+        self.conv_plus = ((self.conv_codes == 1) << taps).sum(axis=1).astype(np.uint16)
+        self.conv_minus = ((self.conv_codes == -1) << taps).sum(axis=1).astype(np.uint16)
+        self.fc_plus = pack_bits(self.fc_codes == 1)
+        self.fc_minus = pack_bits(self.fc_codes == -1)
+
+        # One conv accumulator LSB (raw pixel x ternary code) in normalized-input units
+        conv_alpha = np.array(conv['alpha'])
+        self.conv_unit = conv_alpha / (255.0 * ref.MNIST_STD)
+
+        # Fold normalization offset and bias into the integer conv accumulator
+        offset = conv_alpha * ref.MNIST_MEAN / ref.MNIST_STD * self.conv_codes.sum(axis=1)
+        self.conv_bias = np.round((np.array(conv['bias']) - offset) / self.conv_unit).astype(np.int64)
+
+        self.fc_alpha = np.array(fc['alpha'])
+        self.fc_bias = np.array(fc['bias'])
+        self.feature_step = None
+
+    def conv_accumulators(self, images):
+        """Pooled conv accumulators [N, F*169] via AND/popcount over pixel bit-planes"""
+        words = window_words(images)
+        n, bits, h, w = words.shape
+        acc = np.zeros((n, len(self.conv_bias), h, w), dtype=np.int64)
+        for f in range(len(self.conv_bias)):
+            pos = popcount(words & self.conv_plus[f]).astype(np.int64)
+            neg = popcount(words & self.conv_minus[f]).astype(np.int64)
+            acc[:, f] = ((pos - neg) << np.arange(bits)[None, :, None, None]).sum(axis=1)
+        acc += self.conv_bias[None, :, None, None]
+        pooled = ref.max_pool(np.maximum(acc, 0))
+        return pooled.reshape(n, -1)
+
+    def _feature_scale(self, num_features):
+        per_filter = num_features // len(self.conv_unit)
+        return np.repeat(self.conv_unit, per_filter)
+
+    def calibrate(self, images, percentile=99.99):
+        """Choose the activation quantization step from representative images"""
+        acc = self.conv_accumulators(images)
+        features = acc * self._feature_scale(acc.shape[1])
+        self.feature_step = np.percentile(features, percentile) / (2 ** self.act_bits - 1)
+        return self.feature_step
+
+    def quantize_features(self, acc):
+        """Requantize pooled accumulators to act_bits unsigned activations"""
+        features = acc * self._feature_scale(acc.shape[1]) / self.feature_step
+        return np.clip(np.round(features), 0, 2 ** self.act_bits - 1).astype(np.uint32)
+
+    def fc_accumulators(self, activations):
+        """FC dot products via AND/popcount over activation bit-planes: [N, 10]"""
+        planes = pack_bits(bit_planes(activations, self.act_bits))
+        return packed_dot(planes, self.fc_plus, self.fc_minus)
+
+    def scores(self, images):
+        """Class scores; only the final per-class rescale uses multiplies"""
+        activations = self.quantize_features(self.conv_accumulators(images))
+        return self.fc_alpha * self.feature_step * self.fc_accumulators(activations) + self.fc_bias
+
+    def predict(self, images, batch_size=500):
+        predictions = np.empty(len(images), dtype=np.int64)
+        for start in range(0, len(images), batch_size):
+            predictions[start:start + batch_size] = self.scores(images[start:start + batch_size]).argmax(axis=1)
+        return predictions
+
+    def dense_scores(self, images):
+        """Same computation with plain integer matmuls (verification / baseline)"""
+        windows = ref.extract_windows(images)
+        acc = np.einsum('nyxk,fk->nfyx', windows, self.conv_codes) + self.conv_bias[None, :, None, None]
+        pooled = ref.max_pool(np.maximum(acc, 0)).reshape(len(images), -1)
+        activations = self.quantize_features(pooled).astype(np.int64)
+        return self.fc_alpha * self.feature_step * (activations @ self.fc_codes.T) + self.fc_bias
+
+    def memory_report(self):
+        """Weight storage in bits: packed ternary vs 8-bit fixed point"""
+        num_weights = self.conv_codes.size + self.fc_codes.size
+        return {
+            'num_weights': int(num_weights),
+            'ternary_bits': int(2 * num_weights),
+            'int8_bits': int(8 * num_weights),
+            'nonzero_fraction': float((np.count_nonzero(self.conv_codes) + np.count_nonzero(self.fc_codes))
+                                      / num_weights)
+        }
+
+
+def load_engine(info_path='../data/ternary_info.json', act_bits=ACT_BITS):
+    """Build a TernaryEngine from the exported ternary_info.json"""
+    with open(info_path) as f:
+        return TernaryEngine(json.load(f), act_bits)
+
+
+if __name__ == '__main__':
+    instrument.setup()
+    print("\n" + "="*60)
+    print("Bit-Packed Ternary Inference Engine")
+    print("="*60)
+
+    engine = load_engine('../data/ternary_info.json')
+    images, labels = ref.load_mnist_uint8('../data/MNIST/raw')
+
+    # Calibrate the activation step on training images when they are available
+    try:
+        calib_images, _ = ref.load_mnist_uint8('../data/MNIST/raw', train=True)
+        calib_images = calib_images[:2000]
+        print("Calibrating activations on 2000 training images")
+    except (FileNotFoundError, ValueError):
+        calib_images = images[:1000]
+        print("⚠️  Training images not found - calibrating on the first 1000 test images")
+    engine.calibrate(calib_images)
+
+    # Packed popcount path must reproduce the integer matmul path exactly
+    sample = images[:200]
+    assert np.allclose(engine.scores(sample), engine.dense_scores(sample)), "packed engine mismatch"
+    print("✓ Packed AND/popcount results match dense integer matmul")
+
+    start = time.perf_counter()
+    predictions = engine.predict(images)
+    packed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, len(images), 500):
+        engine.dense_scores(images[i:i + 500])
+    dense_time = time.perf_counter() - start
+
+    accuracy = 100.0 * (predictions == labels).mean()
+    memory = engine.memory_report()
+
+    print(f"\nImages: {len(images)}")
+    print(f"Ternary accuracy: {accuracy:.2f}%")
+    print(f"\nThroughput:")
+    print(f"  Packed popcount engine: {len(images) / packed_time:,.0f} images/sec")
+    print(f"  Dense integer matmul:   {len(images) / dense_time:,.0f} images/sec")
+    print(f"\nWeight memory ({memory['num_weights']} weights, "
+          f"{100 * memory['nonzero_fraction']:.1f}% nonzero):")
+    print(f"  Ternary (2-bit): {memory['ternary_bits']:,} bits")
+    print(f"  Q4.4 (8-bit):    {memory['int8_bits']:,} bits "
+          f"({memory['int8_bits'] / memory['ternary_bits']:.1f}x larger)\n")
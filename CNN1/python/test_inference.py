@@ -11,8 +11,13 @@ import numpy as np
 from torchvision import datasets, transforms
 from train_mnist_cnn import SimpleMNISTCNN
 import os
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
 
+
+@instrument.stage('load model')
 def load_model(model_path='../data/mnist_cnn_model.pth'):
     """Load trained model"""
     model = SimpleMNISTCNN()
@@ -47,23 +52,9 @@ def inference_quantized(model, image, scale=16):
     model_q.load_state_dict(model.state_dict())
     
     with torch.no_grad():
-        # Quantize conv weights
-        conv_w = model_q.conv1.weight.data
-        conv_w_q = torch.round(conv_w * scale) / scale
-        model_q.conv1.weight.data = conv_w_q
-        
-        conv_b = model_q.conv1.bias.data
-        conv_b_q = torch.round(conv_b * scale) / scale
-        model_q.conv1.bias.data = conv_b_q
-        
-        # Quantize FC weights
-        fc_w = model_q.fc.weight.data
-        fc_w_q = torch.round(fc_w * scale) / scale
-        model_q.fc.weight.data = fc_w_q
-        
-        fc_b = model_q.fc.bias.data
-        fc_b_q = torch.round(fc_b * scale) / scale
-        model_q.fc.bias.data = fc_b_q
+        # Quantize conv and FC weights/biases to int8 (same clipping as the exported .vh files)
+        for param in [model_q.conv1.weight, model_q.conv1.bias, model_q.fc.weight, model_q.fc.bias]:
+            param.data = torch.clamp(torch.round(param.data * scale), -128, 127) / scale
         
         # Run inference
         image = image.unsqueeze(0)
@@ -75,6 +66,16 @@ def inference_quantized(model, image, scale=16):
     return prediction, confidence, output[0].numpy()
 
 
+@instrument.stage('load dataset')
+def load_test_dataset(root='../data'):
+    """Load the normalized MNIST test split"""
+    transform = transforms.Compose([
+        transforms.ToTensor(),
+        transforms.Normalize((0.1307,), (0.3081,))
+    ])
+    return datasets.MNIST(root=root, train=False, download=False, transform=transform)
+
+
 def save_image_hex(image, filename, label=None):
     """Save image in hex format for Verilog testbench"""
     # Denormalize image back to 0-255 range
@@ -222,6 +223,7 @@ def batch_export_test_images(model, dataset, num_images=10):
 
 
 if __name__ == '__main__':
+    instrument.setup()
     print("\n" + "="*60)
     print("MNIST CNN Test Inference & Testbench Data Generator")
     print("="*60)
@@ -231,11 +233,7 @@ if __name__ == '__main__':
     print("✓ Model loaded")
     
     # Load test dataset
-    transform = transforms.Compose([
-        transforms.ToTensor(),
-        transforms.Normalize((0.1307,), (0.3081,))
-    ])
-    test_dataset = datasets.MNIST(root='../data', train=False, download=False, transform=transform)
+    test_dataset = load_test_dataset('../data')
     print(f"✓ Test dataset loaded ({len(test_dataset)} images)")
     
     # Test a single image first
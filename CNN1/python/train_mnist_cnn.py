@@ -12,6 +12,11 @@ from torchvision import datasets, transforms
 import numpy as np
 import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+import weight_store
 
 class SimpleMNISTCNN(nn.Module):
     """
@@ -26,12 +31,17 @@ class SimpleMNISTCNN(nn.Module):
     After Conv (no padding): 26x26x4
     After MaxPool: 13x13x4 = 676 features
     FC: 676 -> 10
+    
+    num_filters / kernel_size default to the hardware design; other values
+    are used by the design-space exploration (dse.py).
     """
-    def __init__(self):
+    def __init__(self, num_filters=4, kernel_size=3, img_size=28):
         super(SimpleMNISTCNN, self).__init__()
+        pool_size = (img_size - kernel_size + 1) // 2
         
         # Convolutional layer: 1 input channel, 4 output channels, 3x3 kernel
-        self.conv1 = nn.Conv2d(in_channels=1, out_channels=4, kernel_size=3, stride=1, padding=0)
+        self.conv1 = nn.Conv2d(in_channels=1, out_channels=num_filters, kernel_size=kernel_size,
+                               stride=1, padding=0)
         
         # ReLU activation
         self.relu = nn.ReLU()
@@ -40,7 +50,7 @@ class SimpleMNISTCNN(nn.Module):
         self.pool = nn.MaxPool2d(kernel_size=2, stride=2)
         
         # Fully connected layer: (13*13*4) = 676 -> 10 classes
-        self.fc = nn.Linear(13 * 13 * 4, 10)
+        self.fc = nn.Linear(pool_size * pool_size * num_filters, 10)
         
     def forward(self, x):
         # Conv + ReLU: [batch, 1, 28, 28] -> [batch, 4, 26, 26]
@@ -59,13 +69,46 @@ class SimpleMNISTCNN(nn.Module):
         return x
 
 
-def train_model(epochs=10, batch_size=64, learning_rate=0.001):
-    """Train the CNN on MNIST dataset"""
+class LevelProjection(nn.Module):
+    """
+    Straight-through projection of a weight tensor onto a fixed set of levels
     
-    # Set device
-    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-    print(f"Using device: {device}")
+    Forward uses the nearest level (levels are integers at the given scale);
+    backward passes gradients through unchanged to the float shadow weights.
+    """
+    def __init__(self, levels, scale):
+        super(LevelProjection, self).__init__()
+        self.register_buffer('levels', torch.as_tensor(np.asarray(levels), dtype=torch.float32))
+        self.scale = scale
+    
+    def forward(self, weight):
+        nearest = (weight.unsqueeze(-1) * self.scale - self.levels).abs().argmin(dim=-1)
+        projected = self.levels[nearest] / self.scale
+        return weight + (projected - weight).detach()
+
+
+class TernaryProjection(nn.Module):
+    """
+    Threshold-based ternarization with a per-output-channel scaling factor
+    
+    w_t = alpha * sign(w) * (|w| > delta), delta = threshold_factor * mean(|w|),
+    alpha = mean(|w|) over the weights above delta. Gradients pass straight through.
+    """
+    def __init__(self, threshold_factor=0.7):
+        super(TernaryProjection, self).__init__()
+        self.threshold_factor = threshold_factor
     
+    def forward(self, weight):
+        flat = weight.reshape(weight.size(0), -1)
+        delta = self.threshold_factor * flat.abs().mean(dim=1, keepdim=True)
+        mask = (flat.abs() > delta).float()
+        alpha = (flat.abs() * mask).sum(dim=1, keepdim=True) / mask.sum(dim=1, keepdim=True).clamp(min=1)
+        projected = (alpha * torch.sign(flat) * mask).reshape(weight.shape)
+        return weight + (projected - weight).detach()
+
+
+def get_data_loaders(batch_size=64, root='../data'):
+    """MNIST train/test loaders with the standard normalization"""
     # Data preprocessing
     transform = transforms.Compose([
         transforms.ToTensor(),
@@ -73,12 +116,113 @@ def train_model(epochs=10, batch_size=64, learning_rate=0.001):
     ])
     
     # Load MNIST dataset
-    train_dataset = datasets.MNIST(root='../data', train=True, download=True, transform=transform)
-    test_dataset = datasets.MNIST(root='../data', train=False, download=True, transform=transform)
+    train_dataset = datasets.MNIST(root=root, train=True, download=True, transform=transform)
+    test_dataset = datasets.MNIST(root=root, train=False, download=True, transform=transform)
     
     train_loader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True)
     test_loader = DataLoader(test_dataset, batch_size=batch_size, shuffle=False)
     
+    return train_loader, test_loader
+
+
+def evaluate_model(model, test_loader, device='cpu'):
+    """Test-set accuracy in percent"""
+    model.eval()
+    correct = 0
+    total = 0
+    with torch.no_grad():
+        for data, target in test_loader:
+            data, target = data.to(device), target.to(device)
+            correct += model(data).argmax(dim=1).eq(target).sum().item()
+            total += target.size(0)
+    return 100. * correct / total
+
+
+def finetune_with_projections(model, projections, epochs=2, batch_size=64, learning_rate=1e-4,
+                              loaders=None):
+    """
+    Quantization-aware fine-tuning with projected weights
+    
+    Each listed layer's weight is replaced by its projection in every forward
+    pass (straight-through gradients) so the rest of the network adapts to the
+    hardware-friendly weights. The projection is baked in afterwards.
+    
+    Args:
+        model: trained SimpleMNISTCNN (modified in place)
+        projections: {layer name: projection module}, e.g. {'conv1': LevelProjection(...)}
+        loaders: optional (train_loader, test_loader), defaults to MNIST
+    
+    Returns:
+        model with projected weights baked in, test accuracy
+    """
+    from torch.nn.utils import parametrize
+    
+    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    train_loader, test_loader = loaders or get_data_loaders(batch_size)
+    
+    model = model.to(device)
+    for name, projection in projections.items():
+        parametrize.register_parametrization(getattr(model, name), 'weight', projection.to(device))
+    
+    criterion = nn.CrossEntropyLoss()
+    optimizer = optim.Adam(model.parameters(), lr=learning_rate)
+    
+    print(f"Projected accuracy before fine-tuning: {evaluate_model(model, test_loader, device):.2f}%")
+    
+    for epoch in range(epochs):
+        model.train()
+        for batch_idx, (data, target) in enumerate(train_loader):
+            data, target = data.to(device), target.to(device)
+            
+            optimizer.zero_grad()
+            loss = criterion(model(data), target)
+            loss.backward()
+            optimizer.step()
+            
+            if batch_idx % 200 == 0:
+                print(f'Fine-tune epoch: {epoch+1}/{epochs} | Batch: {batch_idx}/{len(train_loader)} | '
+                      f'Loss: {loss.item():.4f}')
+        
+        test_acc = evaluate_model(model, test_loader, device)
+        print(f'>>> Fine-tune epoch {epoch+1}: Test Accuracy: {test_acc:.2f}%')
+    
+    for name in projections:
+        parametrize.remove_parametrizations(getattr(model, name), 'weight', leave_parametrized=True)
+    model = model.cpu()
+    
+    return model, evaluate_model(model, test_loader)
+
+
+def finetune_with_conv_levels(model, levels, scale, epochs=2, batch_size=64, learning_rate=1e-4,
+                              loaders=None):
+    """
+    Fine-tune with conv weights restricted to `levels` (e.g. signed powers of two)
+    
+    Args:
+        levels: allowed integer weight values at the given scale
+        scale: fixed-point scale of the levels (16 for Q4.4)
+    """
+    return finetune_with_projections(model, {'conv1': LevelProjection(levels, scale)},
+                                     epochs, batch_size, learning_rate, loaders)
+
+
+def finetune_ternary(model, threshold_factor=0.7, epochs=3, batch_size=64, learning_rate=1e-4,
+                     loaders=None):
+    """Fine-tune with ternary {-alpha, 0, +alpha} conv and FC weights"""
+    projections = {'conv1': TernaryProjection(threshold_factor), 'fc': TernaryProjection(threshold_factor)}
+    return finetune_with_projections(model, projections, epochs, batch_size, learning_rate, loaders)
+
+
+def train_model(epochs=10, batch_size=64, learning_rate=0.001):
+    """Train the CNN on MNIST dataset"""
+    
+    # Set device
+    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    print(f"Using device: {device}")
+    
+    with instrument.stage('load dataset'):
+        train_loader, test_loader = get_data_loaders(batch_size)
+    
     # Initialize model
     model = SimpleMNISTCNN().to(device)
     criterion = nn.CrossEntropyLoss()
@@ -102,23 +246,25 @@ def train_model(epochs=10, batch_size=64, learning_rate=0.001):
         correct = 0
         total = 0
         
-        for batch_idx, (data, target) in enumerate(train_loader):
-            data, target = data.to(device), target.to(device)
+        with instrument.stage('train epoch', epoch=epoch + 1):
+            for batch_idx, (data, target) in enumerate(train_loader):
+                data, target = data.to(device), target.to(device)
             
-            optimizer.zero_grad()
-            output = model(data)
-            loss = criterion(output, target)
-            loss.backward()
-            optimizer.step()
+                optimizer.zero_grad()
+                output = model(data)
+                loss = criterion(output, target)
+                loss.backward()
+                optimizer.step()
             
-            train_loss += loss.item()
-            _, predicted = output.max(1)
-            total += target.size(0)
-            correct += predicted.eq(target).sum().item()
+                train_loss += loss.item()
+                _, predicted = output.max(1)
+                total += target.size(0)
+                correct += predicted.eq(target).sum().item()
+                instrument.count('train images', target.size(0))
             
-            if batch_idx % 100 == 0:
-                print(f'Epoch: {epoch+1}/{epochs} | Batch: {batch_idx}/{len(train_loader)} | '
-                      f'Loss: {loss.item():.4f} | Acc: {100.*correct/total:.2f}%')
+                if batch_idx % 100 == 0:
+                    print(f'Epoch: {epoch+1}/{epochs} | Batch: {batch_idx}/{len(train_loader)} | '
+                          f'Loss: {loss.item():.4f} | Acc: {100.*correct/total:.2f}%')
         
         # Evaluate on test set
         model.eval()
@@ -126,7 +272,7 @@ def train_model(epochs=10, batch_size=64, learning_rate=0.001):
         correct = 0
         total = 0
         
-        with torch.no_grad():
+        with instrument.stage('evaluate', epoch=epoch + 1), torch.no_grad():
             for data, target in test_loader:
                 data, target = data.to(device), target.to(device)
                 output = model(data)
@@ -163,6 +309,10 @@ def save_model_info(model, accuracy):
     torch.save(model.state_dict(), '../data/mnist_cnn_model.pth')
     print("\n✓ Model saved to ../data/mnist_cnn_model.pth")
     
+    # NumPy copy of the parameters: export and quantization load it without torch
+    weight_store.convert('../data/mnist_cnn_model.pth')
+    print("✓ Weight store saved to ../data/mnist_cnn_model.npz")
+    
     # Save model info
     info = {
         'architecture': {
@@ -198,6 +348,7 @@ def save_model_info(model, accuracy):
 
 
 if __name__ == '__main__':
+    instrument.setup()
     print("\n" + "="*60)
     print("MNIST CNN Training for FPGA Hardware Accelerator")
     print("="*60 + "\n")
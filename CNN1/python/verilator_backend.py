@@ -0,0 +1,138 @@
+"""
+Persistent Verilator Simulation Backend for cnn_top
+- Builds cnn_top once with Verilator (+define+RUNTIME_WEIGHTS), so all
+  weights are registers the harness writes at runtime
+- Keeps the simulator alive as a child process; images and new weights are
+  sent over a pipe without rebuilding (hardware/verilator/cnn_sim_server.cpp,
+  driven through common/verilator_server.py)
+- Checks results against the batch testbench (rtl_regression.py) and the
+  RTL golden model (integer_reference.rtl_forward), and benchmarks images/sec
+
+Usage: python verilator_backend.py [num_images]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+import numpy as np
+import integer_reference as ref
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+from verilator_server import VerilatorServer, find_simulator
+
+HARDWARE_DIR = '../hardware'
+BUILD_DIR = '../hardware/build/verilator/cnn_server'
+SERVER_NAME = 'cnn_sim_server'
+RTL_SOURCES = ['cnn_top.v', 'line_buffer.v', 'conv_unit.v', 'relu.v', 'max_pool.v', 'dense_layer.v']
+NUM_CLASSES = 10
+
+
+@instrument.stage('verilator build')
+def build_server(hardware_dir=HARDWARE_DIR, build_dir=BUILD_DIR, force=False):
+    """
+    Verilate and compile the simulation server (skipped when up to date)
+
+    Returns:
+        path of the server binary
+    """
+    if shutil.which('verilator') is None:
+        raise RuntimeError("verilator not found - install Verilator 5.x")
+
+    hardware_dir = os.path.abspath(hardware_dir)
+    build_dir = os.path.abspath(build_dir)
+    binary = os.path.join(build_dir, SERVER_NAME)
+    sources = [os.path.join(hardware_dir, name) for name in RTL_SOURCES]
+    harness = os.path.join(hardware_dir, 'verilator', f'{SERVER_NAME}.cpp')
+    inputs = sources + [harness, os.path.join(hardware_dir, 'cnn_weight_registers.vh')]
+
+    if not force and os.path.exists(binary) and \
+            os.path.getmtime(binary) >= max(os.path.getmtime(f) for f in inputs):
+        return binary
+
+    os.makedirs(build_dir, exist_ok=True)
+    result = subprocess.run(['verilator', '--cc', '--exe', '--build', '-O3', '-Wno-fatal',
+                             '+define+RUNTIME_WEIGHTS', '--top-module', 'cnn_top',
+                             f'-I{hardware_dir}', '-Mdir', build_dir, '-o', SERVER_NAME]
+                            + sources + [harness],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"verilator build failed:\n{result.stderr}")
+    return binary
+
+
+class CNNSimulator(VerilatorServer):
+    """cnn_top behind a pipe: load weights once, classify many images"""
+
+    def __init__(self, binary=None):
+        super().__init__(binary or build_server())
+
+    def load_weights(self, conv_w, conv_b, fc_w, fc_b):
+        """Write Q4.4 integer weights/biases (same values as the exported .vh files)"""
+        for cmd, values in [('CONV_W', conv_w), ('CONV_B', conv_b), ('FC_W', fc_w), ('FC_B', fc_b)]:
+            flat = np.asarray(values, dtype=np.int64).flatten()
+            self.command(cmd + ' ' + ' '.join(map(str, flat)))
+
+    def load_exported_weights(self, hardware_dir=HARDWARE_DIR):
+        """Load the weights currently exported in the .vh files"""
+        self.load_weights(*[ref.read_verilog_params(os.path.join(hardware_dir, name))
+                            for name in ['conv_weights.vh', 'conv_bias.vh', 'fc_weights.vh', 'fc_bias.vh']])
+
+    def classify(self, image):
+        """
+        Run one 28x28 uint8 image
+
+        Returns:
+            (predicted_class, scores [10], cycles), or None on timeout
+        """
+        fields = self.command('IMAGE ' + ' '.join(map(str, np.asarray(image, dtype=np.uint8).flatten())))
+        if fields[0] == 'TIMEOUT':
+            return None
+        values = [int(v) for v in fields[1:]]
+        return values[0], values[1:1 + NUM_CLASSES], values[-1]
+
+
+if __name__ == '__main__':
+    import rtl_regression
+    instrument.setup()
+
+    num_images = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("\n" + "="*60)
+    print("Verilator server vs batch testbench - cnn_top")
+    print("="*60)
+
+    images, _ = ref.load_mnist_uint8('../data/MNIST/raw')
+    images = images[:num_images]
+
+    start = time.perf_counter()
+    binary = build_server()
+    build_time = time.perf_counter() - start
+
+    with CNNSimulator(binary) as sim:
+        start = time.perf_counter()
+        sim.load_exported_weights()
+        server_results = {i: sim.classify(image) for i, image in enumerate(images)}
+        server_time = time.perf_counter() - start
+
+    simulator = find_simulator()
+    start = time.perf_counter()
+    batch_results, _ = rtl_regression.run_regression(images, workers=1, simulator=simulator)
+    batch_time = time.perf_counter() - start
+
+    # Class and scores must agree (cycle counts depend on each harness' handshake)
+    golden = ref.rtl_forward(images, ref.load_exported_params(HARDWARE_DIR, fold_biases=False))
+    agree = sum((server_results[i] or ())[:2] == (batch_results.get(i) or ())[:2]
+                for i in range(num_images))
+    golden_agree = sum(server_results[i] is not None and server_results[i][0] == golden[i].argmax()
+                       and server_results[i][1] == golden[i].tolist() for i in range(num_images))
+
+    print(f"\nImages: {num_images}")
+    print(f"Verilator build (one time): {build_time:.1f}s")
+    print(f"Verilator server: {num_images / server_time:,.1f} images/sec")
+    print(f"Batch testbench:  {num_images / batch_time:,.1f} images/sec ({simulator}, including compile)")
+    print(f"Speedup:          {batch_time / server_time:.1f}x")
+    print(f"Identical to batch testbench: {agree}/{num_images}")
+    print(f"Identical to golden model:    {golden_agree}/{num_images}\n")
@@ -0,0 +1,158 @@
+"""
+Canonical Binary Weight Store (.npz)
+- The float parameters of a trained model as plain NumPy arrays, keyed by
+  their state_dict names ('conv1.weight', 'conv1.bias', 'fc.weight', 'fc.bias')
+- Written once after training, next to the checkpoint (mnist_cnn_model.pth ->
+  mnist_cnn_model.npz); export and quantization then read it with NumPy only,
+  so they never pay for importing torch
+- The store records the SHA-256 of its source .pth: if the checkpoint was
+  retrained or fine-tuned since, the store is stale and is rebuilt from the
+  .pth (the only path that imports torch)
+- Uncompressed .npz: np.load maps the zip lazily and reads each array on access
+
+Usage: python weight_store.py [model.pth ...]   (default: ../data/mnist_cnn_model.pth)
+       python weight_store.py --startup        cold-start time, torch.load vs store
+"""
+
+import hashlib
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+SOURCE_KEY = '__source_sha256__'
+
+
+def store_path(model_path):
+    """Store file of a checkpoint: same name, .npz"""
+    return os.path.splitext(model_path)[0] + '.npz'
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def save(state, path, source=None):
+    """
+    Write parameters to an .npz store (atomically)
+
+    Args:
+        state: dict name -> array (NumPy arrays or torch tensors)
+        path: output .npz file
+        source: checkpoint the parameters came from; its digest is stored
+    """
+    arrays = {name: np.asarray(value.detach().cpu().numpy() if hasattr(value, 'detach') else value)
+              for name, value in state.items()}
+    if source is not None:
+        arrays[SOURCE_KEY] = np.array(file_digest(source))
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
+def load(path):
+    """Parameters of an .npz store: dict name -> float32 array"""
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files if name != SOURCE_KEY}
+
+
+def source_digest(path):
+    """SHA-256 of the checkpoint a store was built from (None if not recorded)"""
+    with np.load(path) as data:
+        return str(data[SOURCE_KEY]) if SOURCE_KEY in data.files else None
+
+
+def is_current(model_path):
+    """True if the checkpoint's store exists and was built from this exact checkpoint"""
+    path = store_path(model_path)
+    if not os.path.exists(path):
+        return False
+    return not os.path.exists(model_path) or source_digest(path) == file_digest(model_path)
+
+
+def from_checkpoint(model_path):
+    """Read a .pth state_dict with torch (deferred import): dict name -> array"""
+    import torch
+    state = torch.load(model_path, map_location='cpu')
+    return {name: tensor.detach().cpu().numpy() for name, tensor in state.items()}
+
+
+def convert(model_path):
+    """Build (or rebuild) the store of a checkpoint; returns its path"""
+    path = store_path(model_path)
+    save(from_checkpoint(model_path), path, source=model_path)
+    return path
+
+
+def load_weights(model_path):
+    """
+    Float parameters of a model, torch-free whenever possible
+
+    Args:
+        model_path: an .npz store, or a .pth checkpoint - its store is used when
+            current, otherwise the checkpoint is read with torch and the store
+            is (re)written for next time
+    """
+    if model_path.endswith('.npz'):
+        return load(model_path)
+    if is_current(model_path):
+        return load(store_path(model_path))
+    state = from_checkpoint(model_path)
+    save(state, store_path(model_path), source=model_path)
+    return state
+
+
+def startup_time(code, repeats=3):
+    """Median wall time (s) of a fresh interpreter running `code` (cold start)"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def startup_report(model_path='../data/mnist_cnn_model.pth', repeats=3):
+    """Cold-start seconds: interpreter, torch.load of the .pth, store load, quantize_weights import"""
+    model_path = os.path.abspath(model_path)
+    if not is_current(model_path):
+        convert(model_path)
+    return {
+        'python': startup_time('pass', repeats),
+        'torch_load': startup_time(f'import torch; torch.load({model_path!r}, map_location="cpu")', repeats),
+        'store_load': startup_time(f'import weight_store; weight_store.load({store_path(model_path)!r})', repeats),
+        'import_quantize_weights': startup_time('import quantize_weights', repeats),
+    }
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    print("\n" + "="*60)
+    print("Weight Store (.npz)")
+    print("="*60)
+
+    if '--startup' in sys.argv:
+        print("\nCold start (fresh interpreter, median of 3):")
+        for name, seconds in startup_report().items():
+            print(f"  {name:<26} {seconds:>7.2f} s")
+        print()
+        sys.exit(0)
+
+    for model_path in sys.argv[1:] or ['../data/mnist_cnn_model.pth']:
+        path = convert(model_path)
+        state = load(path)
+        count = sum(v.size for v in state.values())
+        print(f"✓ {model_path} -> {path}: {len(state)} arrays, {count:,} parameters, "
+              f"{os.path.getsize(path):,} bytes")
+    print()
@@ -0,0 +1,239 @@
+"""
+Winograd F(2x2, 3x3) Convolution - Weight Transform and Integer Reference
+- Each 4x4 input tile yields a 2x2 output tile with 16 multiplies per
+  filter instead of 36 (direct 3x3: 9 per output pixel)
+- Transformed weights U = G g G^T are exported as fixed-point integers;
+  G has halves, so U of Q4.4 weights is exact with 2 extra fractional bits
+- The number of extra fractional bits is chosen by error analysis: the
+  worst-case output error bound of rounding U, given the input transform's
+  range, must not exceed a tolerance (default 0 = identical outputs to the
+  direct conv of integer_reference.conv_relu)
+- Integer engine: input transform (adds only), elementwise products,
+  output transform (adds only), then >> extra bits, bias, ReLU
+- The input range covers both the unsigned pixels of integer_reference and
+  the signed 8-bit window conv_unit sees in cnn_top; only the former is
+  compared against, there is no Winograd RTL
+
+    Y = A^T [(G g G^T) * (B^T d B)] A
+
+Export the weights with: python quantize_weights.py winograd
+"""
+
+import os
+import sys
+import numpy as np
+import integer_reference as ref
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+TILE = 4      # input tile (m + r - 1)
+OUT_TILE = 2  # output tile m
+
+# Unsigned pixels (integer_reference) and the signed 8-bit conv_unit window (cnn_top)
+PIXEL_RANGE = (-(1 << (ref.PIXEL_WIDTH - 1)), (1 << ref.PIXEL_WIDTH) - 1)
+
+B_T = np.array([[1, 0, -1, 0],
+                [0, 1, 1, 0],
+                [0, -1, 1, 0],
+                [0, 1, 0, -1]], dtype=np.int64)
+
+# G scaled by 2 so it is integer: U = G2 g G2^T / 4
+G2 = np.array([[2, 0, 0],
+               [1, 1, 1],
+               [1, -1, 1],
+               [0, 0, 2]], dtype=np.int64)
+
+A_T = np.array([[1, 1, 1, 0],
+                [0, 1, -1, -1]], dtype=np.int64)
+
+MAX_EXTRA_FRAC_BITS = 2   # G2 g G2^T / 4 is exact at 2 extra bits
+
+
+def transform_weights(conv_w, extra_frac_bits=MAX_EXTRA_FRAC_BITS):
+    """
+    Winograd-domain weights: round(G g G^T * 2^extra) as integers
+
+    Args:
+        conv_w: integer conv weights [F, 9] (Q4.4)
+        extra_frac_bits: fractional bits added to the weight format (0..2)
+
+    Returns:
+        int64 [F, 4, 4] at scale 2^(num_frac_bits + extra_frac_bits)
+    """
+    g = np.asarray(conv_w, dtype=np.int64).reshape(-1, 3, 3)
+    u4 = np.einsum('ik,fkl,jl->fij', G2, g, G2)  # 4 * U, exact
+    shift = MAX_EXTRA_FRAC_BITS - extra_frac_bits
+    # Round half away from zero, as the hardware export would
+    return np.sign(u4) * ((np.abs(u4) + (1 << shift >> 1)) >> shift)
+
+
+def rounding_error(conv_w, extra_frac_bits):
+    """U_q - U * 2^extra for every transformed weight: float [F, 4, 4]"""
+    g = np.asarray(conv_w, dtype=np.int64).reshape(-1, 3, 3)
+    exact = np.einsum('ik,fkl,jl->fij', G2, g, G2) * 2.0 ** (extra_frac_bits - MAX_EXTRA_FRAC_BITS)
+    return transform_weights(conv_w, extra_frac_bits) - exact
+
+
+def max_input_transform(pixel_range=PIXEL_RANGE):
+    """Largest |B^T d B| element for pixels in [pixel_min, pixel_max]"""
+    pixel_min, pixel_max = pixel_range
+    coeff = np.einsum('ik,jl->ijkl', B_T, B_T).reshape(TILE, TILE, -1)
+    # Worst case: every pixel sits at whichever end pushes the sum furthest
+    high = np.maximum(coeff * pixel_min, coeff * pixel_max).sum(axis=-1)
+    low = np.minimum(coeff * pixel_min, coeff * pixel_max).sum(axis=-1)
+    return int(max(high.max(), -low.min()))
+
+
+def error_bound(conv_w, extra_frac_bits, pixel_range=PIXEL_RANGE):
+    """
+    Worst-case |Winograd - direct| conv output error, in conv accumulator LSBs
+
+    Each output is sum_ij (A_T[r,i] A_T[c,j]) U_ij V_ij, so a weight error e_ij
+    contributes at most |A_T[r,i] A_T[c,j]| |e_ij| max|V| at scale 2^extra.
+    The final >> extra floors, so any nonzero error can flip the last bit.
+    """
+    err = np.abs(rounding_error(conv_w, extra_frac_bits))
+    out_coeff = np.abs(np.einsum('ri,cj->rcij', A_T, A_T))
+    worst = np.einsum('rcij,fij->frc', out_coeff, err).max() * max_input_transform(pixel_range)
+    bound = worst / 2 ** extra_frac_bits
+    return 0.0 if worst == 0 else bound + 1.0
+
+
+def choose_extra_frac_bits(conv_w, tolerance=0.0):
+    """Fewest extra fractional bits whose error bound is within tolerance (LSBs)"""
+    for extra in range(MAX_EXTRA_FRAC_BITS + 1):
+        if error_bound(conv_w, extra) <= tolerance:
+            return extra
+    return MAX_EXTRA_FRAC_BITS
+
+
+def signed_width(values):
+    """Two's complement bits needed for every value"""
+    peak = int(np.max(np.abs(values))) if np.size(values) else 0
+    return max(2, peak.bit_length() + 1)
+
+
+def input_tiles(images):
+    """Overlapping 4x4 tiles, stride 2: [N, 28, 28] -> [N, 13, 13, 4, 4]"""
+    images = np.asarray(images, dtype=np.int64)
+    windows = np.lib.stride_tricks.sliding_window_view(images, (TILE, TILE), axis=(1, 2))
+    return windows[:, ::OUT_TILE, ::OUT_TILE]
+
+
+def conv_relu_winograd(images, u, conv_b, extra_frac_bits=MAX_EXTRA_FRAC_BITS,
+                       acc_width=ref.CONV_ACC_WIDTH):
+    """
+    Winograd conv + relu with 2x2 output tiles: [N, F, 26, 26]
+
+    Args:
+        images: uint8 [N, 28, 28]
+        u: transformed weights [F, 4, 4] from transform_weights()
+        conv_b: biases at conv accumulator scale [F]
+        extra_frac_bits: extra fractional bits of u (outputs are >> this)
+        acc_width: conv accumulator width after the shift (integer_reference.CONV_ACC_WIDTH)
+    """
+    v = np.einsum('ik,nyxkl,jl->nyxij', B_T, input_tiles(images), B_T)    # adds only
+    m = np.einsum('fij,nyxij->nfyxij', np.asarray(u, dtype=np.int64), v)  # 16 products / filter
+    y = np.einsum('ri,nfyxij,cj->nfyxrc', A_T, m, A_T)                    # adds only
+    y = y >> extra_frac_bits
+    n, f, ty, tx = y.shape[:4]
+    y = y.transpose(0, 1, 2, 4, 3, 5).reshape(n, f, ty * OUT_TILE, tx * OUT_TILE)
+    y = ref.wrap_signed(y + np.asarray(conv_b, dtype=np.int64)[None, :, None, None], acc_width)
+    return np.maximum(y, 0)
+
+
+def forward(images, params, u, extra_frac_bits=MAX_EXTRA_FRAC_BITS):
+    """Integer forward pass with the Winograd conv: uint8 [N, 28, 28] -> scores [N, 10]"""
+    pooled = ref.max_pool(conv_relu_winograd(images, u, params['conv_b'], extra_frac_bits))
+    return ref.dense(pooled.reshape(len(pooled), -1), params['fc_w'], params['fc_b'])
+
+
+def evaluate(images, labels, params, u, extra_frac_bits=MAX_EXTRA_FRAC_BITS, batch_size=1000):
+    """Test accuracy (%) of the Winograd integer model"""
+    predictions = np.concatenate([forward(images[i:i + batch_size], params, u, extra_frac_bits).argmax(axis=1)
+                                  for i in range(0, len(images), batch_size)])
+    return 100.0 * (predictions == np.asarray(labels)).mean()
+
+
+def multiplier_report(num_filters=ref.CONV_FILTERS):
+    """Multiplies / adds per 2x2 output tile, direct vs Winograd"""
+    outputs = OUT_TILE * OUT_TILE
+    return {
+        'direct_mults': num_filters * outputs * 9,
+        'direct_adds': num_filters * outputs * 8,
+        'winograd_mults': num_filters * TILE * TILE,
+        # B^T d B: 2 x 16 two-input adds, shared by all filters
+        'input_transform_adds': 2 * TILE * TILE,
+        # A^T M A: (2x4 + 2x2) outputs, 2 adds each, per filter
+        'output_transform_adds': num_filters * 2 * (OUT_TILE * TILE + OUT_TILE * OUT_TILE),
+    }
+
+
+def precision_analysis(images, labels, params):
+    """
+    Error bound, measured error and accuracy for every extra-bit setting
+
+    Returns:
+        list of dicts per extra_frac_bits (0..2)
+    """
+    direct = ref.conv_relu(images[:500], params['conv_w'], params['conv_b'])
+    rows = []
+    for extra in range(MAX_EXTRA_FRAC_BITS + 1):
+        u = transform_weights(params['conv_w'], extra)
+        wino = conv_relu_winograd(images[:500], u, params['conv_b'], extra)
+        rows.append({
+            'extra_frac_bits': extra,
+            'weight_width': signed_width(u),
+            'error_bound': error_bound(params['conv_w'], extra),
+            'max_error': int(np.abs(wino - direct).max()),
+            'mismatch_fraction': float((wino != direct).mean()),
+            'accuracy': evaluate(images, labels, params, u, extra),
+        })
+    return rows
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    tolerance = float(sys.argv[1]) if len(sys.argv) > 1 else 0.0
+
+    print("\n" + "="*60)
+    print("Winograd F(2x2, 3x3) Conv - Integer Reference")
+    print("="*60)
+
+    params = ref.load_exported_params('../hardware')
+    images, labels = ref.load_mnist_uint8('../data/MNIST/raw')
+    direct_accuracy, _ = ref.evaluate(images, labels, params)
+
+    extra = choose_extra_frac_bits(params['conv_w'], tolerance)
+    u = transform_weights(params['conv_w'], extra)
+    num_filters = len(params['conv_w'])
+
+    print(f"\nInput transform range: |B^T d B| <= {max_input_transform()} "
+          f"({signed_width(max_input_transform())} bits signed)")
+    print(f"\nPrecision analysis (error bound tolerance {tolerance:g} LSB):")
+    print(f"  {'extra bits':>10} {'U width':>8} {'bound':>8} {'max err':>8} {'mismatch':>9} {'accuracy':>9}")
+    for row in precision_analysis(images, labels, params):
+        mark = '  <- chosen' if row['extra_frac_bits'] == extra else ''
+        print(f"  {row['extra_frac_bits']:>10} {row['weight_width']:>8} {row['error_bound']:>8.1f} "
+              f"{row['max_error']:>8} {100 * row['mismatch_fraction']:>8.2f}% {row['accuracy']:>8.2f}%{mark}")
+
+    if extra == MAX_EXTRA_FRAC_BITS:
+        sample = images[:500]
+        assert np.array_equal(conv_relu_winograd(sample, u, params['conv_b'], extra),
+                              ref.conv_relu(sample, params['conv_w'], params['conv_b'])), \
+            "Winograd conv does not match direct conv"
+        print("✓ Winograd tiles match integer_reference.conv_relu bit for bit")
+
+    counts = multiplier_report(num_filters)
+    print(f"\nPer 2x2 output tile ({num_filters} filters):")
+    print(f"  Direct:   {counts['direct_mults']} multiplies, {counts['direct_adds']} adds")
+    print(f"  Winograd: {counts['winograd_mults']} multiplies, "
+          f"{counts['input_transform_adds'] + counts['output_transform_adds']} adds "
+          f"({counts['input_transform_adds']} input transform, {counts['output_transform_adds']} output)")
+    print(f"  Multiplier reduction: {counts['direct_mults'] / counts['winograd_mults']:.2f}x")
+
+    wino_accuracy = evaluate(images, labels, params, u, extra)
+    print(f"\nAccuracy: direct {direct_accuracy:.2f}%, Winograd {wino_accuracy:.2f}% "
+          f"({wino_accuracy - direct_accuracy:+.2f})\n")
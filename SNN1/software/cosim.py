@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+RTL / Python Co-Simulation for the XOR SNNs
+============================================
+Replays the input spikes recorded in an RTL waveform through the Python
+LIF network and reports, per neuron, the first clock cycle where the
+membrane potential or the output spike disagrees with the VCD.
+
+- Designs: snn_core.v (snn_xor_waveform.vcd) and snn_core_ternary.v
+  (snn_ternary_waveform.vcd)
+- Weights: taken from the Python model (model_xor.py / model_xor_ternary.py)
+  or from the parameters dumped in the VCD
+- Timing: 'model' (default) calls SNN_XOR.step / SNN_XOR_Ternary.step, the
+  Python models themselves (fire on the updated potential, lateral
+  inhibition applied immediately, no BOTH_INHIB path); 'rtl' is a separate
+  re-implementation of lif_neuron_weighted (fire on the registered
+  potential, spikes feed back one cycle later, POTENTIAL_WIDTH wrap-around)
+  that tells RTL bugs apart from model/RTL timing differences
+- The Python models do not match the RTL: with the checked-in waveforms
+  they first diverge at cycle 38 (xor) and 42 (ternary); 'rtl' timing matches
+  both waveforms
+- The VCD is streamed cycle by cycle (common/vcd_reader.py), so long
+  runs never load the whole waveform
+
+Usage: python3 cosim.py [xor|ternary] [model|vcd] [model|rtl] [--lockstep]
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+import instrument
+import vcd_reader
+from model_xor import LIF_Neuron, SNN_XOR
+from model_xor_ternary import SNN_XOR_Ternary
+
+DESIGNS = {
+    'xor': '../hardware/snn_xor_waveform.vcd',
+    'ternary': '../hardware/snn_ternary_waveform.vcd',
+}
+
+NEURONS = ['hidden_neuron_0', 'hidden_neuron_1', 'output_neuron']
+WEIGHTS = ['I0_H0', 'I1_H0', 'I0_H1', 'I1_H1', 'H0_O', 'H1_O', 'H0_H1', 'H1_H0', 'BOTH_INHIB']
+INPUTS = ['rst_n', 'switch_0', 'switch_1', 'spike_in_0', 'spike_in_1']
+
+
+def model_params(design, config=1, leak=0):
+    """Weights and neuron parameters of the Python model (banners suppressed)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        snn = SNN_XOR() if design == 'xor' else SNN_XOR_Ternary(config=config, leak=leak)
+
+    weights = {name: getattr(snn, 'w_' + name.lower(), 0) for name in WEIGHTS}
+    # The Python models have no direct both-inputs inhibition of the output
+    return {'threshold': snn.threshold, 'leak': snn.leak, 'potential_width': 8, 'weights': weights}
+
+
+def vcd_params(path):
+    """Weights and neuron parameters dumped by the RTL testbench"""
+    names = ['hidden_neuron_0.THRESHOLD', 'hidden_neuron_0.LEAK', 'hidden_neuron_0.POTENTIAL_WIDTH']
+    names += ['WEIGHT_' + name for name in WEIGHTS]
+    changes = vcd_reader.read_changes(path, names)
+    value = {name: int(vcd_reader.to_signed(changes[name][1][:1], 32)[0]) for name in names}
+
+    return {
+        'threshold': value['hidden_neuron_0.THRESHOLD'],
+        'leak': value['hidden_neuron_0.LEAK'],
+        'potential_width': value['hidden_neuron_0.POTENTIAL_WIDTH'],
+        'weights': {name: value['WEIGHT_' + name] for name in WEIGHTS},
+    }
+
+
+def wrap(value, width):
+    """Two's complement truncation to `width` bits"""
+    value &= (1 << width) - 1
+    return value - (1 << width) if value >= 1 << (width - 1) else value
+
+
+class RegisteredLIF(LIF_Neuron):
+    """LIF_Neuron with the register timing of lif_neuron_weighted"""
+
+    def __init__(self, threshold, leak, potential_width, name="Neuron"):
+        super().__init__(threshold, leak, name)
+        self.potential_width = potential_width
+
+    def step(self, input_current, time_step):
+        """One clock edge: threshold is checked on the current register value"""
+        if self.potential >= self.threshold:
+            self.spike_history.append(time_step)
+            self.potential = 0
+            return 1
+
+        next_potential = wrap(self.potential + input_current - self.leak, self.potential_width + 1)
+        self.potential = 0 if next_potential < 0 else wrap(next_potential, self.potential_width)
+        return 0
+
+
+class ModelNetwork:
+    """The Python model itself (SNN_XOR.step / SNN_XOR_Ternary.step), driven by recorded input spikes"""
+
+    def __init__(self, design, params):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.snn = SNN_XOR() if design == 'xor' else SNN_XOR_Ternary(config=1, leak=params['leak'])
+        self.neurons = [self.snn.hidden_0, self.snn.hidden_1, self.snn.output]
+        for neuron in self.neurons:
+            neuron.threshold, neuron.leak = params['threshold'], params['leak']
+        # The Python models have no BOTH_INHIB path, the switches are ignored
+        for name in WEIGHTS[:-1]:
+            setattr(self.snn, 'w_' + name.lower(), params['weights'][name])
+        self.spikes = [0, 0, 0]
+
+    def reset(self):
+        for neuron in self.neurons:
+            neuron.reset()
+        self.spikes = [0, 0, 0]
+
+    def load_state(self, potentials, spikes):
+        """Overwrite the state (lockstep mode)"""
+        for neuron, potential in zip(self.neurons, potentials):
+            neuron.potential = potential
+        self.spikes = list(spikes)
+
+    @property
+    def potentials(self):
+        return [neuron.potential for neuron in self.neurons]
+
+    def step(self, spike_in_0, spike_in_1, switch_0, switch_1, t):
+        self.spikes = list(self.snn.step(spike_in_0, spike_in_1, t))
+        return self.spikes
+
+
+class RTLTimingNetwork(ModelNetwork):
+    """Re-implementation of snn_core with RegisteredLIF neurons (not the Python models)"""
+
+    def __init__(self, design, params):
+        self.w = params['weights']
+        self.width = params['potential_width']
+        self.neurons = [RegisteredLIF(params['threshold'], params['leak'], self.width, name)
+                        for name in NEURONS]
+        self.spikes = [0, 0, 0]
+
+    def step(self, spike_in_0, spike_in_1, switch_0, switch_1, t):
+        # snn_core: currents are combinational from the registered spikes
+        w = self.w
+        s0, s1, _ = self.spikes
+        both = w['BOTH_INHIB'] if (switch_0 and switch_1) else 0
+        currents = [spike_in_0 * w['I0_H0'] + spike_in_1 * w['I1_H0'] + s1 * w['H1_H0'],
+                    spike_in_0 * w['I0_H1'] + spike_in_1 * w['I1_H1'] + s0 * w['H0_H1'],
+                    s0 * w['H0_O'] + s1 * w['H1_O'] + both]
+        currents = [wrap(c, self.width + 1) for c in currents]
+        self.spikes = [neuron.step(c, t) for neuron, c in zip(self.neurons, currents)]
+        return self.spikes
+
+
+NETWORKS = {'model': ModelNetwork, 'rtl': RTLTimingNetwork}
+LABELS = {'model': 'Python model ({}.step)', 'rtl': 'RTL-timing re-implementation (RegisteredLIF)'}
+
+
+def cosimulate(vcd_path, params, design='xor', timing='model', lockstep=False):
+    """
+    Compare a Python network with the RTL waveform cycle by cycle
+
+    timing='model' drives SNN_XOR.step / SNN_XOR_Ternary.step; timing='rtl'
+    drives RTLTimingNetwork, which only checks the RTL against itself.
+
+    Comparison starts at the first clock edge where reset is asserted. With
+    lockstep=True the Python state is reloaded from the RTL after every
+    cycle, so each mismatch is a single-step disagreement.
+
+    Returns:
+        dict with cycles compared and, per neuron and quantity ('potential',
+        'spike'), the first divergence (cycle, time, rtl, python) and count
+    """
+    net = NETWORKS[timing](design, params)
+    width = params['potential_width']
+    potential_signals = [f'{n}.membrane_potential' for n in NEURONS]
+    spike_signals = [f'{n}.spike_out' for n in NEURONS]
+
+    divergence = {(n, q): {'first': None, 'count': 0} for n in NEURONS for q in ('potential', 'spike')}
+    synced = False
+    cycles = 0
+
+    for cycle, (time, v) in enumerate(vcd_reader.iter_cycles(vcd_path, INPUTS + potential_signals + spike_signals)):
+        rtl_potentials = [vcd_reader.to_signed([v[s]], width)[0] if v[s] >= 0 else v[s]
+                          for s in potential_signals]
+        rtl_spikes = [v[s] for s in spike_signals]
+
+        if synced:
+            cycles += 1
+            for i, name in enumerate(NEURONS):
+                for quantity, rtl, python in [('potential', rtl_potentials[i], net.potentials[i]),
+                                              ('spike', rtl_spikes[i], net.spikes[i])]:
+                    if rtl != python:
+                        entry = divergence[(name, quantity)]
+                        entry['count'] += 1
+                        if entry['first'] is None:
+                            entry['first'] = (cycle, time, int(rtl), int(python))
+            if lockstep:
+                net.load_state([int(p) for p in rtl_potentials], [int(s) for s in rtl_spikes])
+
+        if v['rst_n'] == 0:
+            net.reset()
+            synced = True
+        elif synced:
+            net.step(v['spike_in_0'], v['spike_in_1'], v['switch_0'], v['switch_1'], cycle)
+
+    return {'cycles': cycles, 'divergence': divergence}
+
+
+def print_report(result, timescale=None):
+    """Per-neuron first divergence table"""
+    print(f"Cycles compared: {result['cycles']}")
+    print(f"\n{'Neuron':<16} | {'Signal':<9} | {'First cycle':>11} | {'Time':>10} | "
+          f"{'RTL':>4} | {'Python':>6} | {'Mismatches':>10}")
+    print("-" * 84)
+    for (name, quantity), entry in result['divergence'].items():
+        if entry['first'] is None:
+            print(f"{name:<16} | {quantity:<9} | {'-':>11} | {'-':>10} | {'':>4} | {'':>6} | {0:>10}")
+            continue
+        cycle, time, rtl, python = entry['first']
+        print(f"{name:<16} | {quantity:<9} | {cycle:>11} | {time:>10} | "
+              f"{rtl:>4} | {python:>6} | {entry['count']:>10}")
+    if timescale:
+        print(f"(time in VCD units of {timescale})")
+
+
+if __name__ == "__main__":
+    instrument.setup()
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    lockstep = '--lockstep' in sys.argv
+
+    design = args[0] if len(args) > 0 else 'xor'
+    source = args[1] if len(args) > 1 else 'vcd'
+    timing = args[2] if len(args) > 2 else 'model'
+    vcd_path = DESIGNS[design]
+
+    print("\n" + "=" * 70)
+    print(f" RTL / PYTHON CO-SIMULATION - {design.upper()}")
+    print("=" * 70)
+
+    params = vcd_params(vcd_path) if source == 'vcd' else model_params(design)
+    with open(vcd_path) as f:
+        timescale = vcd_reader.read_header(f).timescale
+
+    print(f"Waveform: {vcd_path}")
+    print(f"Weights from: {source}, timing: {timing}{', lockstep' if lockstep else ''}")
+    print(f"THRESHOLD={params['threshold']}, LEAK={params['leak']}, "
+          f"POTENTIAL_WIDTH={params['potential_width']}")
+    print("Weights: " + ", ".join(f"{k}={v}" for k, v in params['weights'].items()))
+
+    label = LABELS[timing].format(SNN_XOR.__name__ if design == 'xor' else SNN_XOR_Ternary.__name__)
+    print(f"Comparing: {label} vs RTL")
+    if timing == 'model' and params['weights']['BOTH_INHIB']:
+        print(f"Note: the Python model has no BOTH_INHIB path (RTL: {params['weights']['BOTH_INHIB']})")
+    print()
+
+    result = cosimulate(vcd_path, params, design, timing, lockstep)
+    print_report(result, timescale)
+
+    firsts = [entry['first'][0] for entry in result['divergence'].values() if entry['first']]
+    diverged = bool(firsts)
+    if diverged:
+        print(f"\n✗ {label} diverges from RTL (first at cycle {min(firsts)})")
+    else:
+        print(f"\n✓ {label} matches RTL")
+    print("=" * 70 + "\n")
+    sys.exit(1 if diverged else 0)
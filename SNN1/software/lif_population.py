@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Vectorized LIF Population Engine
+================================
+Array-backed version of the LIF_Neuron / SNN_XOR models: every layer keeps
+its membrane potentials, thresholds and leaks in NumPy arrays of shape
+[batch, neurons], and every connection is a weight matrix applied to the
+spike vector once per time step.
+
+- Same integer update as LIF_Neuron.step: V += I - leak, clamp at 0,
+  spike and reset to 0 when V >= threshold
+- Same order as SNN_XOR.simulate within a step: layer k fires, its lateral
+  weights are applied to its own potentials (clamped at 0), then its spikes
+  drive layer k + 1 in the same step
+- A batch of independent simulations (input patterns, or whole networks with
+  per-batch weights, thresholds and leaks) runs in one pass
+- Currents are computed as float32 GEMMs (BLAS) and are exact while every
+  |sum of weights| < 2^24
+
+Usage: python3 lif_population.py [hidden_neurons] [batch]   (verify vs model_xor.py + benchmark)
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+import instrument
+
+XOR_PATTERNS = [(0, 0), (0, 1), (1, 0), (1, 1)]
+XOR_EXPECTED = [0, 1, 1, 0]
+
+
+def propagate(spikes, weights):
+    """
+    Input currents of the next layer: spikes [B, n_src] x weights -> int32 [B, n_dst]
+
+    weights is [n_src, n_dst] (shared) or [B, n_src, n_dst] (one network per batch entry).
+    """
+    if weights.ndim == 2:
+        current = spikes.astype(np.float32) @ weights
+    else:
+        current = np.einsum('bi,bij->bj', spikes.astype(np.float32), weights)
+    return current.astype(np.int32)
+
+
+class LIFPopulation:
+    """N integer LIF neurons in each of B independent simulations"""
+
+    __slots__ = ('size', 'batch', 'threshold', 'leak', 'potential')
+
+    def __init__(self, size, threshold=15, leak=1, batch=1):
+        """threshold / leak: scalar, [N], [B, 1] or [B, N]"""
+        self.size = size
+        self.batch = batch
+        self.threshold = np.broadcast_to(np.asarray(threshold, dtype=np.int32), (batch, size))
+        self.leak = np.broadcast_to(np.asarray(leak, dtype=np.int32), (batch, size))
+        self.potential = np.zeros((batch, size), dtype=np.int32)
+
+    def reset(self):
+        self.potential[:] = 0
+
+    def step(self, current):
+        """Integrate, leak, clamp, fire and reset: returns bool spikes [B, N]"""
+        v = self.potential
+        v += current
+        v -= self.leak
+        np.maximum(v, 0, out=v)
+        spikes = v >= self.threshold
+        v[spikes] = 0
+        return spikes
+
+    def inhibit(self, spikes, lateral):
+        """Add this step's lateral currents (e.g. inhibition) to the potentials, clamped at 0"""
+        self.potential += propagate(spikes, lateral)
+        np.maximum(self.potential, 0, out=self.potential)
+
+
+class LIFNetwork:
+    """
+    Layered LIF network; layer 0 is the input spike source
+
+    Args:
+        weights: weights[k] connects layer k to layer k + 1: [n_k, n_k+1] or [B, n_k, n_k+1]
+        lateral: lateral[k] (or None) connects layer k + 1 to itself, same shapes
+        threshold, leak: per layer (list) or for all layers; each as in LIFPopulation
+        batch: number of independent simulations
+    """
+
+    def __init__(self, weights, lateral=None, threshold=15, leak=1, batch=1):
+        self.weights = [np.asarray(w, dtype=np.float32) for w in weights]
+        self.lateral = [None if l is None else np.asarray(l, dtype=np.float32)
+                        for l in (lateral or [None] * len(weights))]
+        self.sizes = [self.weights[0].shape[-2]] + [w.shape[-1] for w in self.weights]
+        self.batch = batch
+
+        per_layer = lambda value: value if isinstance(value, list) else [value] * len(self.weights)
+        self.layers = [LIFPopulation(size, thr, lk, batch)
+                       for size, thr, lk in zip(self.sizes[1:], per_layer(threshold), per_layer(leak))]
+
+    def reset(self):
+        for layer in self.layers:
+            layer.reset()
+
+    def run(self, input_spikes, record=False):
+        """
+        Simulate from rest
+
+        Args:
+            input_spikes: 0/1 [T, B, n_in] (see input_spikes())
+            record: also return every layer's spike raster
+
+        Returns:
+            dict with, per layer (index 0 = first non-input layer):
+                counts: int [B, N] spikes per neuron
+                first_spike: int [B, N] first spike step (-1 if none)
+                spikes: bool [T, B, N] (only when record=True)
+        """
+        self.reset()
+        steps = len(input_spikes)
+        counts = [np.zeros((self.batch, n), dtype=np.int32) for n in self.sizes[1:]]
+        first = [np.full((self.batch, n), -1, dtype=np.int32) for n in self.sizes[1:]]
+        rasters = [np.zeros((steps, self.batch, n), dtype=bool) for n in self.sizes[1:]] if record else None
+
+        for t in range(steps):
+            spikes = input_spikes[t]
+            for k, layer in enumerate(self.layers):
+                spikes = layer.step(propagate(spikes, self.weights[k]))
+                if self.lateral[k] is not None:
+                    layer.inhibit(spikes, self.lateral[k])
+                counts[k] += spikes
+                first[k][(first[k] < 0) & spikes] = t
+                if record:
+                    rasters[k][t] = spikes
+
+        result = {'counts': counts, 'first_spike': first}
+        if record:
+            result['spikes'] = rasters
+        return result
+
+
+def input_spikes(patterns, time_steps, period=1):
+    """
+    Input spike trains [T, B, n_in]: an active input spikes every `period` steps from t = 0
+
+    period=1 is SNN_XOR.simulate's constant drive; period > 1 is
+    SNN_XOR_Ternary.simulate_spike_train's periodic drive.
+    """
+    patterns = np.asarray(patterns, dtype=bool)
+    active = (np.arange(time_steps) % period == 0)[:, None, None]
+    return active & patterns[None]
+
+
+def xor_network(snn, batch=len(XOR_PATTERNS)):
+    """LIFNetwork with the weights, threshold and leak of an SNN_XOR / SNN_XOR_Ternary instance"""
+    weights = [[[snn.w_i0_h0, snn.w_i0_h1],
+                [snn.w_i1_h0, snn.w_i1_h1]],
+               [[snn.w_h0_o],
+                [snn.w_h1_o]]]
+    lateral = [[[0, snn.w_h0_h1],
+                [snn.w_h1_h0, 0]], None]
+    return LIFNetwork(weights, lateral, snn.threshold, snn.leak, batch)
+
+
+def random_network(num_inputs, num_hidden, num_outputs, batch=1, seed=0):
+    """Large random excitatory network with uniform lateral inhibition, for benchmarking"""
+    rng = np.random.default_rng(seed)
+    weights = [rng.integers(0, 8, size=(num_inputs, num_hidden)),
+               rng.integers(0, 8, size=(num_hidden, num_outputs))]
+    lateral = np.full((num_hidden, num_hidden), -1)
+    np.fill_diagonal(lateral, 0)
+    return LIFNetwork(weights, [lateral, None], threshold=[40, 60], leak=1, batch=batch)
+
+
+def verify_against_scalar(time_steps=50):
+    """Spike counts of the population engine vs SNN_XOR / SNN_XOR_Ternary for every XOR input"""
+    from model_xor import SNN_XOR
+    from model_xor_ternary import SNN_XOR_Ternary
+
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        snn = SNN_XOR()
+        scalar = []
+        for i0, i1 in XOR_PATTERNS:
+            snn.simulate(i0, i1, time_steps)
+            scalar.append(len(snn.output.spike_history))
+        vector = xor_network(snn).run(input_spikes(XOR_PATTERNS, time_steps))['counts'][-1][:, 0]
+        results.append(('SNN_XOR', scalar, vector.tolist()))
+
+        for config in [1, 2, 3]:
+            for leak in [0, 1]:
+                for period in [3, 5, 10]:
+                    snn = SNN_XOR_Ternary(config=config, leak=leak)
+                    scalar = [snn.simulate_spike_train(i0, i1, 100, period) for i0, i1 in XOR_PATTERNS]
+                    vector = xor_network(snn).run(input_spikes(XOR_PATTERNS, 100, period))['counts'][-1][:, 0]
+                    results.append((f'ternary config {config} leak {leak} period {period}',
+                                     scalar, vector.tolist()))
+    return results
+
+
+def benchmark(num_hidden=2000, batch=32, time_steps=200):
+    """
+    Steps/sec of the scalar models vs the population engine
+
+    Returns:
+        list of (name, neurons, simulations, network steps/sec, neuron updates/sec)
+    """
+    from model_xor import SNN_XOR
+
+    rows = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        snn = SNN_XOR()
+        start = time.perf_counter()
+        for i0, i1 in XOR_PATTERNS:
+            snn.simulate(i0, i1, time_steps)
+        elapsed = time.perf_counter() - start
+    rows.append(('SNN_XOR.simulate (scalar)', 3, 1, len(XOR_PATTERNS) * time_steps / elapsed))
+
+    for name, network, spikes in [
+            ('XOR, 4 patterns', xor_network(snn), input_spikes(XOR_PATTERNS, time_steps)),
+            ('XOR, 4096 patterns', xor_network(snn, 4096),
+             input_spikes(np.tile(XOR_PATTERNS, (1024, 1)), time_steps)),
+            (f'random 100-{num_hidden}-10, lateral', random_network(100, num_hidden, 10, batch),
+             np.random.default_rng(0).random((time_steps, batch, 100)) < 0.2)]:
+        start = time.perf_counter()
+        network.run(spikes)
+        elapsed = time.perf_counter() - start
+        rows.append((name, sum(network.sizes[1:]), network.batch, network.batch * time_steps / elapsed))
+
+    return [(name, neurons, sims, rate, rate * neurons) for name, neurons, sims, rate in rows]
+
+
+if __name__ == "__main__":
+    instrument.setup()
+
+    num_hidden = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    print("\n" + "=" * 70)
+    print(" VECTORIZED LIF POPULATION ENGINE")
+    print("=" * 70)
+
+    print("\nOutput spike counts per XOR input (scalar model vs population engine):")
+    all_match = True
+    for name, scalar, vector in verify_against_scalar():
+        match = scalar == vector
+        all_match &= match
+        print(f"  {name:<34} {str(scalar):<18} {str(vector):<18} {'✓' if match else '✗ MISMATCH'}")
+    print(f"\n{'✓ Population engine matches the scalar models' if all_match else '✗ Population engine differs'}")
+
+    print(f"\n{'network':<30} {'neurons':>8} {'sims':>6} {'steps/s':>12} {'neuron upd/s':>14}")
+    for name, neurons, sims, rate, updates in benchmark(num_hidden, batch):
+        print(f"{name:<30} {neurons:>8,} {sims:>6,} {rate:>12,.0f} {updates:>14,.0f}")
+    print("=" * 70 + "\n")
+    sys.exit(0 if all_match else 1)
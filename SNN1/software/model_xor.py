@@ -18,10 +18,24 @@ XOR Truth Table:
    1 |  0 |   1
    1 |  1 |   0
 
+Every step is recorded into a preallocated trace (snn_trace.TraceRecorder);
+--verbose prints the per-step state, --vcd writes one VCD per XOR case with
+the RTL signal names (tb_snn.dut.core.*).
+
+Usage: python3 model_xor.py [--verbose] [--vcd]
+
 Author: Senior FPGA Engineer
 Date: January 28, 2026
 """
 
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+import instrument
+from snn_trace import RTL_SCOPES, TraceRecorder, write_vcd
+
 # import numpy as np
 
 class LIF_Neuron:
@@ -64,7 +78,8 @@ class LIF_Neuron:
 class SNN_XOR:
     """SNN Network for XOR computation"""
     
-    def __init__(self):
+    def __init__(self, trace_capacity=None):
+        """trace_capacity: fixed trace length (ring buffer); None sizes it to each run"""
         # Network parameters (tuned for XOR)
         self.threshold = 15
         self.leak = 1
@@ -89,6 +104,10 @@ class SNN_XOR:
         self.w_h0_h1 = -25  # Hidden 0 inhibits Hidden 1
         self.w_h1_h0 = -25  # Hidden 1 inhibits Hidden 0
         
+        # Per-step recording of inputs, potentials and spikes
+        self.trace_capacity = trace_capacity
+        self.trace = TraceRecorder(capacity=trace_capacity) if trace_capacity else None
+        
         print("=" * 70)
         print("SNN XOR Network Initialized")
         print("=" * 70)
@@ -103,7 +122,56 @@ class SNN_XOR:
         print(f"    H0->H1: {self.w_h0_h1:+4d}  |  H1->H0: {self.w_h1_h0:+4d}")
         print("=" * 70 + "\n")
     
-    def simulate(self, input_0, input_1, time_steps=50):
+    def step(self, input_0, input_1, t):
+        """
+        Advance the network by one time step
+        
+        Args:
+            input_0, input_1: Input levels (or spikes) applied in this step
+            t: Time step, recorded in each neuron's spike history
+        
+        Returns:
+            (h0_spike, h1_spike, o_spike)
+        """
+        # Calculate currents for hidden layer
+        h0_current = 0
+        h1_current = 0
+        
+        if input_0:
+            h0_current += self.w_i0_h0
+            h1_current += self.w_i0_h1
+        
+        if input_1:
+            h0_current += self.w_i1_h0
+            h1_current += self.w_i1_h1
+        
+        # Process hidden neurons
+        h0_spike = self.hidden_0.step(h0_current, t)
+        h1_spike = self.hidden_1.step(h1_current, t)
+        
+        # Apply lateral inhibition
+        if h0_spike:
+            self.hidden_1.potential += self.w_h0_h1
+            if self.hidden_1.potential < 0:
+                self.hidden_1.potential = 0
+                
+        if h1_spike:
+            self.hidden_0.potential += self.w_h1_h0
+            if self.hidden_0.potential < 0:
+                self.hidden_0.potential = 0
+        
+        # Calculate current for output neuron
+        o_current = 0
+        if h0_spike:
+            o_current += self.w_h0_o
+        if h1_spike:
+            o_current += self.w_h1_o
+        
+        # Process output neuron
+        o_spike = self.output.step(o_current, t)
+        return h0_spike, h1_spike, o_spike
+    
+    def simulate(self, input_0, input_1, time_steps=50, verbose=False, record=True):
         """
         Simulate the network for given inputs
         
@@ -111,71 +179,58 @@ class SNN_XOR:
             input_0: Input spike train for input 0
             input_1: Input spike train for input 1
             time_steps: Number of time steps to simulate
+            verbose: Print the state every 10 steps and on every spike
+            record: Record every step into self.trace
         """
         # Reset all neurons
         self.hidden_0.reset()
         self.hidden_1.reset()
         self.output.reset()
         
+        trace = self.trace if record else None
+        if record:
+            if trace is None or (not self.trace_capacity and trace.capacity < time_steps):
+                trace = self.trace = TraceRecorder(capacity=time_steps)
+            trace.reset()
+        
         output_spikes = []
         
-        print(f"Simulating: I0={input_0}, I1={input_1}")
-        print("-" * 70)
+        if verbose:
+            print(f"Simulating: I0={input_0}, I1={input_1}")
+            print("-" * 70)
         
         for t in range(time_steps):
-            # Calculate currents for hidden layer
-            h0_current = 0
-            h1_current = 0
-            
-            if input_0:
-                h0_current += self.w_i0_h0
-                h1_current += self.w_i0_h1
-            
-            if input_1:
-                h0_current += self.w_i1_h0
-                h1_current += self.w_i1_h1
-            
-            # Process hidden neurons
-            h0_spike = self.hidden_0.step(h0_current, t)
-            h1_spike = self.hidden_1.step(h1_current, t)
-            
-            # Apply lateral inhibition
-            if h0_spike:
-                self.hidden_1.potential += self.w_h0_h1
-                if self.hidden_1.potential < 0:
-                    self.hidden_1.potential = 0
-                    
-            if h1_spike:
-                self.hidden_0.potential += self.w_h1_h0
-                if self.hidden_0.potential < 0:
-                    self.hidden_0.potential = 0
-            
-            # Calculate current for output neuron
-            o_current = 0
-            if h0_spike:
-                o_current += self.w_h0_o
-            if h1_spike:
-                o_current += self.w_h1_o
-            
-            # Process output neuron
-            o_spike = self.output.step(o_current, t)
+            h0_spike, h1_spike, o_spike = self.step(input_0, input_1, t)
             output_spikes.append(o_spike)
             
+            if trace is not None:
+                trace.record(t, (input_0, input_1,
+                                 self.hidden_0.potential, h0_spike,
+                                 self.hidden_1.potential, h1_spike,
+                                 self.output.potential, o_spike))
+            
             # Display state every 10 steps or when spikes occur
-            if t % 10 == 0 or h0_spike or h1_spike or o_spike:
+            if verbose and (t % 10 == 0 or h0_spike or h1_spike or o_spike):
                 print(f"t={t:3d} | H0: V={self.hidden_0.potential:3d} S={h0_spike} | "
                       f"H1: V={self.hidden_1.potential:3d} S={h1_spike} | "
                       f"Out: V={self.output.potential:3d} S={o_spike}")
         
         total_output_spikes = sum(output_spikes)
-        print(f"\nTotal Output Spikes: {total_output_spikes}")
-        print("=" * 70 + "\n")
+        if verbose:
+            print(f"\nTotal Output Spikes: {total_output_spikes}")
+            print("=" * 70 + "\n")
         
         return total_output_spikes > 0
 
 
-def main():
-    """Test all XOR combinations"""
+def main(verbose=False, vcd=False):
+    """
+    Test all XOR combinations
+    
+    Args:
+        verbose: Print the per-step network state
+        vcd: Write each case's trace to model_xor_<i0><i1>.vcd
+    """
     
     print("\n" + "=" * 70)
     print(" XOR SPIKING NEURAL NETWORK - WEIGHT CALCULATION")
@@ -198,9 +253,15 @@ def main():
         print(f"TEST CASE: {i0} XOR {i1} = {expected}")
         print(f"{'='*70}")
         
-        output = snn.simulate(i0, i1, time_steps=50)
+        output = snn.simulate(i0, i1, time_steps=50, verbose=verbose)
         result = 1 if output else 0
         
+        if vcd:
+            path = f"model_xor_{i0}{i1}.vcd"
+            write_vcd(snn.trace, path, RTL_SCOPES['xor'],
+                      parameters={'THRESHOLD': snn.threshold, 'LEAK': snn.leak})
+            print(f"Trace written to {path}")
+        
         status = "✓ PASS" if result == expected else "✗ FAIL"
         results.append((i0, i1, expected, result, status))
         
@@ -237,4 +298,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    instrument.setup()
+    main(verbose='--verbose' in sys.argv, vcd='--vcd' in sys.argv)
@@ -6,10 +6,34 @@ This script tests if XOR can be implemented using ONLY {-1, 0, +1} weights.
 
 Constraint: All synaptic weights must be in {-1, 0, +1}
 
+`python3 model_xor_ternary.py search` runs an exhaustive search instead: all
+3^8 = 6561 ternary weight assignments x thresholds x leaks x spike periods,
+each simulated on the four XOR inputs in one batched lif_population run.
+
+Every step is recorded into a preallocated trace (snn_trace.TraceRecorder);
+--verbose prints the per-step state, --vcd writes one VCD per XOR case with
+the RTL signal names (tb_snn_ternary.dut.*).
+
+Usage: python3 model_xor_ternary.py [--verbose] [--vcd] | search [top]
+
 Author: Senior FPGA Engineer
 Date: February 2, 2026
 """
 
+import itertools
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+import instrument
+import lif_population
+from snn_trace import RTL_SCOPES, TraceRecorder, write_vcd
+
 class LIF_Neuron:
     """Simple Leaky Integrate-and-Fire neuron model"""
     
@@ -50,12 +74,13 @@ class LIF_Neuron:
 class SNN_XOR_Ternary:
     """SNN Network for XOR with TERNARY weights {-1, 0, +1}"""
     
-    def __init__(self, config=1, leak=0):
+    def __init__(self, config=1, leak=0, trace_capacity=None):
         """
         Initialize network with different ternary weight configurations
         
         config: Which weight configuration to try
         leak: Leak value (0 for no leak, allows ternary weights to work)
+        trace_capacity: Fixed trace length (ring buffer); None sizes it to each run
         """
         # Network parameters
         self.threshold = 3   # Lower threshold for ternary weights
@@ -107,6 +132,10 @@ class SNN_XOR_Ternary:
         for w in all_weights:
             assert w in [-1, 0, 1], f"Invalid weight {w}! Must be in {{-1, 0, +1}}"
         
+        # Per-step recording of inputs, potentials and spikes
+        self.trace_capacity = trace_capacity
+        self.trace = TraceRecorder(capacity=trace_capacity) if trace_capacity else None
+        
         print("=" * 80)
         print(f"SNN XOR Network with TERNARY WEIGHTS (Configuration {config})")
         print("=" * 80)
@@ -122,7 +151,57 @@ class SNN_XOR_Ternary:
         print(f"    H0→H1: {self.w_h0_h1:+2d}  |  H1→H0: {self.w_h1_h0:+2d}")
         print("=" * 80 + "\n")
     
-    def simulate_spike_train(self, input_0, input_1, time_steps=100, spike_period=5):
+    def step(self, spike_i0, spike_i1, t):
+        """
+        Advance the network by one time step
+        
+        Args:
+            spike_i0, spike_i1: Input spikes in this step
+            t: Time step, recorded in each neuron's spike history
+        
+        Returns:
+            (h0_spike, h1_spike, o_spike)
+        """
+        # Calculate currents for hidden layer
+        h0_current = 0
+        h1_current = 0
+        
+        if spike_i0:
+            h0_current += self.w_i0_h0
+            h1_current += self.w_i0_h1
+        
+        if spike_i1:
+            h0_current += self.w_i1_h0
+            h1_current += self.w_i1_h1
+        
+        # Process hidden neurons
+        h0_spike = self.hidden_0.step(h0_current, t)
+        h1_spike = self.hidden_1.step(h1_current, t)
+        
+        # Apply lateral inhibition
+        if h0_spike:
+            self.hidden_1.potential += self.w_h0_h1
+            if self.hidden_1.potential < 0:
+                self.hidden_1.potential = 0
+                
+        if h1_spike:
+            self.hidden_0.potential += self.w_h1_h0
+            if self.hidden_0.potential < 0:
+                self.hidden_0.potential = 0
+        
+        # Calculate current for output neuron
+        o_current = 0
+        if h0_spike:
+            o_current += self.w_h0_o
+        if h1_spike:
+            o_current += self.w_h1_o
+        
+        # Process output neuron
+        o_spike = self.output.step(o_current, t)
+        return h0_spike, h1_spike, o_spike
+    
+    def simulate_spike_train(self, input_0, input_1, time_steps=100, spike_period=5,
+                             verbose=False, record=True):
         """
         Simulate with periodic spike trains (more realistic)
         
@@ -131,77 +210,63 @@ class SNN_XOR_Ternary:
             input_1: 1 if input 1 is active, 0 otherwise
             time_steps: Number of time steps to simulate
             spike_period: Generate spike every N steps when input is active
+            verbose: Print the state for t < 30 and on every spike
+            record: Record every step into self.trace
         """
         # Reset all neurons
         self.hidden_0.reset()
         self.hidden_1.reset()
         self.output.reset()
         
+        trace = self.trace if record else None
+        if record:
+            if trace is None or (not self.trace_capacity and trace.capacity < time_steps):
+                trace = self.trace = TraceRecorder(capacity=time_steps)
+            trace.reset()
+        
         output_spike_count = 0
         
-        print(f"Simulating: I0={input_0}, I1={input_1} (spike period={spike_period})")
-        print("-" * 80)
+        if verbose:
+            print(f"Simulating: I0={input_0}, I1={input_1} (spike period={spike_period})")
+            print("-" * 80)
         
         for t in range(time_steps):
             # Generate input spikes periodically
             spike_i0 = 1 if (input_0 and t % spike_period == 0) else 0
             spike_i1 = 1 if (input_1 and t % spike_period == 0) else 0
             
-            # Calculate currents for hidden layer
-            h0_current = 0
-            h1_current = 0
-            
-            if spike_i0:
-                h0_current += self.w_i0_h0
-                h1_current += self.w_i0_h1
-            
-            if spike_i1:
-                h0_current += self.w_i1_h0
-                h1_current += self.w_i1_h1
-            
-            # Process hidden neurons
-            h0_spike = self.hidden_0.step(h0_current, t)
-            h1_spike = self.hidden_1.step(h1_current, t)
-            
-            # Apply lateral inhibition
-            if h0_spike:
-                self.hidden_1.potential += self.w_h0_h1
-                if self.hidden_1.potential < 0:
-                    self.hidden_1.potential = 0
-                    
-            if h1_spike:
-                self.hidden_0.potential += self.w_h1_h0
-                if self.hidden_0.potential < 0:
-                    self.hidden_0.potential = 0
-            
-            # Calculate current for output neuron
-            o_current = 0
-            if h0_spike:
-                o_current += self.w_h0_o
-            if h1_spike:
-                o_current += self.w_h1_o
-            
-            # Process output neuron
-            o_spike = self.output.step(o_current, t)
+            h0_spike, h1_spike, o_spike = self.step(spike_i0, spike_i1, t)
             if o_spike:
                 output_spike_count += 1
             
+            if trace is not None:
+                trace.record(t, (spike_i0, spike_i1,
+                                 self.hidden_0.potential, h0_spike,
+                                 self.hidden_1.potential, h1_spike,
+                                 self.output.potential, o_spike))
+            
             # Display state when spikes occur or every 10 steps
-            if (t < 30) or (spike_i0 or spike_i1 or h0_spike or h1_spike or o_spike):
+            if verbose and ((t < 30) or (spike_i0 or spike_i1 or h0_spike or h1_spike or o_spike)):
                 print(f"t={t:3d} | In:[{spike_i0},{spike_i1}] | "
                       f"H0: V={self.hidden_0.potential:2d} S={h0_spike} | "
                       f"H1: V={self.hidden_1.potential:2d} S={h1_spike} | "
                       f"Out: V={self.output.potential:2d} S={o_spike}")
         
-        print(f"\n{'='*40}")
-        print(f"Total Output Spikes: {output_spike_count}")
-        print(f"{'='*40}\n")
+        if verbose:
+            print(f"\n{'='*40}")
+            print(f"Total Output Spikes: {output_spike_count}")
+            print(f"{'='*40}\n")
         
         return output_spike_count
 
 
-def test_configuration(config, spike_period=5, leak=0):
-    """Test a specific weight configuration"""
+def test_configuration(config, spike_period=5, leak=0, verbose=False, vcd=False):
+    """
+    Test a specific weight configuration
+    
+    verbose: Print the per-step network state
+    vcd: Write each case's trace to model_xor_ternary_c<config>_l<leak>_p<period>_<i0><i1>.vcd
+    """
     
     print("\n" + "=" * 80)
     print(f" TESTING CONFIGURATION {config} (leak={leak})")
@@ -224,7 +289,15 @@ def test_configuration(config, spike_period=5, leak=0):
         print(f"TEST: {i0} XOR {i1} = {expected}")
         print(f"{'─'*80}")
         
-        spike_count = snn.simulate_spike_train(i0, i1, time_steps=100, spike_period=spike_period)
+        spike_count = snn.simulate_spike_train(i0, i1, time_steps=100, spike_period=spike_period,
+                                               verbose=verbose)
+        
+        if vcd:
+            path = f"model_xor_ternary_c{config}_l{leak}_p{spike_period}_{i0}{i1}.vcd"
+            write_vcd(snn.trace, path, RTL_SCOPES['ternary'],
+                      parameters={'THRESHOLD': snn.threshold, 'LEAK': snn.leak,
+                                  'SPIKE_PERIOD': spike_period})
+            print(f"Trace written to {path}")
         
         # XOR: expect output for (0,1) and (1,0), no output for (0,0) and (1,1)
         result = 1 if spike_count > 0 else 0
@@ -254,7 +327,7 @@ def test_configuration(config, spike_period=5, leak=0):
     return passed == 4
 
 
-def main():
+def main(verbose=False, vcd=False):
     """Test multiple configurations to find working ternary weights"""
     
     print("\n" + "=" * 80)
@@ -275,7 +348,7 @@ def main():
                 print(f"# Testing Config {config}, leak={leak}, spike_period={spike_period}")
                 print(f"{'#'*80}")
                 
-                success = test_configuration(config, spike_period, leak)
+                success = test_configuration(config, spike_period, leak, verbose, vcd)
                 
                 if success:
                     working_configs.append((config, spike_period, leak))
@@ -333,5 +406,128 @@ def main():
     print("\n" + "=" * 80 + "\n")
 
 
+# Order of the 8 weights in a search configuration
+WEIGHT_NAMES = ['w_i0_h0', 'w_i1_h0', 'w_i0_h1', 'w_i1_h1', 'w_h0_o', 'w_h1_o', 'w_h0_h1', 'w_h1_h0']
+
+SEARCH_THRESHOLDS = [1, 2, 3, 4, 5]
+SEARCH_LEAKS = [0, 1]
+SEARCH_SPIKE_PERIODS = [1, 2, 3, 5, 10]
+
+
+def ternary_configurations():
+    """Every assignment of {-1, 0, +1} to the 8 weights: int [6561, 8]"""
+    return np.array(list(itertools.product([-1, 0, 1], repeat=len(WEIGHT_NAMES))), dtype=np.int32)
+
+
+def hardware_cost(weights, leak):
+    """
+    Adders in snn_core_ternary: one add/subtract per nonzero synapse, plus one
+    leak subtractor per neuron (3) when leak > 0
+    """
+    return np.count_nonzero(weights, axis=-1) + 3 * (np.asarray(leak) > 0)
+
+
+def simulate_configurations(weights, threshold, leak, spike_period, time_steps=100):
+    """
+    Batched XOR simulation of many networks
+
+    Args:
+        weights: int [C, 8] in WEIGHT_NAMES order
+        threshold, leak: int [C] per network
+        spike_period: input spike period shared by the batch
+
+    Returns:
+        spike_count: int [C, 4] output spikes per XOR input
+        first_spike: int [C, 4] first output spike step per XOR input (-1 if none)
+    """
+    patterns = len(lif_population.XOR_PATTERNS)
+    w = np.repeat(weights, patterns, axis=0)  # batch index = config * 4 + pattern
+    network = lif_population.LIFNetwork(
+        weights=[w[:, [0, 2, 1, 3]].reshape(-1, 2, 2),           # [[i0h0, i0h1], [i1h0, i1h1]]
+                 w[:, [4, 5]].reshape(-1, 2, 1)],
+        lateral=[np.stack([np.zeros_like(w[:, 6]), w[:, 6], w[:, 7], np.zeros_like(w[:, 7])],
+                          axis=1).reshape(-1, 2, 2), None],
+        threshold=np.repeat(threshold, patterns)[:, None],
+        leak=np.repeat(leak, patterns)[:, None],
+        batch=len(w))
+    spikes = lif_population.input_spikes(np.tile(lif_population.XOR_PATTERNS, (len(weights), 1)),
+                                         time_steps, spike_period)
+    result = network.run(spikes)
+    return (result['counts'][-1][:, 0].reshape(-1, patterns),
+            result['first_spike'][-1][:, 0].reshape(-1, patterns))
+
+
+def search_configurations(thresholds=SEARCH_THRESHOLDS, leaks=SEARCH_LEAKS,
+                          spike_periods=SEARCH_SPIKE_PERIODS, time_steps=100):
+    """
+    Exhaustive search for ternary XOR networks
+
+    Returns:
+        (working, evaluated): working is a list of dicts ranked by hardware cost,
+        then by the latest first output spike over the two '1' cases
+    """
+    configs = ternary_configurations()
+    expected = np.array(lif_population.XOR_EXPECTED, dtype=bool)
+    grid = list(itertools.product(thresholds, leaks))
+    weights = np.tile(configs, (len(grid), 1))
+    threshold = np.repeat([thr for thr, _ in grid], len(configs))
+    leak = np.repeat([lk for _, lk in grid], len(configs))
+
+    working = []
+    for period in spike_periods:
+        with instrument.stage('simulate', spike_period=period, networks=len(weights)):
+            counts, first = simulate_configurations(weights, threshold, leak, period, time_steps)
+        passed = np.all((counts > 0) == expected, axis=1)
+        cost = hardware_cost(weights, leak)
+        latency = first[:, expected].max(axis=1)
+        for i in np.flatnonzero(passed):
+            working.append({
+                **{name: int(value) for name, value in zip(WEIGHT_NAMES, weights[i])},
+                'threshold': int(threshold[i]), 'leak': int(leak[i]), 'spike_period': period,
+                'hardware_cost': int(cost[i]), 'first_output_spike': int(latency[i]),
+                'output_spikes': counts[i].tolist(),
+            })
+    working.sort(key=lambda c: (c['hardware_cost'], c['first_output_spike'], c['threshold'], c['spike_period']))
+    return working, len(weights) * len(spike_periods)
+
+
+def search_main(top=20, output='ternary_search.json'):
+    """Run the exhaustive search, print the best configurations and save all of them"""
+    print("\n" + "=" * 80)
+    print(" EXHAUSTIVE TERNARY XOR SEARCH")
+    print("=" * 80)
+    print(f"Weights: 3^{len(WEIGHT_NAMES)} = {3 ** len(WEIGHT_NAMES)} assignments")
+    print(f"Thresholds {SEARCH_THRESHOLDS}, leaks {SEARCH_LEAKS}, spike periods {SEARCH_SPIKE_PERIODS}")
+    
+    start = time.perf_counter()
+    working, evaluated = search_configurations()
+    elapsed = time.perf_counter() - start
+    
+    print(f"\nEvaluated {evaluated:,} networks x 4 XOR inputs in {elapsed:.1f} s "
+          f"({4 * evaluated / elapsed:,.0f} simulations/s)")
+    print(f"Working configurations: {len(working):,}")
+    
+    print(f"\nBest {min(top, len(working))} (hardware cost = nonzero synapses + 3 if leak > 0, "
+          f"then time to first output spike):")
+    print(f"{'cost':>4} {'t_first':>7} {'thr':>3} {'leak':>4} {'period':>6}  "
+          f"{'I0H0 I1H0 I0H1 I1H1':<20} {'H0O H1O':<8} {'H0H1 H1H0':<10} {'spikes':<14}")
+    print("-" * 80)
+    for c in working[:top]:
+        print(f"{c['hardware_cost']:>4} {c['first_output_spike']:>7} {c['threshold']:>3} {c['leak']:>4} "
+              f"{c['spike_period']:>6}  {c['w_i0_h0']:>4} {c['w_i1_h0']:>4} {c['w_i0_h1']:>4} {c['w_i1_h1']:>4}  "
+              f"{c['w_h0_o']:>3} {c['w_h1_o']:>3}  {c['w_h0_h1']:>4} {c['w_h1_h0']:>4}  {str(c['output_spikes']):<14}")
+    
+    with open(output, 'w') as f:
+        json.dump({'thresholds': SEARCH_THRESHOLDS, 'leaks': SEARCH_LEAKS,
+                   'spike_periods': SEARCH_SPIKE_PERIODS, 'time_steps': 100,
+                   'evaluated': evaluated, 'working': working}, f, indent=1)
+    print(f"\nAll {len(working):,} working configurations saved to {output}")
+    print("=" * 80 + "\n")
+
+
 if __name__ == "__main__":
-    main()
+    instrument.setup()
+    if len(sys.argv) > 1 and sys.argv[1] == 'search':
+        search_main(top=int(sys.argv[2]) if len(sys.argv) > 2 else 20)
+    else:
+        main(verbose='--verbose' in sys.argv, vcd='--vcd' in sys.argv)
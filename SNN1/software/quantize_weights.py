@@ -15,6 +15,12 @@ Date: January 28, 2026
 
 import numpy as np
 import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+import instrument
 
 
 class WeightQuantizer:
@@ -176,4 +182,5 @@ def main():
 
 
 if __name__ == "__main__":
+    instrument.setup()
     main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Trace Recording and VCD Export for the Python SNN Models
+========================================================
+Replaces per-step printing with recording: every simulated step stores
+the inputs, membrane potentials and spikes in a preallocated NumPy array.
+
+- TraceRecorder: fixed signal list, preallocated [capacity, signals] array;
+  with capacity < steps it is a ring buffer that keeps the last steps
+- write_vcd(): the trace as a VCD file with the RTL hierarchy and signal
+  names (tb_snn.dut.core.hidden_neuron_0.membrane_potential, ...), so it
+  can be opened in GTKWave next to the RTL waveform or read back with
+  common/vcd_reader.py (and cosim.py)
+- Registers semantics: the values of step t change at rising clock edge t
+
+Usage: python3 snn_trace.py [xor|ternary] [output.vcd]
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+import instrument
+
+POTENTIAL_WIDTH = 8
+
+# (name relative to the core scope, bit width), as in snn_core.v / snn_core_ternary.v
+NETWORK_SIGNALS = [
+    ('spike_in_0', 1),
+    ('spike_in_1', 1),
+    ('hidden_neuron_0.membrane_potential', POTENTIAL_WIDTH),
+    ('hidden_neuron_0.spike_out', 1),
+    ('hidden_neuron_1.membrane_potential', POTENTIAL_WIDTH),
+    ('hidden_neuron_1.spike_out', 1),
+    ('output_neuron.membrane_potential', POTENTIAL_WIDTH),
+    ('output_neuron.spike_out', 1),
+]
+
+# Scope of the network core in each RTL testbench
+RTL_SCOPES = {
+    'xor': ['tb_snn', 'dut', 'core'],
+    'ternary': ['tb_snn_ternary', 'dut'],
+}
+
+
+class TraceRecorder:
+    """Per-step signal values in a preallocated int32 array (ring buffer if capacity < steps)"""
+
+    def __init__(self, signals=NETWORK_SIGNALS, capacity=1000):
+        self.names = [name for name, _ in signals]
+        self.widths = [width for _, width in signals]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.capacity = capacity
+        self.steps = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((capacity, len(signals)), dtype=np.int32)
+        self.count = 0
+
+    def reset(self):
+        self.count = 0
+
+    def record(self, step, values):
+        """Store one step's values, in signal order"""
+        row = self.count % self.capacity
+        self.steps[row] = step
+        self.values[row] = values
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def data(self):
+        """(steps [n], values [n, signals]) in time order; the oldest steps are dropped on wrap"""
+        if self.count <= self.capacity:
+            return self.steps[:self.count], self.values[:self.count]
+        start = self.count % self.capacity
+        order = np.r_[start:self.capacity, 0:start]
+        return self.steps[order], self.values[order]
+
+    def signal(self, name):
+        """Values of one signal over the recorded steps"""
+        return self.data()[1][:, self.index[name]]
+
+    def spike_steps(self, name):
+        """Steps where a 1-bit signal is high"""
+        steps, values = self.data()
+        return steps[values[:, self.index[name]] != 0]
+
+
+def _identifier(i):
+    """Short VCD identifier code (printable ASCII 33..126)"""
+    code = ''
+    i += 1
+    while i:
+        i, r = divmod(i - 1, 94)
+        code = chr(33 + r) + code
+    return code
+
+
+def write_vcd(trace, path, scope=RTL_SCOPES['xor'], clock_period=10, timescale='1ns', parameters=None):
+    """
+    Write a trace as a VCD file
+
+    Args:
+        trace: TraceRecorder
+        scope: module hierarchy of the core; the clock goes in the top module
+        clock_period: timescale units per step; values change on the rising edge
+        parameters: optional {name: int} dumped as core parameters (THRESHOLD, LEAK, ...)
+    """
+    steps, values = trace.data()
+    codes = [_identifier(i + 1) for i in range(len(trace.names))]
+    masks = [(1 << w) - 1 for w in trace.widths]
+
+    with open(path, 'w') as f:
+        f.write(f"$version\n\tsnn_trace.py\n$end\n$timescale\n\t{timescale}\n$end\n")
+        f.write(f"$scope module {scope[0]} $end\n$var reg 1 {_identifier(0)} clk $end\n")
+        for name in scope[1:]:
+            f.write(f"$scope module {name} $end\n")
+        for k, (name, value) in enumerate(sorted((parameters or {}).items())):
+            f.write(f"$var parameter 32 {_identifier(len(codes) + 1 + k)} {name} $end\n")
+
+        # Signals grouped by neuron sub-scope
+        groups = {}
+        for i, name in enumerate(trace.names):
+            sub, _, leaf = name.rpartition('.')
+            groups.setdefault(sub, []).append((i, leaf))
+        for sub, members in groups.items():
+            if sub:
+                f.write(f"$scope module {sub} $end\n")
+            for i, leaf in members:
+                width = trace.widths[i]
+                suffix = f" [{width - 1}:0]" if width > 1 else ""
+                f.write(f"$var reg {width} {codes[i]} {leaf}{suffix} $end\n")
+            if sub:
+                f.write("$upscope $end\n")
+        f.write("$upscope $end\n" * len(scope))
+        f.write("$enddefinitions $end\n")
+
+        def change(i, value):
+            value = int(value) & masks[i]
+            return f"{value}{codes[i]}\n" if trace.widths[i] == 1 else f"b{value:b} {codes[i]}\n"
+
+        f.write("#0\n$dumpvars\n" + f"0{_identifier(0)}\n")
+        for k, (name, value) in enumerate(sorted((parameters or {}).items())):
+            f.write(f"b{int(value) & 0xFFFFFFFF:b} {_identifier(len(codes) + 1 + k)}\n")
+        f.write("".join(change(i, 0) for i in range(len(codes))) + "$end\n")
+
+        previous = np.zeros(len(codes), dtype=np.int32)
+        half = clock_period // 2
+        for step, row in zip(steps, values):
+            edge = (int(step) + 1) * clock_period
+            f.write(f"#{edge - half}\n0{_identifier(0)}\n")
+            f.write(f"#{edge}\n1{_identifier(0)}\n")
+            for i in np.flatnonzero(row != previous):
+                f.write(change(i, row[i]))
+            previous = row
+        if len(steps):
+            f.write(f"#{(int(steps[-1]) + 1) * clock_period + half}\n0{_identifier(0)}\n")
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import vcd_reader
+
+    instrument.setup()
+    design = sys.argv[1] if len(sys.argv) > 1 else 'xor'
+    output = sys.argv[2] if len(sys.argv) > 2 else f'{design}_model_trace.vcd'
+
+    print("\n" + "=" * 70)
+    print(f" SNN TRACE -> VCD ({design})")
+    print("=" * 70)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if design == 'xor':
+            from model_xor import SNN_XOR
+            snn = SNN_XOR()
+            snn.simulate(0, 1, time_steps=50)
+        else:
+            from model_xor_ternary import SNN_XOR_Ternary
+            snn = SNN_XOR_Ternary(config=1, leak=0)
+            snn.simulate_spike_train(0, 1, time_steps=100, spike_period=5)
+
+    trace = snn.trace
+    write_vcd(trace, output, RTL_SCOPES[design],
+              parameters={'THRESHOLD': snn.threshold, 'LEAK': snn.leak})
+
+    # Read it back with the streaming reader used by cosim.py
+    names = [name for name, _ in NETWORK_SIGNALS]
+    samples = list(vcd_reader.iter_cycles(output, names))
+    readback = np.array([[v[name] for name in names] for _, v in samples[1:]])
+    assert np.array_equal(readback, trace.data()[1][:len(readback)] & [(1 << w) - 1 for _, w in NETWORK_SIGNALS]), \
+        "VCD readback does not match the trace"
+
+    print(f"Steps recorded: {len(trace)}")
+    print(f"Output spikes at steps: {trace.spike_steps('output_neuron.spike_out').tolist()}")
+    print(f"✓ {output} written and read back with vcd_reader.py ({len(samples)} clock edges)")
+    print("  Open with: gtkwave " + output)
+    print("=" * 70 + "\n")
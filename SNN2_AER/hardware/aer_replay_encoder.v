@@ -0,0 +1,163 @@
+// AER replay encoder: 2x2 pixels to spike events read from a precomputed schedule ROM
+// Same ports as aer_pixel_encoder; the ROM image comes from python/aer_schedule.py
+// (entry pattern * SCHEDULE_LENGTH + t = spike word of clock t, bit i = spike_out_i)
+//
+// The four period counters are only resolved when the pattern changes, as in
+// aer_schedule.ScheduledEncoder: each pixel keeps its counter at the last change (clamped to
+// period - 1, where the RTL wraps) and reads the ROM at that offset plus the clocks elapsed
+// since. Spikes and aer_addr/aer_valid match aer_pixel_encoder for any pattern sequence
+// (tb_aer_replay_encoder.v). The SPIKE_PERIOD_* / QUIET_PERIOD parameters must be the ones
+// the schedule was generated for.
+
+`timescale 1ns/1ps
+
+module aer_replay_encoder #(
+    parameter SPIKE_PERIOD_0 = 5,                  // Harness periods (aer_schedule.mem)
+    parameter SPIKE_PERIOD_1 = 5,
+    parameter SPIKE_PERIOD_2 = 5,
+    parameter SPIKE_PERIOD_3 = 5,
+    parameter QUIET_PERIOD = 100,                  // Counter period of inactive pixels
+    parameter SCHEDULE_LENGTH = 5,                 // Hyperperiod: LCM of the spike periods
+    parameter SCHEDULE_FILE = "aer_schedule.mem",  // python aer_schedule.py [file] [periods]
+    parameter PIXEL_WIDTH = 1
+) (
+    input  wire clk,
+    input  wire rst_n,
+    input  wire enable,
+
+    input  wire [PIXEL_WIDTH-1:0] pixel_0,
+    input  wire [PIXEL_WIDTH-1:0] pixel_1,
+    input  wire [PIXEL_WIDTH-1:0] pixel_2,
+    input  wire [PIXEL_WIDTH-1:0] pixel_3,
+
+    // AER outputs (4 channels, one per pixel)
+    output reg spike_out_0,
+    output reg spike_out_1,
+    output reg spike_out_2,
+    output reg spike_out_3,
+
+    // AER address output (which neuron is spiking)
+    output reg [1:0] aer_addr,       // 2-bit address for 4 inputs
+    output reg aer_valid             // Valid spike event on aer_addr
+);
+
+    localparam INDEX_WIDTH = (SCHEDULE_LENGTH > 1) ? $clog2(SCHEDULE_LENGTH) : 1;
+    localparam QUIET_WIDTH = (QUIET_PERIOD > 1) ? $clog2(QUIET_PERIOD) : 1;
+
+    // Spike words of all 16 patterns over one hyperperiod
+    reg [3:0] schedule [0:16*SCHEDULE_LENGTH-1];
+
+    // Encoder state, resolved on pattern changes only
+    reg [3:0] held;                        // Pattern of the previous clock
+    reg [7:0] base [0:3];                  // Counter of each pixel at the last change
+    reg [INDEX_WIDTH-1:0] elapsed;         // Clocks since the last change, mod SCHEDULE_LENGTH
+    reg [QUIET_WIDTH-1:0] elapsed_quiet;   // Clocks since the last change, mod QUIET_PERIOD
+
+    wire [3:0] pattern = {pixel_3 > 0, pixel_2 > 0, pixel_1 > 0, pixel_0 > 0};
+    wire change = (pattern != held);
+
+    function integer spike_period;
+        input integer pixel;
+        case (pixel)
+            0: spike_period = SPIKE_PERIOD_0;
+            1: spike_period = SPIKE_PERIOD_1;
+            2: spike_period = SPIKE_PERIOD_2;
+            default: spike_period = SPIKE_PERIOD_3;
+        endcase
+    endfunction
+
+    // State and spike word of this clock
+    reg [7:0] base_now [0:3];
+    reg [INDEX_WIDTH-1:0] elapsed_now;
+    reg [QUIET_WIDTH-1:0] elapsed_quiet_now;
+    reg [3:0] word;
+    integer i, counter, period, index;
+
+    always @(*) begin
+        elapsed_now = change ? 0 : elapsed;
+        elapsed_quiet_now = change ? 0 : elapsed_quiet;
+        for (i = 0; i < 4; i = i + 1) begin
+            // Counter under the held pattern (closed form; each spike period divides SCHEDULE_LENGTH)
+            if (held[i])
+                counter = (base[i] + elapsed) % spike_period(i);
+            else
+                counter = (base[i] + elapsed_quiet) % QUIET_PERIOD;
+
+            // On a change the counter becomes the new offset; at or past period - 1 it wraps now
+            period = pattern[i] ? spike_period(i) : QUIET_PERIOD;
+            if (change)
+                base_now[i] = (counter < period - 1) ? counter : period - 1;
+            else
+                base_now[i] = base[i];
+
+            index = (base_now[i] + elapsed_now) % SCHEDULE_LENGTH;
+            word[i] = schedule[pattern * SCHEDULE_LENGTH + index][i];
+        end
+    end
+
+    initial begin
+        $readmemh(SCHEDULE_FILE, schedule);
+        $display("[AER_REPLAY] %0d-clock schedule loaded from %0s", SCHEDULE_LENGTH, SCHEDULE_FILE);
+    end
+
+    integer j;
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            held <= 0;
+            for (j = 0; j < 4; j = j + 1)
+                base[j] <= 0;
+            elapsed <= 0;
+            elapsed_quiet <= 0;
+            spike_out_0 <= 0;
+            spike_out_1 <= 0;
+            spike_out_2 <= 0;
+            spike_out_3 <= 0;
+            aer_addr <= 0;
+            aer_valid <= 0;
+        end else if (enable) begin
+            held <= pattern;
+            for (j = 0; j < 4; j = j + 1)
+                base[j] <= base_now[j];
+            elapsed <= (elapsed_now == SCHEDULE_LENGTH - 1) ? 0 : elapsed_now + 1;
+            elapsed_quiet <= (elapsed_quiet_now == QUIET_PERIOD - 1) ? 0 : elapsed_quiet_now + 1;
+
+            spike_out_0 <= word[0];
+            spike_out_1 <= word[1];
+            spike_out_2 <= word[2];
+            spike_out_3 <= word[3];
+            aer_valid <= 0;
+
+            // Address priority as in aer_pixel_encoder
+            if (word[0]) begin
+                aer_addr <= 2'b00;
+                aer_valid <= 1;
+            end
+            if (word[1] && !aer_valid) begin
+                aer_addr <= 2'b01;
+                aer_valid <= 1;
+            end
+            if (word[2] && !aer_valid) begin
+                aer_addr <= 2'b10;
+                aer_valid <= 1;
+            end
+            if (word[3] && !aer_valid) begin
+                aer_addr <= 2'b11;
+                aer_valid <= 1;
+            end
+        end else begin
+            // Disabled: reset counters
+            held <= pattern;
+            for (j = 0; j < 4; j = j + 1)
+                base[j] <= 0;
+            elapsed <= 0;
+            elapsed_quiet <= 0;
+            spike_out_0 <= 0;
+            spike_out_1 <= 0;
+            spike_out_2 <= 0;
+            spike_out_3 <= 0;
+            aer_valid <= 0;
+        end
+    end
+
+endmodule
@@ -40,7 +40,10 @@ module snn_core_pattern_recognition #(
 );
 
     // Include appropriate weight file
-    `ifdef USE_MANUAL_WEIGHTS
+    // RUNTIME_WEIGHTS: weights are registers written by the Verilator harness
+    `ifdef RUNTIME_WEIGHTS
+        `include "weight_registers_runtime.vh"
+    `elsif USE_MANUAL_WEIGHTS
         `include "weight_parameters_manual.vh"
     `else
         `include "weight_parameters.vh"
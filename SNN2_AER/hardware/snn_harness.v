@@ -0,0 +1,75 @@
+// Harness top for the Verilator server: AER encoder + SNN core, configured like tb_snn_pattern_recognition
+// Driven cycle by cycle from verilator/snn_sim_server.cpp
+
+`timescale 1ns/1ps
+
+module snn_harness (
+    input  wire clk,
+    input  wire rst_n,
+    input  wire [3:0] pattern,
+    
+    input  wire signed [3:0] bias_output_0,
+    input  wire signed [3:0] bias_output_1,
+    input  wire signed [3:0] bias_output_2,
+    
+    output wire spike_out_0,
+    output wire spike_out_1,
+    output wire spike_out_2,
+    output wire [1:0] winner
+);
+
+    wire spike_in_0, spike_in_1, spike_in_2, spike_in_3;
+    
+    // Unused debug outputs
+    wire [7:0] pot_h0, pot_h1, pot_h2, pot_h3, pot_h4, pot_h5, pot_h6, pot_h7;
+    wire [7:0] pot_o0, pot_o1, pot_o2;
+    wire [1:0] aer_addr;
+    wire aer_valid;
+    
+    aer_pixel_encoder #(
+        .SPIKE_PERIOD_0(5),
+        .SPIKE_PERIOD_1(5),
+        .SPIKE_PERIOD_2(5),
+        .SPIKE_PERIOD_3(5),
+        .QUIET_PERIOD(100)
+    ) aer_enc (
+        .clk(clk),
+        .rst_n(rst_n),
+        .enable(1'b1),
+        .pixel_0(pattern[0]),
+        .pixel_1(pattern[1]),
+        .pixel_2(pattern[2]),
+        .pixel_3(pattern[3]),
+        .spike_out_0(spike_in_0),
+        .spike_out_1(spike_in_1),
+        .spike_out_2(spike_in_2),
+        .spike_out_3(spike_in_3),
+        .aer_addr(aer_addr),
+        .aer_valid(aer_valid)
+    );
+    
+    snn_core_pattern_recognition #(
+        .THRESHOLD_HIDDEN(20),
+        .THRESHOLD_OUTPUT(30),
+        .LEAK(1),
+        .POTENTIAL_WIDTH(8)
+    ) core (
+        .clk(clk),
+        .rst_n(rst_n),
+        .spike_in_0(spike_in_0),
+        .spike_in_1(spike_in_1),
+        .spike_in_2(spike_in_2),
+        .spike_in_3(spike_in_3),
+        .bias_output_0(bias_output_0),
+        .bias_output_1(bias_output_1),
+        .bias_output_2(bias_output_2),
+        .spike_out_0(spike_out_0),
+        .spike_out_1(spike_out_1),
+        .spike_out_2(spike_out_2),
+        .winner(winner),
+        .pot_h0(pot_h0), .pot_h1(pot_h1), .pot_h2(pot_h2), .pot_h3(pot_h3),
+        .pot_h4(pot_h4), .pot_h5(pot_h5), .pot_h6(pot_h6), .pot_h7(pot_h7),
+        .pot_o0(pot_o0), .pot_o1(pot_o1), .pot_o2(pot_o2)
+    );
+
+endmodule
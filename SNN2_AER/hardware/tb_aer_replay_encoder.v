@@ -0,0 +1,136 @@
+// Testbench: aer_replay_encoder against aer_pixel_encoder
+// Random patterns held for 1-120 clocks, most followed by 50 clocks of pattern 0 as in
+// snn_harness / TEST_SUITE, with occasional enable drops; no reset between patterns.
+// Every clock compares spike_out_0..3, aer_addr and aer_valid of both encoders.
+//
+// The schedule must match the periods (defaults: harness periods, aer_schedule.mem), e.g.
+//   python ../python/aer_schedule.py build/aer_schedule_default.mem 5 7 11 13
+//   -GP1=7 -GP2=11 -GP3=13 -GLENGTH=5005 -GMEM='"build/aer_schedule_default.mem"'
+
+`timescale 1ns/1ps
+
+module tb_aer_replay_encoder;
+
+    parameter P0 = 5;
+    parameter P1 = 5;
+    parameter P2 = 5;
+    parameter P3 = 5;
+    parameter QUIET = 100;
+    parameter LENGTH = 5;
+    parameter MEM = "aer_schedule.mem";
+    parameter PHASES = 400;
+
+    reg clk;
+    reg rst_n;
+    reg enable;
+    reg [3:0] pattern;
+
+    wire [3:0] spikes_ref, spikes_dut;
+    wire [1:0] addr_ref, addr_dut;
+    wire valid_ref, valid_dut;
+
+    aer_pixel_encoder #(
+        .SPIKE_PERIOD_0(P0),
+        .SPIKE_PERIOD_1(P1),
+        .SPIKE_PERIOD_2(P2),
+        .SPIKE_PERIOD_3(P3),
+        .QUIET_PERIOD(QUIET)
+    ) reference (
+        .clk(clk), .rst_n(rst_n), .enable(enable),
+        .pixel_0(pattern[0]), .pixel_1(pattern[1]), .pixel_2(pattern[2]), .pixel_3(pattern[3]),
+        .spike_out_0(spikes_ref[0]), .spike_out_1(spikes_ref[1]),
+        .spike_out_2(spikes_ref[2]), .spike_out_3(spikes_ref[3]),
+        .aer_addr(addr_ref), .aer_valid(valid_ref)
+    );
+
+    aer_replay_encoder #(
+        .SPIKE_PERIOD_0(P0),
+        .SPIKE_PERIOD_1(P1),
+        .SPIKE_PERIOD_2(P2),
+        .SPIKE_PERIOD_3(P3),
+        .QUIET_PERIOD(QUIET),
+        .SCHEDULE_LENGTH(LENGTH),
+        .SCHEDULE_FILE(MEM)
+    ) dut (
+        .clk(clk), .rst_n(rst_n), .enable(enable),
+        .pixel_0(pattern[0]), .pixel_1(pattern[1]), .pixel_2(pattern[2]), .pixel_3(pattern[3]),
+        .spike_out_0(spikes_dut[0]), .spike_out_1(spikes_dut[1]),
+        .spike_out_2(spikes_dut[2]), .spike_out_3(spikes_dut[3]),
+        .aer_addr(addr_dut), .aer_valid(valid_dut)
+    );
+
+    // Clock generation (100 MHz)
+    initial begin
+        clk = 0;
+        forever #5 clk = ~clk;
+    end
+
+    integer seed = 1;
+    integer cycles = 0;
+    integer spikes = 0;
+    integer mismatches = 0;
+    integer phase, clocks;
+
+    // Compare on the falling edge, after both encoders registered their outputs
+    always @(negedge clk) begin
+        if (rst_n) begin
+            cycles = cycles + 1;
+            if (valid_ref)
+                spikes = spikes + 1;
+            if (spikes_dut !== spikes_ref || valid_dut !== valid_ref ||
+                (valid_ref && addr_dut !== addr_ref)) begin
+                if (mismatches < 10)
+                    $display("MISMATCH t=%0t pattern=%b: spikes %b/%b valid %b/%b addr %0d/%0d (replay/reference)",
+                             $time, pattern, spikes_dut, spikes_ref, valid_dut, valid_ref,
+                             addr_dut, addr_ref);
+                mismatches = mismatches + 1;
+            end
+        end
+    end
+
+    // Stimulus changes 1 ns after the rising edge
+    task wait_clocks;
+        input integer n;
+        begin
+            repeat (n) @(posedge clk);
+            #1;
+        end
+    endtask
+
+    initial begin
+        rst_n = 0;
+        enable = 1;
+        pattern = 0;
+        #21 rst_n = 1;
+
+        for (phase = 0; phase < PHASES; phase = phase + 1) begin
+            pattern = $random(seed);
+            clocks = 1 + {$random(seed)} % 120;
+            wait_clocks(clocks);
+
+            if ({$random(seed)} % 4 != 0) begin
+                pattern = 0;
+                wait_clocks(50);
+            end
+            if ({$random(seed)} % 16 == 0) begin
+                enable = 0;
+                wait_clocks(1 + {$random(seed)} % 5);
+                enable = 1;
+            end
+        end
+        @(negedge clk);
+
+        $display("===================================================================");
+        $display("aer_replay_encoder vs aer_pixel_encoder (periods %0d/%0d/%0d/%0d, quiet %0d)",
+                 P0, P1, P2, P3, QUIET);
+        $display("  %0d pattern phases, %0d clocks, %0d reference events", PHASES, cycles, spikes);
+        $display("  Mismatching clocks: %0d", mismatches);
+        if (mismatches == 0)
+            $display("PASS");
+        else
+            $display("FAIL");
+        $display("===================================================================");
+        $finish;
+    end
+
+endmodule
@@ -0,0 +1,121 @@
+// Persistent Verilator simulation server for snn_harness (AER encoder + SNN core)
+//
+// Line protocol on stdin; replies on stdout start with '@' (RTL $display
+// output is interleaved and ignored by the Python client):
+//   WEIGHTS <32 input->hidden (i-major)> <24 hidden->output (h-major)>  -> @OK
+//   RESET                                                              -> @OK
+//   RUN <pattern 0-15> <bias0> <bias1> <bias2> <cycles>                -> @RESULT <c0> <c1> <c2> <winner>
+//   QUIT
+//
+// RUN mirrors present_pattern in tb_snn_pattern_recognition.v: apply the
+// pattern for <cycles> clocks, report spike counts and winner, then hold
+// the pattern at 0 for 50 separation cycles.
+
+#include <cstdio>
+#include <iostream>
+#include <sstream>
+#include <string>
+#include "verilated.h"
+#include "verilated_syms.h"
+#include "Vsnn_harness.h"
+
+static const int NUM_INPUTS = 4;
+static const int NUM_HIDDEN = 8;
+static const int NUM_OUTPUTS = 3;
+static const int SEPARATION_CYCLES = 50;
+
+static Vsnn_harness* top;
+
+static void tick() {
+    top->clk = 0;
+    top->eval();
+    top->clk = 1;
+    top->eval();
+}
+
+static bool write_weight(const VerilatedScope* scope, const std::string& name, int value) {
+    const VerilatedVar* var = scope->varFind(name.c_str());
+    if (!var) return false;
+    *static_cast<CData*>(var->datap()) = static_cast<CData>(value & 0xFF);
+    return true;
+}
+
+static void reset() {
+    top->rst_n = 0;
+    top->pattern = 0;
+    top->bias_output_0 = 0;
+    top->bias_output_1 = 0;
+    top->bias_output_2 = 0;
+    for (int i = 0; i < 10; i++) tick();
+    top->rst_n = 1;
+    for (int i = 0; i < 5; i++) tick();
+}
+
+int main(int argc, char** argv) {
+    VerilatedContext* contextp = new VerilatedContext;
+    contextp->commandArgs(argc, argv);
+    top = new Vsnn_harness{contextp};
+
+    const VerilatedScope* scope = contextp->scopeFind("TOP.snn_harness.core");
+    if (!scope) {
+        std::cout << "@ERROR core scope not found (build with +define+RUNTIME_WEIGHTS)" << std::endl;
+        return 1;
+    }
+
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::istringstream in(line);
+        std::string cmd;
+        in >> cmd;
+
+        if (cmd == "WEIGHTS") {
+            bool ok = true;
+            int value;
+            for (int i = 0; i < NUM_INPUTS; i++)
+                for (int h = 0; h < NUM_HIDDEN; h++) {
+                    in >> value;
+                    ok &= write_weight(scope, "WEIGHT_I" + std::to_string(i) + "_H" + std::to_string(h), value);
+                }
+            for (int h = 0; h < NUM_HIDDEN; h++)
+                for (int o = 0; o < NUM_OUTPUTS; o++) {
+                    in >> value;
+                    ok &= write_weight(scope, "WEIGHT_H" + std::to_string(h) + "_O" + std::to_string(o), value);
+                }
+            std::cout << (ok && in ? "@OK" : "@ERROR bad WEIGHTS") << std::endl;
+        } else if (cmd == "RESET") {
+            reset();
+            std::cout << "@OK" << std::endl;
+        } else if (cmd == "RUN") {
+            int pattern, b0, b1, b2, cycles;
+            in >> pattern >> b0 >> b1 >> b2 >> cycles;
+            top->pattern = pattern & 0xF;
+            top->bias_output_0 = b0 & 0xF;
+            top->bias_output_1 = b1 & 0xF;
+            top->bias_output_2 = b2 & 0xF;
+
+            int counts[NUM_OUTPUTS] = {0, 0, 0};
+            for (int c = 0; c < cycles; c++) {
+                counts[0] += top->spike_out_0;
+                counts[1] += top->spike_out_1;
+                counts[2] += top->spike_out_2;
+                tick();
+            }
+            int winner = top->winner;
+
+            top->pattern = 0;
+            for (int c = 0; c < SEPARATION_CYCLES; c++) tick();
+
+            std::cout << "@RESULT " << counts[0] << " " << counts[1] << " " << counts[2]
+                      << " " << winner << std::endl;
+        } else if (cmd == "QUIT") {
+            break;
+        } else if (!cmd.empty()) {
+            std::cout << "@ERROR unknown command " << cmd << std::endl;
+        }
+    }
+
+    top->final();
+    delete top;
+    delete contextp;
+    return 0;
+}
@@ -0,0 +1,61 @@
+// Runtime-writable weights for the Verilator simulation server (RUNTIME_WEIGHTS)
+// Same names as weight_parameters.vh; the server in verilator/snn_sim_server.cpp
+// writes them through the public scope, so new weights need no rebuild
+
+reg signed [7:0] WEIGHT_I0_H0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I0_H1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I0_H2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I0_H3 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I0_H4 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I0_H5 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I0_H6 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I0_H7 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H3 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H4 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H5 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H6 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I1_H7 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H3 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H4 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H5 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H6 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I2_H7 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H3 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H4 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H5 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H6 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_I3_H7 /*verilator public_flat_rw*/;
+
+reg signed [7:0] WEIGHT_H0_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H0_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H0_O2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H1_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H1_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H1_O2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H2_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H2_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H2_O2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H3_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H3_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H3_O2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H4_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H4_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H4_O2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H5_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H5_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H5_O2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H6_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H6_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H6_O2 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H7_O0 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H7_O1 /*verilator public_flat_rw*/;
+reg signed [7:0] WEIGHT_H7_O2 /*verilator public_flat_rw*/;
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Event-Driven AER Simulation Engine
+
+Simulates lif_neuron_stdp networks from address events instead of updating
+every neuron on every clock:
+- Synapses in CSR form (indptr / indices / weights per source address), so a
+  spike only touches its own fan-out
+- A priority queue (heapq) of address events keyed by clock edge: spike
+  deliveries, plus wake-ups for neurons whose bias drives them to threshold
+  without any input
+- Leak is applied lazily: a neuron is only brought up to date when an event
+  reaches it, with V = max(0, V + idle_cycles * (bias - LEAK))
+- Same register semantics as rtl_model.py: spike one clock after reaching
+  THRESHOLD with the input of that clock dropped, one clock per layer,
+  POTENTIAL_WIDTH + 1 bit wrap of V + I + bias - LEAK, zero-extended 4-bit bias
+
+Cost grows with spike activity (events x fan-out), not neurons x clocks.
+run_suite_events() replays TEST_SUITE on snn_core_pattern_recognition and must
+give the same spike counts and winners as the time-stepped rtl_model.HarnessModel.
+
+Usage: python aer_event_sim.py [hidden_neurons] [cycles]   (validation + 784-input benchmark)
+"""
+
+import heapq
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+import rtl_model
+from rtl_model import wrap
+from verilator_backend import N_INPUT, N_HIDDEN, N_OUTPUT, TEST_SUITE, load_weight_file
+
+DELIVER, WAKE = 0, 1
+NEVER = np.iinfo(np.int64).max // 4
+
+
+def csr_from_dense(matrix):
+    """Dense [sources, targets] weights -> (indptr, indices, weights) without zero synapses"""
+    matrix = np.asarray(matrix)
+    sources, targets = np.nonzero(matrix)
+    indptr = np.zeros(len(matrix) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=len(matrix)), out=indptr[1:])
+    return indptr, targets.astype(np.int64), matrix[sources, targets].astype(np.int64)
+
+
+class EventNetwork:
+    """
+    lif_neuron_stdp network driven by address events
+
+    Args:
+        indptr, indices, weights: CSR synapses, row = source address
+        threshold: per address (addresses that only receive input events use NEVER)
+        drift: bias - LEAK per address
+    """
+
+    def __init__(self, indptr, indices, weights, threshold, drift, potential_width=rtl_model.POTENTIAL_WIDTH):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.size = len(self.indptr) - 1
+        self.threshold = np.broadcast_to(np.asarray(threshold, dtype=np.int64), (self.size,)).copy()
+        self.drift = np.broadcast_to(np.asarray(drift, dtype=np.int64), (self.size,)).copy()
+        self.width = potential_width
+        self.reset()
+
+    @classmethod
+    def from_layers(cls, weights, thresholds, drifts, potential_width=rtl_model.POTENTIAL_WIDTH):
+        """
+        Layered network: weights[k] is dense [n_k, n_k+1]; layer 0 is the input layer
+
+        Addresses are assigned layer by layer (inputs first); self.offsets[k] is the
+        first address of layer k.
+        """
+        sizes = [len(weights[0])] + [np.shape(w)[1] for w in weights]
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        full = np.zeros((offsets[-1], offsets[-1]), dtype=np.int64)
+        for k, w in enumerate(weights):
+            full[offsets[k]:offsets[k + 1], offsets[k + 1]:offsets[k + 2]] = w
+        threshold = np.concatenate([np.full(sizes[0], NEVER)] +
+                                   [np.full(n, t) for n, t in zip(sizes[1:], thresholds)])
+        drift = np.concatenate([np.zeros(sizes[0], dtype=np.int64)] +
+                               [np.broadcast_to(d, (n,)) for n, d in zip(sizes[1:], drifts)])
+        network = cls(*csr_from_dense(full), threshold, drift, potential_width)
+        network.offsets = offsets
+        return network
+
+    def reset(self):
+        """All potentials 0 before clock edge 0, empty event queue"""
+        self.potential = np.zeros(self.size, dtype=np.int64)
+        self.last = np.full(self.size, -1, dtype=np.int64)      # edge the potential is valid after
+        self.version = np.zeros(self.size, dtype=np.int64)      # invalidates stale wake-ups
+        self.queue = []
+        self.sequence = 0
+        self.spike_log = []
+        self.synaptic_events = 0
+        self.neuron_updates = 0
+
+    def _push(self, edge, kind, addresses, versions=None):
+        heapq.heappush(self.queue, (int(edge), self.sequence, kind, addresses, versions))
+        self.sequence += 1
+
+    def schedule_input(self, edges, addresses):
+        """Input address events: spike_out of `addresses` is high after clock `edges`"""
+        edges = np.asarray(edges, dtype=np.int64)
+        addresses = np.asarray(addresses, dtype=np.int64)
+        order = np.argsort(edges, kind='stable')
+        edges, addresses = edges[order], addresses[order]
+        starts = np.flatnonzero(np.r_[True, edges[1:] != edges[:-1]])
+        for start, stop in zip(starts, np.r_[starts[1:], len(edges)]):
+            self._push(edges[start] + 1, DELIVER, addresses[start:stop])
+
+    def _catch_up(self, neurons, edge):
+        """Apply the idle clocks up to `edge` (no input, no threshold crossing) lazily"""
+        idle = edge - self.last[neurons]
+        behind = idle > 0
+        neurons, idle = neurons[behind], idle[behind]
+        self.potential[neurons] = np.maximum(self.potential[neurons] + idle * self.drift[neurons], 0)
+        self.last[neurons] = edge
+
+    def _schedule_wake(self, neurons):
+        """Neurons with positive drift reach threshold on their own: queue that edge"""
+        neurons = neurons[(self.drift[neurons] > 0) & (self.potential[neurons] < self.threshold[neurons])]
+        if len(neurons):
+            needed = self.threshold[neurons] - self.potential[neurons]
+            wake = self.last[neurons] + -(-needed // self.drift[neurons])
+            for edge in np.unique(wake):
+                chosen = neurons[wake == edge]
+                self._push(edge, WAKE, chosen, self.version[chosen].copy())
+
+    def set_drift(self, edge, neurons, drift):
+        """Change bias - LEAK of `neurons` from clock `edge` on (call before running to `edge`)"""
+        neurons = np.asarray(neurons, dtype=np.int64)
+        self._catch_up(neurons, edge - 1)
+        self.version[neurons] += 1
+        self.drift[neurons] = drift
+        self._schedule_wake(neurons)
+
+    def _step(self, edge, targets, current):
+        """Clock `edge` for the neurons that receive input (or wake up) at it"""
+        live = self.last[targets] < edge         # last == edge: firing this clock, input dropped
+        targets, current = targets[live], current[live]
+        self._catch_up(targets, edge - 1)
+
+        potential = np.maximum(wrap(self.potential[targets] + wrap(current, self.width + 1)
+                                    + self.drift[targets], self.width + 1), 0)
+        fire = potential >= self.threshold[targets]
+        self.potential[targets] = np.where(fire, 0, potential)
+        self.last[targets] = np.where(fire, edge + 1, edge)
+        self.version[targets] += 1
+        self.neuron_updates += len(targets)
+
+        fired = targets[fire]
+        if len(fired):
+            self.spike_log.append((edge + 1, fired))
+            self._push(edge + 2, DELIVER, fired)
+        self._schedule_wake(targets)
+
+    def run(self, until):
+        """Process every event up to and including clock edge `until`"""
+        while self.queue and self.queue[0][0] <= until:
+            edge = self.queue[0][0]
+            sources, woken = [], []
+            while self.queue and self.queue[0][0] == edge:
+                _, _, kind, addresses, versions = heapq.heappop(self.queue)
+                if kind == DELIVER:
+                    sources.append(addresses)
+                else:
+                    woken.append(addresses[self.version[addresses] == versions])
+
+            targets, weights = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+            for source in np.concatenate(sources) if sources else []:
+                start, stop = self.indptr[source], self.indptr[source + 1]
+                targets.append(self.indices[start:stop])
+                weights.append(self.weights[start:stop])
+            targets, weights = np.concatenate(targets + woken), np.concatenate(weights)
+            self.synaptic_events += len(weights)
+            weights = np.concatenate([weights, np.zeros(len(targets) - len(weights), dtype=np.int64)])
+
+            if len(targets):
+                unique, inverse = np.unique(targets, return_inverse=True)
+                self._step(edge, unique, np.bincount(inverse, weights=weights).astype(np.int64))
+
+    def spikes(self):
+        """All output events so far: (edges, addresses), spike_out high after each edge"""
+        if not self.spike_log:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        edges = np.concatenate([np.full(len(a), e) for e, a in self.spike_log])
+        return edges, np.concatenate([a for _, a in self.spike_log])
+
+
+def encoder_events(phases, periods=rtl_model.SPIKE_PERIODS, quiet_period=rtl_model.QUIET_PERIOD):
+    """
+    aer_pixel_encoder output as address events, without stepping it clock by clock
+
+    Args:
+        phases: list of (pattern, clocks) applied back to back from clock edge 0
+            with the counters at 0
+
+    Returns:
+        (edges, channels): spike_out_<channel> is high after each edge
+    """
+    edges, channels = [], []
+    for channel, active_period in enumerate(periods):
+        counter, start = 0, 0
+        for pattern, clocks in phases:
+            active = (pattern >> channel) & 1
+            period = active_period if active else quiet_period
+            first = start + max(0, period - 1 - counter)
+            end = start + clocks - 1
+            if first <= end:
+                wraps = np.arange(first, end + 1, period)
+                if active:
+                    edges.append(wraps)
+                    channels.append(np.full(len(wraps), channel))
+                counter = end - wraps[-1]
+            else:
+                counter += clocks
+            start += clocks
+    if not edges:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(edges), np.concatenate(channels)
+
+
+def pattern_network(weights_ih, weights_ho, threshold_hidden=rtl_model.THRESHOLD_HIDDEN,
+                    threshold_output=rtl_model.THRESHOLD_OUTPUT, leak=rtl_model.LEAK):
+    """EventNetwork of snn_core_pattern_recognition: addresses 0-3 inputs, 4-11 hidden, 12-14 outputs"""
+    return EventNetwork.from_layers([weights_ih, weights_ho], [threshold_hidden, threshold_output],
+                                    [-leak, -leak])
+
+
+def run_suite_events(weights_ih, weights_ho, suite=TEST_SUITE):
+    """
+    TEST_SUITE on the event engine, with the clocking of snn_sim_server.cpp
+
+    Returns:
+        list of (spike counts [3], winner) per test, like HarnessModel.run_suite for one weight set
+    """
+    network = pattern_network(weights_ih, weights_ho)
+    outputs = np.arange(network.offsets[2], network.offsets[3])
+
+    phases = [(0, rtl_model.RESET_CYCLES)]
+    for pattern, _, _, cycles in suite:
+        phases += [(pattern, cycles), (0, rtl_model.SEPARATION_CYCLES)]
+    network.schedule_input(*encoder_events(phases))
+
+    windows = []
+    start = rtl_model.RESET_CYCLES
+    for _, _, biases, cycles in suite:
+        network.run(start - 1)
+        network.set_drift(start, outputs, rtl_model.bias_value(biases) - rtl_model.LEAK)
+        windows.append((start, cycles))
+        start += cycles + rtl_model.SEPARATION_CYCLES
+    network.run(start)
+
+    edges, addresses = network.spikes()
+    is_output = addresses >= network.offsets[2]
+    edges, neuron = edges[is_output], addresses[is_output] - network.offsets[2]
+
+    results = []
+    for start, cycles in windows:
+        # RUN samples spike_out before each of its clocks; winner uses the core's counters
+        sampled = (edges >= start - 1) & (edges <= start + cycles - 2)
+        counts = np.bincount(neuron[sampled], minlength=N_OUTPUT)
+        total = np.bincount(neuron[edges <= start + cycles - 3], minlength=N_OUTPUT)
+        results.append((counts, int(rtl_model.winner_of(total))))
+    return results
+
+
+def time_stepped_run(network, input_edges, input_addresses, cycles):
+    """
+    Reference for a large EventNetwork: every neuron updated on every clock (dense matrix)
+
+    Returns:
+        spike counts per address over clock edges 0 .. cycles - 1
+    """
+    dense = np.zeros((network.size, network.size), dtype=np.float32)
+    for source in range(network.size):
+        start, stop = network.indptr[source], network.indptr[source + 1]
+        dense[source, network.indices[start:stop]] = network.weights[start:stop]
+    forced = np.zeros((cycles, network.size), dtype=bool)
+    keep = input_edges < cycles
+    forced[input_edges[keep], input_addresses[keep]] = True
+
+    potential = np.zeros(network.size, dtype=np.int64)
+    spikes = np.zeros(network.size, dtype=bool)
+    counts = np.zeros(network.size, dtype=np.int64)
+    for edge in range(cycles):
+        current = (spikes.astype(np.float32) @ dense).astype(np.int64)
+        potential, spikes = rtl_model.lif_step(potential, wrap(current, network.width + 1),
+                                               network.threshold, network.drift, network.width)
+        spikes |= forced[edge]
+        counts += spikes
+    return counts
+
+
+def mnist_scale_network(num_hidden=1000, num_outputs=10, fan_in=0.05, seed=0):
+    """Random sparse 784 -> hidden -> outputs AER network (excitatory and inhibitory synapses)"""
+    rng = np.random.default_rng(seed)
+    layers = []
+    for n_in, n_out, low, high in [(784, num_hidden, -4, 12), (num_hidden, num_outputs, -3, 8)]:
+        w = rng.integers(low, high, size=(n_in, n_out))
+        layers.append(np.where(rng.random((n_in, n_out)) < fan_in, w, 0))
+    return EventNetwork.from_layers(layers, [20, 30], [-1, -1])
+
+
+def mnist_scale_inputs(active_fraction, cycles, seed=0):
+    """AER events of a random 28x28 binary image: each active pixel spikes with its own period (5-13)"""
+    rng = np.random.default_rng(seed)
+    active = np.flatnonzero(rng.random(784) < active_fraction)
+    periods = rng.integers(5, 14, size=len(active))
+    phases = rng.integers(0, 5, size=len(active))
+    edges = [np.arange(phase, cycles, period) for phase, period in zip(phases, periods)]
+    return np.concatenate(edges), np.repeat(active, [len(e) for e in edges])
+
+
+def compare_suite(weights_ih, weights_ho):
+    """Per-test (model result, event result) of the time-stepped and event-driven simulations"""
+    model = rtl_model.HarnessModel(weights_ih, weights_ho).run_suite()
+    events = run_suite_events(weights_ih, weights_ho)
+    return [((counts[0].tolist(), int(winner[0])), (e_counts.tolist(), e_winner))
+            for (counts, winner), (e_counts, e_winner) in zip(model, events)]
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    num_hidden = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cycles = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    print("="*60)
+    print("Event-driven AER engine")
+    print("="*60)
+
+    # Validation: reference weights and random weight sets vs the time-stepped model
+    weights_ih, weights_ho = load_weight_file('../hardware/weight_parameters.vh')
+    rng = np.random.default_rng(1)
+    weight_sets = [('weight_parameters.vh', weights_ih, weights_ho)] + \
+        [(f'perturbed set {n}', weights_ih, np.clip(weights_ho + rng.integers(-3, 4, weights_ho.shape), -15, 15))
+         for n in range(1, 5)] + \
+        [(f'wide-range set {n}', rng.integers(-60, 120, size=(N_INPUT, N_HIDDEN)),
+          rng.integers(-60, 120, size=(N_HIDDEN, N_OUTPUT))) for n in range(1, 3)]
+
+    print("\nTEST_SUITE: time-stepped rtl_model vs event engine (counts + winner per test)")
+    all_match = True
+    with instrument.stage('validate'):
+        for name, w_ih, w_ho in weight_sets:
+            rows = compare_suite(w_ih, w_ho)
+            match = all(model == event for model, event in rows)
+            all_match &= match
+            rate = sum(event[1] == test[1] for (_, event), test in zip(rows, TEST_SUITE)) / len(TEST_SUITE)
+            print(f"  {name:<22} success rate {rate * 100:5.1f}%  {'✓ identical' if match else '✗ MISMATCH'}")
+
+    print(f"\n784 -> {num_hidden} -> 10 sparse network, {cycles} clocks")
+    print(f"{'active px':>9} {'input ev':>9} {'syn events':>11} {'event s':>8} {'stepped s':>9} "
+          f"{'speedup':>7}  counts")
+    for fraction in [0.02, 0.1, 0.3]:
+        network = mnist_scale_network(num_hidden)
+        edges, addresses = mnist_scale_inputs(fraction, cycles)
+        with instrument.stage('event engine'):
+            start = time.perf_counter()
+            network.schedule_input(edges, addresses)
+            network.run(cycles - 1)
+            event_time = time.perf_counter() - start
+        spike_edges, spike_addresses = network.spikes()
+        event_counts = np.bincount(spike_addresses[spike_edges < cycles], minlength=network.size)
+        event_counts[:784] = np.bincount(addresses, minlength=network.size)[:784]
+
+        with instrument.stage('time-stepped'):
+            start = time.perf_counter()
+            stepped_counts = time_stepped_run(network, edges, addresses, cycles)
+            stepped_time = time.perf_counter() - start
+        match = np.array_equal(event_counts, stepped_counts)
+        all_match &= match
+        print(f"{fraction:>9.0%} {len(edges):>9,} {network.synaptic_events:>11,} {event_time:>8.2f} "
+              f"{stepped_time:>9.2f} {stepped_time / event_time:>6.1f}x  {'✓ identical' if match else '✗ MISMATCH'}")
+
+    print(f"\n{'✓ Event engine matches the time-stepped models' if all_match else '✗ Event engine differs'}")
+    sys.exit(0 if all_match else 1)
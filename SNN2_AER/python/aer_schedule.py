@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Precomputed Spike Schedule of the AER Pixel Encoder
+
+aer_pixel_encoder.v is periodic: an active pixel i spikes every SPIKE_PERIOD_i clocks,
+an inactive one never does. Instead of stepping its counters every clock, the whole
+raster is tabulated once per configuration:
+- table[pattern, t]: spike word of clock t after reset with `pattern` held (bit i =
+  spike_out_i), for t in one hyperperiod (LCM of the spike periods, 5005 for the
+  encoder defaults 5/7/11/13); each pattern repeats with the LCM of its active periods
+- Counter state is only needed when the pattern changes: the counters are advanced in
+  closed form and turned into per-pixel offsets into the table, so any clock is one
+  O(1) lookup, and whole presentations (or many patterns) are a single gather
+- Tables are cached per (periods, quiet period)
+
+ScheduledEncoder is a drop-in for rtl_model.PixelEncoder. write_mem() emits the table as
+a $readmemh image for hardware/aer_replay_encoder.v, which resolves its offsets the same way
+(checked against aer_pixel_encoder by hardware/tb_aer_replay_encoder.v).
+
+Usage: python aer_schedule.py [output.mem] [period_0 period_1 period_2 period_3]
+       (default: ../hardware/aer_schedule.mem with the harness periods 5 5 5 5)
+"""
+
+import functools
+import math
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+
+N_PIXELS = 4
+N_PATTERNS = 1 << N_PIXELS
+SPIKE_PERIODS = (5, 7, 11, 13)   # aer_pixel_encoder defaults
+HARNESS_PERIODS = (5, 5, 5, 5)   # snn_harness / tb_snn_pattern_recognition
+QUIET_PERIOD = 100
+MEM_FILE = '../hardware/aer_schedule.mem'
+
+CHANNELS = np.arange(N_PIXELS)
+PATTERN_PIXELS = ((np.arange(N_PATTERNS)[:, None] >> CHANNELS) & 1).astype(bool)
+
+
+class SpikeSchedule:
+    """Spike raster of aer_pixel_encoder for all 16 patterns over one hyperperiod"""
+
+    def __init__(self, periods=SPIKE_PERIODS, quiet_period=QUIET_PERIOD):
+        self.periods = np.array(periods, dtype=np.int64)
+        self.quiet_period = quiet_period
+        self.length = math.lcm(*periods)
+
+        # A pixel whose counter starts at 0 wraps (and spikes, if active) on clocks p-1, 2p-1, ...
+        t = np.arange(self.length)
+        fires = (t[:, None] + 1) % self.periods == 0                        # [L, 4]
+        self.bits = PATTERN_PIXELS[:, None, :] & fires[None]                # [16, L, 4]
+        self.table = (self.bits << CHANNELS).sum(axis=2).astype(np.uint8)   # [16, L]
+        self.hyperperiods = np.array([math.lcm(*self.periods[pixels].tolist()) if pixels.any() else 1
+                                      for pixels in PATTERN_PIXELS])
+
+    def pattern_periods(self, pattern):
+        """Counter period of each pixel under `pattern`"""
+        return np.where(PATTERN_PIXELS[pattern], self.periods, self.quiet_period)
+
+    def advance(self, counters, pattern, cycles):
+        """Encoder counters after `cycles` clocks of `pattern` (closed form)"""
+        if cycles == 0:
+            return np.asarray(counters)
+        period = self.pattern_periods(pattern)
+        # A counter at or past period - 1 wraps on the first clock
+        return (np.minimum(counters, period - 1) + cycles) % period
+
+    def offsets(self, counters, pattern):
+        """Per-pixel table offsets that continue from `counters` when `pattern` is applied"""
+        return np.where(PATTERN_PIXELS[pattern], np.minimum(counters, self.periods - 1), 0)
+
+    def lookup(self, pattern, t, offsets=0):
+        """spike_out_0..3 after clock t of `pattern`: bool [4]"""
+        return self.bits[pattern, (t + offsets) % self.length, CHANNELS]
+
+    def window(self, patterns, cycles, start=0):
+        """
+        Spike words of several patterns from reset, batched
+
+        Args:
+            patterns: int or array [P]
+            cycles: number of clocks, from clock `start`
+
+        Returns:
+            uint8 [P, cycles] (bit i = spike_out_i)
+        """
+        index = (start + np.arange(cycles)) % self.length
+        return self.table[np.atleast_1d(patterns)[:, None], index]
+
+    def spike_train(self, pattern, cycles, counters=None):
+        """
+        One presentation in a single gather
+
+        Args:
+            counters: encoder counters before the first clock (default: after reset)
+
+        Returns:
+            (bool [cycles, 4] spikes after each clock, counters after the last clock)
+        """
+        counters = np.zeros(N_PIXELS, dtype=np.int64) if counters is None else np.asarray(counters)
+        index = (np.arange(cycles)[:, None] + self.offsets(counters, pattern)) % self.length
+        return self.bits[pattern, index, CHANNELS], self.advance(counters, pattern, cycles)
+
+
+@functools.lru_cache(maxsize=None)
+def spike_schedule(periods=SPIKE_PERIODS, quiet_period=QUIET_PERIOD):
+    """Cached SpikeSchedule of one encoder configuration"""
+    return SpikeSchedule(tuple(periods), quiet_period)
+
+
+class ScheduledEncoder:
+    """aer_pixel_encoder spike_out_0..3 (enable = 1) from a SpikeSchedule, same interface as rtl_model.PixelEncoder"""
+
+    def __init__(self, periods=SPIKE_PERIODS, quiet_period=QUIET_PERIOD):
+        self.schedule = spike_schedule(tuple(periods), quiet_period)
+        self.reset()
+
+    def reset(self):
+        self.pattern = 0
+        self.elapsed = 0                                 # clocks since the last pattern change
+        self.base = np.zeros(N_PIXELS, dtype=np.int64)   # counters at the last pattern change
+        self.train = np.zeros((1, N_PIXELS), dtype=bool)
+        self.spikes = self.train[0]
+
+    @property
+    def counters(self):
+        return self.schedule.advance(self.base, self.pattern, self.elapsed)
+
+    def tick(self, pixels):
+        self.tick_pattern(int(np.dot(pixels, 1 << CHANNELS)))
+
+    def tick_pattern(self, pattern):
+        """One clock with a 4-bit pattern; a pattern change gathers one hyperperiod of spikes"""
+        if pattern != self.pattern:
+            self.base = self.counters
+            self.train, _ = self.schedule.spike_train(pattern, self.schedule.hyperperiods[pattern], self.base)
+            self.pattern, self.elapsed = pattern, 0
+        self.spikes = self.train[self.elapsed % len(self.train)]
+        self.elapsed += 1
+
+
+@instrument.stage('write .mem')
+def write_mem(schedule, path=MEM_FILE):
+    """
+    Save the table as a $readmemh image for aer_replay_encoder.v
+
+    Entry pattern * length + t holds the spike word of clock t (one hex digit,
+    bit i = spike_out_i).
+    """
+    instrument.count('values written', schedule.table.size)
+    periods = ', '.join(str(p) for p in schedule.periods)
+    with open(path, 'w') as f:
+        f.write(f"// AER spike schedule: {N_PATTERNS} patterns x {schedule.length} clocks "
+                f"(SPIKE_PERIOD = {periods}, QUIET_PERIOD = {schedule.quiet_period})\n")
+        f.write("// Generated from aer_schedule.py ($readmemh format, address = pattern * "
+                "SCHEDULE_LENGTH + t)\n")
+        f.write("\n".join(f"{word:X}" for word in schedule.table.ravel()) + "\n")
+
+
+if __name__ == '__main__':
+    import rtl_model
+    import aer_event_sim
+
+    instrument.setup()
+
+    output = sys.argv[1] if len(sys.argv) > 1 else MEM_FILE
+    periods = tuple(int(p) for p in sys.argv[2:6]) if len(sys.argv) > 5 else HARNESS_PERIODS
+
+    print("="*60)
+    print("AER spike schedule - aer_pixel_encoder")
+    print("="*60)
+
+    # Pattern changes with counters carried over: every encoder configuration against the
+    # counter-stepping reference and the closed-form event generator
+    rng = np.random.default_rng(0)
+    phases = [(0, 5)] + [(int(p), int(c)) for p, c in zip(rng.integers(0, N_PATTERNS, 200),
+                                                          rng.integers(1, 400, 200))]
+    cycles = sum(c for _, c in phases)
+    for config in (SPIKE_PERIODS, HARNESS_PERIODS):
+        reference, scheduled = rtl_model.PixelEncoder(config), ScheduledEncoder(config)
+        expected, actual = [], []
+        with instrument.stage('stepped encoder'):
+            start = time.perf_counter()
+            for pattern, clocks in phases:
+                pixels = rtl_model.pattern_pixels(pattern)
+                for _ in range(clocks):
+                    reference.tick(pixels)
+                    expected.append(reference.spikes)
+            stepped = time.perf_counter() - start
+        with instrument.stage('scheduled encoder'):
+            start = time.perf_counter()
+            for pattern, clocks in phases:
+                for _ in range(clocks):
+                    scheduled.tick_pattern(pattern)
+                    actual.append(scheduled.spikes)
+            ticked = time.perf_counter() - start
+        with instrument.stage('spike trains'):
+            start = time.perf_counter()
+            schedule, counters, trains = spike_schedule(config), None, []
+            for pattern, clocks in phases:
+                train, counters = schedule.spike_train(pattern, clocks, counters)
+                trains.append(train)
+            gathered = time.perf_counter() - start
+
+        expected = np.array(expected)
+        edges, channels = aer_event_sim.encoder_events(phases, config)
+        events = np.zeros_like(expected)
+        events[edges, channels] = True
+        assert np.array_equal(np.array(actual), expected), "ScheduledEncoder differs from PixelEncoder"
+        assert np.array_equal(np.concatenate(trains), expected), "spike_train differs from PixelEncoder"
+        assert np.array_equal(events, expected), "encoder_events differs from PixelEncoder"
+        assert np.array_equal(scheduled.counters, reference.counters), "counter state differs"
+
+        print(f"Periods {config}: hyperperiod {schedule.length}, table {schedule.table.nbytes:,} bytes")
+        print(f"  {len(phases)} pattern changes, {cycles:,} clocks: identical spikes and counters")
+        print(f"  PixelEncoder.tick {stepped:.2f}s, ScheduledEncoder.tick_pattern {ticked:.2f}s, "
+              f"spike_train {gathered * 1000:.1f}ms")
+
+    schedule = spike_schedule(periods)
+    start = time.perf_counter()
+    batch = schedule.window(np.arange(N_PATTERNS), 100_000)
+    print(f"Batched window: {batch.shape[0]} patterns x {batch.shape[1]:,} clocks in "
+          f"{(time.perf_counter() - start) * 1000:.1f}ms")
+
+    write_mem(schedule, output)
+    print(f"\n✓ Schedule for periods {periods} ({schedule.table.size:,} entries) saved to: {output}")
+    print(f"  aer_replay_encoder.v: SCHEDULE_LENGTH = {schedule.length}")
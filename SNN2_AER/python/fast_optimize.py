@@ -4,11 +4,23 @@ Fast Gradient-Free Optimization (Coordinate Descent + Random Search)
 
 Strategy: Fix input→hidden weights, optimize only hidden→output (24 weights)
 This is 5× faster than full optimization.
+
+Evaluations are cached by content hash of the RTL and the generated weight
+file (common/sim_cache.py), so revisited candidates cost no simulation.
 """
 
 import numpy as np
+import os
 import subprocess
 import json
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import sim_cache
+import instrument
+
+RTL_FILES = ['lif_neuron_stdp.v', 'aer_pixel_encoder.v',
+             'snn_core_pattern_recognition.v', 'tb_snn_pattern_recognition.v']
 
 class FastWeightOptimizer:
     def __init__(self):
@@ -23,6 +35,9 @@ class FastWeightOptimizer:
         self.best_weights = None
         self.best_accuracy = 0.583  # Baseline
         
+        # Simulation results keyed by RTL + weight file contents
+        self.cache = sim_cache.SimulationCache('../hardware/build/sim_cache')
+        
     def load_baseline_input_hidden(self):
         """Load and parse input→hidden weights from baseline file"""
         weights = np.zeros((4, 8), dtype=int)
@@ -45,7 +60,7 @@ class FastWeightOptimizer:
     def evaluate_hardware(self, hidden_output_weights):
         """Test weights on hardware, return accuracy"""
         # Generate Verilog
-        with open('../hardware/weight_parameters.vh', 'w') as f:
+        with instrument.stage('write weights'), open('../hardware/weight_parameters.vh', 'w') as f:
             f.write("// Auto-optimized weights\n\n")
             
             # Input→Hidden (baseline, fixed)
@@ -65,34 +80,50 @@ class FastWeightOptimizer:
             f.write("parameter BIAS_OUTPUT_1 = 0;\n")
             f.write("parameter BIAS_OUTPUT_2 = 0;\n")
         
+        # Skip the simulation if this exact RTL + weight set was run before
+        key = sim_cache.hash_inputs(
+            [os.path.join('../hardware', name) for name in RTL_FILES + ['weight_parameters.vh']],
+            namespace='tb_snn_pattern_recognition')
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
         # Compile
-        result = subprocess.run(
-            ['iverilog', '-o', 'opt_test', '-g2012',
-             'lif_neuron_stdp.v', 'aer_pixel_encoder.v',
-             'snn_core_pattern_recognition.v', 'tb_snn_pattern_recognition.v'],
-            cwd='../hardware',
-            capture_output=True
-        )
+        with instrument.stage('iverilog compile'):
+            result = subprocess.run(
+                ['iverilog', '-o', 'opt_test', '-g2012'] + RTL_FILES,
+                cwd='../hardware',
+                capture_output=True
+            )
         
         if result.returncode != 0:
             return 0.0
         
         # Run
-        result = subprocess.run(
-            ['./opt_test'],
-            cwd='../hardware',
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        with instrument.stage('vvp run'):
+            try:
+                result = subprocess.run(
+                    ['./opt_test'],
+                    cwd='../hardware',
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            except subprocess.TimeoutExpired:
+                return 0.0
         
         # Parse
+        accuracy = None
         for line in result.stdout.split('\n'):
             if 'Success rate:' in line:
-                rate = float(line.split(':')[1].strip().replace('%', ''))
-                return rate / 100.0
+                accuracy = float(line.split(':')[1].strip().replace('%', '')) / 100.0
+                break
         
-        return 0.0
+        # Crashed or truncated runs score 0 but are not cached, so a rerun tries again
+        if accuracy is None:
+            return 0.0
+        self.cache.put(key, accuracy)
+        return accuracy
     
     def optimize_coordinate_descent(self, max_iterations=50):
         """
@@ -258,6 +289,7 @@ class FastWeightOptimizer:
 
 if __name__ == "__main__":
     import sys
+    instrument.setup()
     
     optimizer = FastWeightOptimizer()
     
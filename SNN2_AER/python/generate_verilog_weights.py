@@ -12,6 +12,12 @@ Date: February 3, 2026
 import numpy as np
 import json
 from pathlib import Path
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+
+import instrument
 
 
 def load_weights():
@@ -129,4 +135,5 @@ def main():
 
 
 if __name__ == "__main__":
+    instrument.setup()
     main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Cycle-Accurate NumPy Model of the SNN Pattern Recognizer
+
+Time-stepped model of snn_harness.v (aer_pixel_encoder + snn_core_pattern_recognition,
+parameters of tb_snn_pattern_recognition.v) with the RTL's register semantics,
+for a whole batch of weight sets at once:
+- lif_neuron_stdp: a neuron whose potential is >= THRESHOLD spikes on the next
+  clock and resets, dropping that cycle's input; otherwise
+  V = max(0, V + I + bias - LEAK), wrapped to POTENTIAL_WIDTH + 1 signed bits;
+  the 4-bit bias is zero-extended as in the RTL (bias_value: -1 adds +15)
+- Each layer sees the previous layer's registered spikes (one clock per layer)
+- aer_pixel_encoder counters keep running across patterns; inactive pixels count
+  up to QUIET_PERIOD without spiking (PixelEncoder steps them; HarnessModel reads the
+  precomputed schedule of aer_schedule.py instead)
+- winner comes from the core's spike counters, which are only cleared by reset
+
+run_suite() replays TEST_SUITE like verilator/snn_sim_server.cpp (reset, then RUN
+with 50 separation cycles per test) and gives the success rate the testbench prints,
+without iverilog or Verilator.
+
+Usage: python rtl_model.py [weights.vh]   (default: ../hardware/weight_parameters.vh)
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+from aer_schedule import ScheduledEncoder
+from verilator_backend import N_INPUT, N_HIDDEN, N_OUTPUT, TEST_SUITE, load_weight_file
+
+THRESHOLD_HIDDEN = 20
+THRESHOLD_OUTPUT = 30
+LEAK = 1
+POTENTIAL_WIDTH = 8
+SPIKE_PERIODS = (5, 5, 5, 5)
+QUIET_PERIOD = 100
+RESET_CYCLES = 5          # pattern-0 clocks after reset is released
+SEPARATION_CYCLES = 50    # pattern-0 clocks after each test
+COUNTER_BITS = 16
+
+
+def wrap(value, bits):
+    """Two's complement truncation to `bits` signed bits"""
+    half = 1 << (bits - 1)
+    return ((np.asarray(value) + half) & ((1 << bits) - 1)) - half
+
+
+def bias_value(biases):
+    """
+    What lif_neuron_stdp adds for a 4-bit bias_signal
+
+    membrane_potential is unsigned, so the whole update expression is unsigned
+    and bias_signal is zero-extended: -1 adds +15. (input_current is too, but at
+    POTENTIAL_WIDTH + 1 bits that equals its signed value after the wrap.)
+    """
+    return np.asarray(biases) & 0xF
+
+
+def lif_step(potential, current, threshold, drift, width=POTENTIAL_WIDTH):
+    """
+    One clock of lif_neuron_stdp for an array of neurons
+
+    Args:
+        potential: membrane potentials (0 .. 2^width - 1)
+        current: input currents, already truncated to width + 1 bits
+        drift: bias - LEAK (per neuron or scalar)
+
+    Returns:
+        (new potentials, spike_out)
+    """
+    spikes = potential >= threshold
+    updated = np.maximum(wrap(potential + current + drift, width + 1), 0)
+    return np.where(spikes, 0, updated), spikes
+
+
+def winner_of(counts):
+    """Winner-take-all of snn_core_pattern_recognition; ties go to the lower index"""
+    c0, c1, c2 = counts[..., 0], counts[..., 1], counts[..., 2]
+    return np.where((c0 >= c1) & (c0 >= c2), 0, np.where(c1 >= c2, 1, 2))
+
+
+def pattern_pixels(pattern):
+    """4-bit pattern -> pixel_0..3 (pixel_i = bit i)"""
+    return np.array([(pattern >> i) & 1 for i in range(N_INPUT)], dtype=bool)
+
+
+class PixelEncoder:
+    """aer_pixel_encoder spike_out_0..3 (enable = 1)"""
+
+    def __init__(self, periods=SPIKE_PERIODS, quiet_period=QUIET_PERIOD):
+        self.periods = np.array(periods)
+        self.quiet_period = quiet_period
+        self.reset()
+
+    def reset(self):
+        self.counters = np.zeros(len(self.periods), dtype=np.int64)
+        self.spikes = np.zeros(len(self.periods), dtype=bool)
+
+    def tick(self, pixels):
+        period = np.where(pixels, self.periods, self.quiet_period)
+        wrapped = self.counters >= period - 1
+        self.spikes = wrapped & pixels
+        self.counters = np.where(wrapped, 0, (self.counters + 1) & 0xFF)
+
+
+class HarnessModel:
+    """
+    snn_harness for B weight sets in parallel
+
+    Args:
+        weights_ih: [4, 8] or [B, 4, 8] input->hidden weights
+        weights_ho: [8, 3] or [B, 8, 3] hidden->output weights
+    """
+
+    def __init__(self, weights_ih, weights_ho, threshold_hidden=THRESHOLD_HIDDEN,
+                 threshold_output=THRESHOLD_OUTPUT, leak=LEAK, spike_periods=SPIKE_PERIODS,
+                 quiet_period=QUIET_PERIOD):
+        weights_ih = np.asarray(weights_ih, dtype=np.int64)
+        weights_ho = np.asarray(weights_ho, dtype=np.int64)
+        self.weights_ih = weights_ih if weights_ih.ndim == 3 else weights_ih[None]
+        self.weights_ho = weights_ho if weights_ho.ndim == 3 else weights_ho[None]
+        self.batch = len(self.weights_ih)
+        self.threshold_hidden = threshold_hidden
+        self.threshold_output = threshold_output
+        self.leak = leak
+        self.encoder = ScheduledEncoder(spike_periods, quiet_period)
+        self.clear()
+
+    def clear(self):
+        """State while rst_n is low"""
+        self.encoder.reset()
+        self.hidden_potential = np.zeros((self.batch, N_HIDDEN), dtype=np.int64)
+        self.hidden_spikes = np.zeros((self.batch, N_HIDDEN), dtype=bool)
+        self.output_potential = np.zeros((self.batch, N_OUTPUT), dtype=np.int64)
+        self.output_spikes = np.zeros((self.batch, N_OUTPUT), dtype=bool)
+        self.counts = np.zeros((self.batch, N_OUTPUT), dtype=np.int64)
+        self.winner = np.zeros(self.batch, dtype=np.int64)
+        self.cycle = 0
+
+    def reset(self):
+        """reset() of snn_sim_server.cpp: hold reset, release, RESET_CYCLES clocks of pattern 0"""
+        self.clear()
+        for _ in range(RESET_CYCLES):
+            self.tick(0)
+
+    def tick(self, pattern, biases=(0, 0, 0)):
+        """One rising clock edge with `pattern` and `biases` applied"""
+        current_h = wrap(self.weights_ih[:, self.encoder.spikes, :].sum(axis=1), POTENTIAL_WIDTH + 1)
+        current_o = wrap(np.einsum('bh,bho->bo', self.hidden_spikes, self.weights_ho),
+                         POTENTIAL_WIDTH + 1)
+        drift_o = bias_value(biases) - self.leak
+
+        self.winner = winner_of(self.counts)
+        self.counts = (self.counts + self.output_spikes) & ((1 << COUNTER_BITS) - 1)
+        self.hidden_potential, self.hidden_spikes = lif_step(
+            self.hidden_potential, current_h, self.threshold_hidden, -self.leak)
+        self.output_potential, self.output_spikes = lif_step(
+            self.output_potential, current_o, self.threshold_output, drift_o)
+        self.encoder.tick_pattern(pattern)
+        self.cycle += 1
+
+    def run_pattern(self, pattern, biases=(0, 0, 0), cycles=2000):
+        """
+        RUN of snn_sim_server.cpp: present a pattern, then SEPARATION_CYCLES of pattern 0
+
+        Returns:
+            (spike counts [B, 3] during the presentation, winner [B] at its end)
+        """
+        counts = np.zeros((self.batch, N_OUTPUT), dtype=np.int64)
+        for _ in range(cycles):
+            counts += self.output_spikes
+            self.tick(pattern, biases)
+        winner = self.winner.copy()
+        for _ in range(SEPARATION_CYCLES):
+            self.tick(0, biases)
+        return counts, winner
+
+    def run_suite(self, suite=TEST_SUITE):
+        """Reset and replay a test suite: list of (counts [B, 3], winner [B]) per test"""
+        self.reset()
+        return [self.run_pattern(pattern, biases, cycles) for pattern, _, biases, cycles in suite]
+
+    def evaluate(self, suite=TEST_SUITE):
+        """Success rate (0-1) of every weight set: [B]"""
+        results = self.run_suite(suite)
+        passed = sum((winner == expected).astype(int)
+                     for (_, winner), (_, expected, _, _) in zip(results, suite))
+        return passed / len(suite)
+
+
+def evaluate_weights(weights_ih, weights_ho):
+    """Success rate of one weight set (drop-in for SNNSimulator.evaluate_weights)"""
+    return float(HarnessModel(weights_ih, weights_ho).evaluate()[0])
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    path = sys.argv[1] if len(sys.argv) > 1 else '../hardware/weight_parameters.vh'
+
+    print("="*60)
+    print("Cycle-accurate model - SNN pattern recognition")
+    print("="*60)
+
+    weights_ih, weights_ho = load_weight_file(path)
+    model = HarnessModel(weights_ih, weights_ho)
+    with instrument.stage('model suite'):
+        start = time.perf_counter()
+        results = model.run_suite()
+        elapsed = time.perf_counter() - start
+
+    print(f"Weights: {path}")
+    print(f"{'test':>4} {'pattern':>8} {'bias':>10} {'cycles':>6} {'counts':>14} {'winner':>6}")
+    passed = 0
+    for n, ((pattern, expected, biases, cycles), (counts, winner)) in enumerate(zip(TEST_SUITE, results), 1):
+        ok = winner[0] == expected
+        passed += ok
+        print(f"{n:>4} {pattern:>8b} {str(biases):>10} {cycles:>6} {str(counts[0].tolist()):>14} "
+              f"{winner[0]:>6} {'✓' if ok else '✗ expected ' + str(expected)}")
+    print(f"\nSuccess rate: {passed / len(TEST_SUITE) * 100:.1f}% ({model.cycle:,} cycles in {elapsed:.2f}s)")
+
+    batch = 256
+    rng = np.random.default_rng(0)
+    candidates = np.clip(weights_ho + rng.integers(-3, 4, (batch,) + weights_ho.shape), -15, 15)
+    start = time.perf_counter()
+    HarnessModel(np.broadcast_to(weights_ih, (batch,) + weights_ih.shape), candidates).evaluate()
+    elapsed = time.perf_counter() - start
+    print(f"Batched: {batch} weight sets in {elapsed:.2f}s ({batch / elapsed:.1f} evaluations/sec)")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Vectorized STDP Trainer for the 4 -> 8 -> 3 Pattern Recognizer
+
+Regenerates weights/trained_weights.json, the input of generate_verilog_weights.py.
+Hundreds of training seeds run in parallel: every array carries a leading seed axis,
+so one NumPy operation advances all networks by one clock.
+
+Training (per seed, float weights in [0, W_MAX]):
+- Inputs spike every SPIKE_PERIOD clocks while their pixel is on, like the AER encoder
+- Neurons use the RTL's integer thresholds and leak, with currents weight * WEIGHT_SCALE,
+  so training sees the same operating point as the hardware
+- Hidden layer: winner-take-all (one spike per clock, which resets the layer) with
+  adaptive thresholds (homeostasis), so the eight neurons pick up different
+  features instead of all learning the same one
+- Output layer: a teacher current drives the neuron of the presented class and
+  holds the other outputs down
+- Trace-based STDP on both layers: on a post spike, each synapse moves by its
+  pre-synaptic trace relative to the mean trace of the layer (inputs that were
+  active before the spike grow, silent ones shrink); on a pre spike, LTD by the
+  post-synaptic trace; soft bounds keep weights in [0, W_MAX]
+
+Weights are quantized like the hardware expects (round(w / W_MAX * 15), range 0-15), and
+every seed is scored on the testbench suite with the cycle-accurate rtl_model.HarnessModel
+(all seeds in one batched run). The best seed by that RTL-equivalent accuracy is saved.
+
+Usage: python stdp_train.py [seeds] [epochs]   (default: 256 seeds, 15 epochs)
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import instrument
+import rtl_model
+from verilator_backend import N_INPUT, N_HIDDEN, N_OUTPUT
+
+WEIGHTS_FILE = Path(__file__).parent.parent / "weights" / "trained_weights.json"
+
+# Training patterns as 2x2 grids (pixel i = row-major index i), label = output neuron
+PATTERNS = {
+    'L-shape': [[1, 0], [1, 1]],
+    'T-shape': [[1, 1], [0, 1]],
+    'Cross': [[0, 1], [1, 1]],
+}
+
+W_MAX = 1.0
+WEIGHT_SCALE = 15          # float weight W_MAX -> integer weight 15
+
+TRAINING = {
+    'epochs': 15,
+    'present_cycles': 100,
+    'rest_cycles': 20,
+    'spike_period': 5,
+    'a_plus': 0.05,
+    'a_minus': 0.001,
+    'tau_trace': 20.0,
+    'theta_plus': 0.5,
+    'theta_decay': 0.995,
+    'teacher_current': 8,
+    'teacher_inhibition': 8,
+    'input_weight_sum': 1.5,
+    'init_low': 0.2,
+    'init_high': 0.8,
+}
+
+
+def pattern_bits(grid):
+    """2x2 grid -> 4-bit pattern of the testbench (pixel_i = bit i)"""
+    return sum(int(p) << i for i, p in enumerate(np.asarray(grid).flatten()))
+
+
+def quantize(weights):
+    """Float weights in [0, W_MAX] -> hardware integers 0-15"""
+    return np.rint(np.clip(weights, 0, W_MAX) / W_MAX * WEIGHT_SCALE).astype(np.int64)
+
+
+def stdp_update(weights, pre_trace, pre_spikes, post_trace, post_spikes, p):
+    """One clock of trace-based STDP for weights [S, pre, post], soft-bounded to [0, W_MAX]"""
+    relative = pre_trace - pre_trace.mean(axis=1, keepdims=True)
+    ltp = p['a_plus'] * relative[:, :, None] * post_spikes[:, None, :]
+    ltd = p['a_minus'] * pre_spikes[:, :, None] * post_trace[:, None, :]
+    change = ltp - ltd
+    return weights + np.where(change > 0, change * (W_MAX - weights), change * weights)
+
+
+class STDPTrainer:
+    """STDP training of `seeds` independent 4 -> 8 -> 3 networks in lockstep"""
+
+    def __init__(self, seeds=256, params=None, threshold_hidden=rtl_model.THRESHOLD_HIDDEN,
+                 threshold_output=rtl_model.THRESHOLD_OUTPUT, leak=rtl_model.LEAK, base_seed=0):
+        self.params = dict(TRAINING, **(params or {}))
+        self.seeds = seeds
+        self.threshold_hidden = threshold_hidden
+        self.threshold_output = threshold_output
+        self.leak = leak
+        self.rng = np.random.default_rng(base_seed)
+
+        p = self.params
+        self.weights_ih = self.rng.uniform(p['init_low'], p['init_high'], (seeds, N_INPUT, N_HIDDEN)) * W_MAX
+        self.weights_ho = self.rng.uniform(p['init_low'], p['init_high'], (seeds, N_HIDDEN, N_OUTPUT)) * W_MAX
+        self.theta = np.zeros((seeds, N_HIDDEN))
+        self.pixels = np.array([np.asarray(g).flatten() for g in PATTERNS.values()], dtype=bool)
+
+    def present(self, labels, cycles, teach=True):
+        """
+        Present one pattern per seed (labels [S], -1 = blank) for `cycles` clocks with STDP on
+
+        Returns:
+            output spike counts [S, 3]
+        """
+        p = self.params
+        s = np.arange(self.seeds)
+        pixels = np.where((labels >= 0)[:, None], self.pixels[labels], False)
+        teacher = np.zeros((self.seeds, N_OUTPUT))
+        if teach:
+            teacher[labels >= 0] = -p['teacher_inhibition']
+            teacher[s[labels >= 0], labels[labels >= 0]] = p['teacher_current']
+        decay = np.exp(-1.0 / p['tau_trace'])
+
+        v_h = np.zeros((self.seeds, N_HIDDEN))
+        v_o = np.zeros((self.seeds, N_OUTPUT))
+        h_spikes = np.zeros((self.seeds, N_HIDDEN), dtype=bool)
+        x_in = np.zeros((self.seeds, N_INPUT))
+        x_h = np.zeros((self.seeds, N_HIDDEN))
+        x_o = np.zeros((self.seeds, N_OUTPUT))
+        counts = np.zeros((self.seeds, N_OUTPUT), dtype=np.int64)
+
+        for t in range(cycles):
+            in_spikes = pixels & (t % p['spike_period'] == 0)
+
+            # Output layer sees last clock's hidden spikes (registered, as in the RTL)
+            v_o = np.maximum(v_o + np.einsum('sh,sho->so', h_spikes, self.weights_ho) * WEIGHT_SCALE
+                             + teacher - self.leak, 0)
+            o_spikes = v_o >= self.threshold_output
+            v_o[o_spikes] = 0
+            counts += o_spikes
+
+            # Hidden layer: at most one spike per clock, the most depolarized over threshold
+            v_h = np.maximum(v_h + np.einsum('si,sih->sh', in_spikes, self.weights_ih) * WEIGHT_SCALE
+                             - self.leak, 0)
+            margin = v_h - (self.threshold_hidden + self.theta)
+            winner = np.argmax(margin, axis=1)
+            h_spikes = np.zeros_like(h_spikes)
+            h_spikes[s, winner] = margin[s, winner] >= 0
+            v_h[h_spikes.any(axis=1)] = 0       # lateral inhibition resets the whole layer
+            self.theta = self.theta * p['theta_decay'] + p['theta_plus'] * h_spikes
+
+            # Traces include this clock's spikes
+            x_in = x_in * decay + in_spikes
+            x_h = x_h * decay + h_spikes
+            x_o = x_o * decay + o_spikes
+
+            # STDP: post spikes move weights by the relative pre trace, pre spikes give LTD
+            self.weights_ih = stdp_update(self.weights_ih, x_in, in_spikes, x_h, h_spikes, p)
+            self.weights_ho = stdp_update(self.weights_ho, x_h, h_spikes, x_o, o_spikes, p)
+            if p['input_weight_sum']:
+                total = self.weights_ih.sum(axis=1, keepdims=True)
+                self.weights_ih = np.minimum(self.weights_ih * p['input_weight_sum'] / np.maximum(total, 1e-9), W_MAX)
+        return counts
+
+    def train(self, epochs=None):
+        """Every epoch presents each pattern once per seed, in a per-seed random order"""
+        p = self.params
+        blank = np.full(self.seeds, -1)
+        for _ in range(epochs or p['epochs']):
+            order = np.argsort(self.rng.random((self.seeds, len(PATTERNS))), axis=1)
+            for k in range(len(PATTERNS)):
+                self.present(order[:, k], p['present_cycles'])
+                self.present(blank, p['rest_cycles'])
+
+    def quantized(self):
+        """Hardware weights of every seed: ([S, 4, 8], [S, 8, 3])"""
+        return quantize(self.weights_ih), quantize(self.weights_ho)
+
+
+def isolated_accuracy(weights_ih, weights_ho):
+    """Fraction of the training patterns classified correctly, each after its own reset: [S]"""
+    correct = 0
+    for label, grid in enumerate(PATTERNS.values()):
+        model = rtl_model.HarnessModel(weights_ih, weights_ho)
+        model.reset()
+        _, winner = model.run_pattern(pattern_bits(grid), cycles=2000)
+        correct = correct + (winner == label)
+    return correct / len(PATTERNS)
+
+
+def score_seeds(weights_ih, weights_ho):
+    """RTL-equivalent success rate on TEST_SUITE and isolated pattern accuracy, for all seeds"""
+    return rtl_model.HarnessModel(weights_ih, weights_ho).evaluate(), isolated_accuracy(weights_ih, weights_ho)
+
+
+def save_weights(trainer, best, suite_accuracy, pattern_accuracy, elapsed, path=WEIGHTS_FILE):
+    """Write the best seed in the format generate_verilog_weights.py reads"""
+    q_ih, q_ho = trainer.quantized()
+    data = {
+        'network_architecture': {'n_input': N_INPUT, 'n_hidden': N_HIDDEN, 'n_output': N_OUTPUT},
+        'patterns': PATTERNS,
+        'weights_input_hidden': trainer.weights_ih[best].tolist(),
+        'weights_hidden_output': trainer.weights_ho[best].tolist(),
+        'weights_input_hidden_quantized': q_ih[best].tolist(),
+        'weights_hidden_output_quantized': q_ho[best].tolist(),
+        'final_accuracy': float(suite_accuracy[best]),
+        'pattern_accuracy': float(pattern_accuracy[best]),
+        'training': {
+            'method': 'trace-based STDP, hidden WTA + homeostasis, output teacher current',
+            'params': trainer.params,
+            'seeds': trainer.seeds,
+            'best_seed': int(best),
+            'selection': 'rtl_model TEST_SUITE success rate, then isolated pattern accuracy',
+            'suite_accuracy_histogram': {f'{a:.3f}': int(n) for a, n in
+                                         zip(*np.unique(np.round(suite_accuracy, 3), return_counts=True))},
+            'seconds': round(elapsed, 1),
+        },
+    }
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+if __name__ == '__main__':
+    instrument.setup()
+
+    seeds = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    epochs = int(sys.argv[2]) if len(sys.argv) > 2 else TRAINING['epochs']
+
+    print("="*60)
+    print("STDP training - 4 -> 8 -> 3 pattern recognizer")
+    print("="*60)
+    print(f"Seeds: {seeds} in parallel, {epochs} epochs x {len(PATTERNS)} patterns")
+
+    trainer = STDPTrainer(seeds)
+    with instrument.stage('train'):
+        start = time.perf_counter()
+        trainer.train(epochs)
+        train_time = time.perf_counter() - start
+    print(f"Training: {train_time:.1f}s ({seeds * epochs * len(PATTERNS) / train_time:,.0f} presentations/sec)")
+
+    with instrument.stage('score seeds'):
+        start = time.perf_counter()
+        suite_accuracy, pattern_accuracy = score_seeds(*trainer.quantized())
+        score_time = time.perf_counter() - start
+    print(f"RTL-equivalent scoring: {score_time:.1f}s for {seeds} quantized weight sets")
+
+    print("\nTEST_SUITE success rate over seeds:")
+    for accuracy, n in zip(*np.unique(np.round(suite_accuracy, 3), return_counts=True)):
+        print(f"  {accuracy * 100:5.1f}%  {n:>5} seeds")
+
+    best = int(np.lexsort((-pattern_accuracy, -suite_accuracy))[0])
+    path = save_weights(trainer, best, suite_accuracy, pattern_accuracy, train_time + score_time)
+    q_ih, q_ho = trainer.quantized()
+    print(f"\nBest seed {best}: TEST_SUITE {suite_accuracy[best] * 100:.1f}%, "
+          f"isolated patterns {pattern_accuracy[best] * 100:.1f}%")
+    print("Input->Hidden (quantized):")
+    print(q_ih[best])
+    print("Hidden->Output (quantized):")
+    print(q_ho[best])
+    print(f"\n✓ Saved to {path} (next: python generate_verilog_weights.py)")
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Persistent Verilator Simulation Backend for the SNN pattern recognizer
+
+Builds snn_harness.v (AER encoder + snn_core_pattern_recognition, same
+parameters as tb_snn_pattern_recognition.v) once with +define+RUNTIME_WEIGHTS.
+Weights are registers written over a pipe, so each candidate in an
+optimization loop costs one simulation instead of an iverilog compile + run.
+
+evaluate_weights() replays the 12-test suite of tb_snn_pattern_recognition.v
+and returns the same success rate fast_optimize.py parses from vvp output.
+testbench_evaluate() is the reference: it compiles and runs the testbench
+itself with Verilator (--binary --timing), or with iverilog when Verilator is
+not installed. SNNSimulator and find_simulator() come from
+common/verilator_server.py.
+Both evaluators accept a sim_cache.SimulationCache (common/sim_cache.py):
+results are keyed by the RTL sources and the weights, so repeated
+candidates are not simulated again.
+
+Usage: python verilator_backend.py [num_evaluations]
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'common'))
+import sim_cache
+import instrument
+from verilator_server import VerilatorServer, find_simulator
+
+HARDWARE_DIR = '../hardware'
+BUILD_DIR = '../hardware/build/verilator/snn_server'
+SERVER_NAME = 'snn_sim_server'
+RTL_SOURCES = ['snn_harness.v', 'aer_pixel_encoder.v', 'lif_neuron_stdp.v',
+               'snn_core_pattern_recognition.v']
+TESTBENCH_SOURCES = ['lif_neuron_stdp.v', 'aer_pixel_encoder.v', 'snn_core_pattern_recognition.v',
+                     'tb_snn_pattern_recognition.v']
+N_INPUT, N_HIDDEN, N_OUTPUT = 4, 8, 3
+
+# (pattern bits [3:0], expected winner, biases, duration) from tb_snn_pattern_recognition.v
+TEST_SUITE = [
+    (0b1101, 0, (0, 0, 0), 2000),
+    (0b1011, 1, (0, 0, 0), 2000),
+    (0b1110, 2, (0, 0, 0), 2000),
+    (0b1101, 0, (3, 0, 0), 2000),
+    (0b1011, 1, (0, 3, 0), 2000),
+    (0b1110, 2, (0, 0, 3), 2000),
+    (0b1001, 0, (2, 0, 0), 2000),
+    (0b0011, 1, (0, 2, 0), 2000),
+    (0b0110, 2, (0, 0, 2), 2000),
+    (0b1101, 0, (0, 0, 0), 5000),
+    (0b1011, 1, (0, 0, 0), 5000),
+    (0b1110, 2, (0, 0, 0), 5000),
+]
+
+
+def load_weight_file(path):
+    """Parse WEIGHT_I*_H* / WEIGHT_H*_O* parameters from a weight .vh file"""
+    weights_ih = np.zeros((N_INPUT, N_HIDDEN), dtype=int)
+    weights_ho = np.zeros((N_HIDDEN, N_OUTPUT), dtype=int)
+    with open(path) as f:
+        for match in re.finditer(r'parameter\s+WEIGHT_([IH])(\d)_([HO])(\d)\s*=\s*(-?\d+)', f.read()):
+            src, i, _, j, value = match.groups()
+            target = weights_ih if src == 'I' else weights_ho
+            target[int(i), int(j)] = int(value)
+    return weights_ih, weights_ho
+
+
+def weights_key(files, weights_ih, weights_ho, namespace):
+    """Cache key: RTL file contents + integer weights"""
+    return sim_cache.hash_inputs(files, [np.asarray(weights_ih, dtype=np.int64),
+                                         np.asarray(weights_ho, dtype=np.int64)], namespace)
+
+
+@instrument.stage('verilator build')
+def build_server(hardware_dir=HARDWARE_DIR, build_dir=BUILD_DIR, force=False):
+    """Verilate and compile the simulation server (skipped when up to date)"""
+    if shutil.which('verilator') is None:
+        raise RuntimeError("verilator not found - install Verilator 5.x")
+
+    hardware_dir = os.path.abspath(hardware_dir)
+    build_dir = os.path.abspath(build_dir)
+    binary = os.path.join(build_dir, SERVER_NAME)
+    sources = [os.path.join(hardware_dir, name) for name in RTL_SOURCES]
+    harness = os.path.join(hardware_dir, 'verilator', f'{SERVER_NAME}.cpp')
+    inputs = sources + [harness, os.path.join(hardware_dir, 'weight_registers_runtime.vh')]
+
+    if not force and os.path.exists(binary) and \
+            os.path.getmtime(binary) >= max(os.path.getmtime(f) for f in inputs):
+        return binary
+
+    os.makedirs(build_dir, exist_ok=True)
+    result = subprocess.run(['verilator', '--cc', '--exe', '--build', '-O3', '-Wno-fatal',
+                             '+define+RUNTIME_WEIGHTS', '--top-module', 'snn_harness',
+                             f'-I{hardware_dir}', '-Mdir', build_dir, '-o', SERVER_NAME]
+                            + sources + [harness],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"verilator build failed:\n{result.stderr}")
+    return binary
+
+
+class SNNSimulator(VerilatorServer):
+    """snn_harness behind a pipe: load weights, replay the test suite"""
+
+    def __init__(self, binary=None, cache=None, hardware_dir=HARDWARE_DIR):
+        super().__init__(binary or build_server())
+        self.cache = cache
+        self.key_files = [os.path.join(hardware_dir, name) for name in RTL_SOURCES] + \
+            [os.path.join(hardware_dir, 'verilator', f'{SERVER_NAME}.cpp'),
+             os.path.join(hardware_dir, 'weight_registers_runtime.vh')]
+
+    def load_weights(self, weights_ih, weights_ho):
+        values = np.concatenate([np.asarray(weights_ih).flatten(), np.asarray(weights_ho).flatten()])
+        self.command('WEIGHTS ' + ' '.join(str(int(v)) for v in values))
+
+    def reset(self):
+        self.command('RESET')
+
+    def run_pattern(self, pattern, biases=(0, 0, 0), cycles=2000):
+        """Present one pattern; returns (spike counts [3], winner)"""
+        fields = self.command(f'RUN {pattern} {biases[0]} {biases[1]} {biases[2]} {cycles}')
+        values = [int(v) for v in fields[1:]]
+        return values[:N_OUTPUT], values[N_OUTPUT]
+
+    def evaluate_weights(self, weights_ih, weights_ho):
+        """Success rate (0-1) of the testbench suite for one weight set"""
+        if self.cache is not None:
+            key = weights_key(self.key_files, weights_ih, weights_ho, SERVER_NAME)
+            return self.cache.get_or_compute(key, lambda: self._evaluate(weights_ih, weights_ho))
+        return self._evaluate(weights_ih, weights_ho)
+
+    def _evaluate(self, weights_ih, weights_ho):
+        self.load_weights(weights_ih, weights_ho)
+        self.reset()
+        passed = 0
+        for pattern, expected, biases, cycles in TEST_SUITE:
+            _, winner = self.run_pattern(pattern, biases, cycles)
+            passed += int(winner == expected)
+        return passed / len(TEST_SUITE)
+
+
+def testbench_evaluate(weights_ih, weights_ho, hardware_dir=HARDWARE_DIR, cache=None, simulator=None):
+    """
+    Reference path used by fast_optimize.py: write weights, compile, run the testbench
+
+    Works in a scratch directory so the checked-in weight file is untouched.
+    Compile failures, timeouts and runs without a success rate return 0.0 and are not cached.
+    """
+    simulator = find_simulator(simulator)
+    if cache is not None:
+        key = weights_key([os.path.join(hardware_dir, name) for name in TESTBENCH_SOURCES],
+                          weights_ih, weights_ho, f'tb_snn_pattern_recognition/{simulator}')
+        rate = cache.get(key)
+        if rate is None:
+            rate = _testbench_run(weights_ih, weights_ho, hardware_dir, simulator)
+            if rate is not None:
+                cache.put(key, rate)
+        return rate or 0.0
+    return _testbench_run(weights_ih, weights_ho, hardware_dir, simulator) or 0.0
+
+
+def _testbench_run(weights_ih, weights_ho, hardware_dir, simulator):
+    """Success rate from one testbench compile + run, or None if it failed to compile, timed out or printed none"""
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in TESTBENCH_SOURCES:
+            shutil.copy(os.path.join(hardware_dir, name), workdir)
+
+        with open(os.path.join(workdir, 'weight_parameters.vh'), 'w') as f:
+            for i in range(N_INPUT):
+                for h in range(N_HIDDEN):
+                    f.write(f"parameter WEIGHT_I{i}_H{h} = {int(weights_ih[i, h])};\n")
+            for h in range(N_HIDDEN):
+                for o in range(N_OUTPUT):
+                    f.write(f"parameter WEIGHT_H{h}_O{o} = {int(weights_ho[h, o])};\n")
+
+        if simulator == 'verilator':
+            compile_command = ['verilator', '--binary', '--timing', '-Wno-fatal', '-Wno-lint', '-Wno-style',
+                               '--top-module', 'tb_snn_pattern_recognition', '-Mdir', 'obj',
+                               '-o', 'opt_test'] + TESTBENCH_SOURCES
+            run_command = [os.path.join(workdir, 'obj', 'opt_test')]
+        else:
+            compile_command = ['iverilog', '-o', 'opt_test', '-g2012'] + TESTBENCH_SOURCES
+            run_command = ['vvp', 'opt_test']
+
+        result = subprocess.run(compile_command, cwd=workdir, capture_output=True)
+        if result.returncode != 0:
+            return None
+        try:
+            result = subprocess.run(run_command, cwd=workdir, capture_output=True, text=True, timeout=60)
+        except subprocess.TimeoutExpired:
+            return None
+
+    for line in result.stdout.split('\n'):
+        if 'Success rate:' in line:
+            return float(line.split(':')[1].strip().replace('%', '')) / 100.0
+    return None
+
+
+if __name__ == '__main__':
+    import sys
+    instrument.setup()
+
+    num_evaluations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print("="*60)
+    print("Verilator server vs testbench - SNN weight evaluation")
+    print("="*60)
+
+    weights_ih, weights_ho = load_weight_file('../hardware/weight_parameters.vh')
+    rng = np.random.default_rng(0)
+    candidates = [(weights_ih, weights_ho)] + \
+        [(weights_ih, np.clip(weights_ho + rng.integers(-3, 4, weights_ho.shape), -15, 15))
+         for _ in range(num_evaluations - 1)]
+
+    start = time.perf_counter()
+    binary = build_server()
+    build_time = time.perf_counter() - start
+
+    with SNNSimulator(binary) as sim:
+        start = time.perf_counter()
+        server_acc = [sim.evaluate_weights(w_ih, w_ho) for w_ih, w_ho in candidates]
+        server_time = time.perf_counter() - start
+
+    simulator = find_simulator()
+    start = time.perf_counter()
+    testbench_acc = [testbench_evaluate(w_ih, w_ho, simulator=simulator) for w_ih, w_ho in candidates]
+    testbench_time = time.perf_counter() - start
+
+    agree = sum(abs(a - b) < 1e-9 for a, b in zip(server_acc, testbench_acc))
+
+    print(f"Evaluations: {num_evaluations} weight sets x {len(TEST_SUITE)} patterns")
+    print(f"Verilator build (one time): {build_time:.1f}s")
+    print(f"Verilator server: {num_evaluations / server_time:.2f} evaluations/sec")
+    print(f"Testbench:        {num_evaluations / testbench_time:.2f} evaluations/sec "
+          f"({simulator}, compile + run each)")
+    print(f"Speedup:          {testbench_time / server_time:.1f}x")
+    print(f"Matching success rates: {agree}/{num_evaluations} "
+          f"(checked-in weights: server {server_acc[0]:.1%}, testbench {testbench_acc[0]:.1%})")
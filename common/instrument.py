@@ -0,0 +1,190 @@
+"""
+Lightweight Instrumentation: Nested Stage Timers, Counters, cProfile
+- stage('name') times a block (context manager) or a function (decorator);
+  stages nest, so the report shows e.g. main/quantize/write .vh
+- count('name', n) accumulates counters (cache hits, values written, ...)
+- Disabled by default: stage() and count() then cost one global check
+- Enabled per run by a flag or environment variable, read by setup():
+    --trace[=file]     / FPGA_ML_TRACE=file    stage + counter trace
+    --profile[=file]   / FPGA_ML_PROFILE=file  cProfile stats (.prof)
+  The flags are removed from sys.argv, so scripts' positional arguments
+  are unaffected
+- At exit: a stage summary on stderr and a Chrome trace JSON (open in
+  chrome://tracing or ui.perfetto.dev) that also carries the aggregated
+  'stages' and 'counters' tables for machine use
+
+Every pipeline script calls setup() at the top of its main entry point.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+TRACE_ENV = 'FPGA_ML_TRACE'
+PROFILE_ENV = 'FPGA_ML_PROFILE'
+
+_tracer = None
+
+
+class Tracer:
+    """Collects stage events (Chrome 'X'), counter events ('C') and aggregates"""
+
+    def __init__(self, name):
+        self.name = name
+        self.origin = time.perf_counter()
+        self.events = []
+        self.stages = {}     # path -> {'count', 'total_s'}
+        self.counters = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def begin(self, name):
+        stack = self._stack()
+        stack.append(name)
+        return time.perf_counter()
+
+    def end(self, name, start, args):
+        stack = self._stack()
+        path = '/'.join(stack)
+        stack.pop()
+        duration = time.perf_counter() - start
+        event = {'name': name, 'cat': 'stage', 'ph': 'X', 'pid': os.getpid(),
+                 'tid': threading.get_ident(), 'ts': (start - self.origin) * 1e6,
+                 'dur': duration * 1e6, 'args': dict(args, path=path)}
+        with self._lock:
+            self.events.append(event)
+            entry = self.stages.setdefault(path, {'count': 0, 'total_s': 0.0})
+            entry['count'] += 1
+            entry['total_s'] += duration
+
+    def count(self, name, n):
+        with self._lock:
+            total = self.counters[name] = self.counters.get(name, 0) + n
+            self.events.append({'name': name, 'cat': 'counter', 'ph': 'C', 'pid': os.getpid(),
+                                'ts': (time.perf_counter() - self.origin) * 1e6, 'args': {name: total}})
+
+    def trace(self):
+        return {'traceEvents': self.events, 'displayTimeUnit': 'ms', 'script': self.name,
+                'stages': self.stages, 'counters': self.counters}
+
+    def summary(self, out=sys.stderr):
+        print(f"\n[instrument] {self.name}: stage times", file=out)
+        for path, entry in sorted(self.stages.items()):
+            depth = path.count('/')
+            label = '  ' * depth + path.rsplit('/', 1)[-1]
+            print(f"  {label:<44} {entry['total_s']:>9.3f} s  x{entry['count']}", file=out)
+        for name, total in sorted(self.counters.items()):
+            print(f"  counter {name:<36} {total:>12,}", file=out)
+
+
+class stage(contextlib.ContextDecorator):
+    """Time a block or function as a nested stage (no-op unless instrumentation is on)"""
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args
+        self._start = None
+
+    def _recreate_cm(self):
+        # A fresh instance per decorated call keeps recursion and threads safe
+        return stage(self.name, **self.args)
+
+    def __enter__(self):
+        if _tracer is not None:
+            self._start = _tracer.begin(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        if _tracer is not None and self._start is not None:
+            _tracer.end(self.name, self._start, self.args)
+        return False
+
+
+def count(name, n=1):
+    """Add n to a named counter"""
+    if _tracer is not None:
+        _tracer.count(name, n)
+
+
+def enabled():
+    return _tracer is not None
+
+
+def _option(argv, flag, env, default):
+    """Value of --flag / --flag=value in argv (removed) or of an env var"""
+    for arg in list(argv):
+        if arg == flag or arg.startswith(flag + '='):
+            argv.remove(arg)
+            return arg.split('=', 1)[1] if '=' in arg else default
+    value = os.environ.get(env)
+    if value:
+        return default if value == '1' else value
+    return None
+
+
+def setup(name=None, argv=None):
+    """
+    Enable instrumentation for this run if requested (flag or env var)
+
+    Opens a root stage named after the script; the trace, profile and
+    summary are written when the interpreter exits.
+
+    Returns:
+        True if instrumentation is enabled
+    """
+    global _tracer
+    argv = sys.argv if argv is None else argv
+    name = name or os.path.splitext(os.path.basename(argv[0] if argv else 'python'))[0]
+    trace_path = _option(argv, '--trace', TRACE_ENV, f'{name}.trace.json')
+    profile_path = _option(argv, '--profile', PROFILE_ENV, f'{name}.prof')
+    if trace_path is None and profile_path is None:
+        return False
+
+    _tracer = Tracer(name)
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    root = stage(name)
+    root.__enter__()
+
+    def finish():
+        global _tracer
+        root.__exit__(None, None, None)
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        tracer, _tracer = _tracer, None
+        tracer.summary()
+        if trace_path:
+            with open(trace_path, 'w') as f:
+                json.dump(tracer.trace(), f)
+            print(f"[instrument] trace: {trace_path}", file=sys.stderr)
+        if profile_path:
+            print(f"[instrument] profile: {profile_path} (python -m pstats {profile_path})", file=sys.stderr)
+
+    atexit.register(finish)
+    return True
+
+
+if __name__ == '__main__':
+    # Print the aggregated tables of a trace file
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    if path is None:
+        print(__doc__)
+        sys.exit(0)
+    with open(path) as f:
+        data = json.load(f)
+    tracer = Tracer(data.get('script', path))
+    tracer.stages, tracer.counters = data['stages'], data['counters']
+    tracer.summary(sys.stdout)
@@ -0,0 +1,170 @@
+"""
+Content-Addressed Simulation Result Cache
+- Key: SHA-256 over the RTL file set, the weight files and the stimulus,
+  plus a namespace naming the harness/simulator
+- Value: the parsed simulation result (JSON), never raw simulator output
+- Size-bounded: a running total of the bytes written is kept; once it
+  passes max_bytes the directory is rescanned and least recently used
+  entries are evicted
+- Safe for concurrent workers: entries are written to a temp file and
+  renamed into place, so readers never see partial results; eviction
+  tolerates entries vanishing underneath it
+
+Used by CNN1/python (rtl_regression.py, dse.py) and SNN2_AER/python
+(verilator_backend.py, fast_optimize.py); each passes its own cache directory.
+
+Usage: python sim_cache.py cache_dir [clear]
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+import instrument
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def hash_inputs(files=(), data=(), namespace=''):
+    """
+    Content hash of a simulation's inputs
+
+    Args:
+        files: RTL sources, weight headers, stimulus files (contents are hashed,
+            keyed by base name so the same tree in another directory hits)
+        data: in-memory inputs - bytes, str, or NumPy arrays (dtype and shape included)
+        namespace: harness/simulator name, keeps different harnesses apart
+    """
+    h = hashlib.sha256(namespace.encode())
+    for path in sorted(files, key=os.path.basename):
+        h.update(os.path.basename(path).encode() + b'\0')
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+    for item in data:
+        if isinstance(item, np.ndarray):
+            h.update(f'{item.dtype}{item.shape}'.encode())
+            item = np.ascontiguousarray(item).tobytes()
+        elif isinstance(item, str):
+            item = item.encode()
+        h.update(len(item).to_bytes(8, 'little') + item)
+    return h.hexdigest()
+
+
+class SimulationCache:
+    """Directory of <key>.json result files with LRU eviction"""
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.total = None   # bytes on disk, scanned on the first put
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get(self, key):
+        """Cached result or None; a hit refreshes the entry's LRU timestamp"""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                value = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            instrument.count('sim_cache misses')
+            return None
+        self.hits += 1
+        instrument.count('sim_cache hits')
+        return value
+
+    def put(self, key, value):
+        """Store a JSON-serializable result atomically; evict only once the running total passes max_bytes"""
+        if self.total is None:
+            self.total = self.size()
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            replaced = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.total += os.path.getsize(path) - replaced
+        if self.total > self.max_bytes:
+            self.evict()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached result for key, running compute() on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def entries(self):
+        """(mtime, size, path) of every entry, oldest first"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*', '*.json')):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue  # evicted by another worker
+            entries.append((st.st_mtime, st.st_size, path))
+        return sorted(entries)
+
+    def evict(self):
+        """Rescan and remove least recently used entries until the cache fits in max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self.total = total
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.total = 0
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+
+if __name__ == '__main__':
+    import sys
+    instrument.setup()
+
+    if len(sys.argv) < 2:
+        print("Usage: python sim_cache.py cache_dir [clear]")
+        sys.exit(1)
+    directory = sys.argv[1]
+    cache = SimulationCache(directory)
+
+    if len(sys.argv) > 2 and sys.argv[2] == 'clear':
+        cache.clear()
+        print(f"Cleared {directory}")
+    else:
+        entries = cache.entries()
+        print(f"Cache: {directory}")
+        print(f"Entries: {len(entries)}, size: {cache.size() / 1024:.1f} KB "
+              f"(limit {cache.max_bytes / 1024 / 1024:.0f} MB)")
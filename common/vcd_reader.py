@@ -0,0 +1,270 @@
+"""
+Streaming VCD Reader and Handshake Latency Report
+- Parses a VCD file line by line: memory is bounded by the selected
+  signals' output, not by the waveform size
+- Extracts selected signals into NumPy arrays, either as value changes
+  or sampled once per rising clock edge (cycle-accurate view)
+- Measures cycle latency between handshake signals, e.g.
+  pixel_valid -> window_valid -> conv valid_out (the default chain, as far as
+  system_integration_test.vcd goes: its testbench has line_buffer and
+  conv_unit but no cnn_top), extended with done for a full cnn_top dump
+
+Usage: python vcd_reader.py [file.vcd] [clock] [signal ...]
+"""
+
+from array import array
+import os
+import numpy as np
+import instrument
+
+UNKNOWN = -1  # value used for x/z bits
+DEFAULT_VCD = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'CNN1', 'hardware',
+                           'system_integration_test.vcd')
+
+
+class VCDHeader:
+    """Signal declarations of a VCD file"""
+
+    def __init__(self):
+        self.timescale = None
+        self.ids = {}      # full name -> identifier code
+        self.widths = {}   # identifier code -> bit width
+        self.names = {}    # identifier code -> list of full names (aliases)
+
+    def resolve(self, signal):
+        """
+        Identifier code for a signal name
+
+        Accepts a full hierarchical name (tb.conv.valid_out) or any dotted
+        suffix of one; ambiguous suffixes resolve to the shallowest match.
+        """
+        if signal in self.ids:
+            return self.ids[signal]
+        matches = [name for name in self.ids if name.endswith('.' + signal)]
+        if not matches:
+            raise KeyError(f"signal '{signal}' not found in VCD")
+        return self.ids[min(matches, key=lambda name: name.count('.'))]
+
+
+def _parse_value(text):
+    """VCD value string (binary digits, possibly x/z) -> int"""
+    if any(c in 'xXzZ' for c in text):
+        return UNKNOWN
+    return int(text, 2)
+
+
+def to_signed(values, width):
+    """Reinterpret unsigned vector values of a `width`-bit signal as two's complement"""
+    values = np.asarray(values, dtype=np.int64)
+    return np.where(values >= 1 << (width - 1), values - (1 << width), values)
+
+
+def read_header(f):
+    """Read declarations up to $enddefinitions; leaves f positioned after it"""
+    header = VCDHeader()
+    scope = []
+    tokens = []
+
+    for line in f:
+        tokens.extend(line.split())
+        if '$end' not in tokens:
+            continue
+        keyword = tokens[0]
+        if keyword == '$scope':
+            scope.append(tokens[2])
+        elif keyword == '$upscope':
+            scope.pop()
+        elif keyword == '$var':
+            width, code, name = int(tokens[2]), tokens[3], tokens[4]
+            full_name = '.'.join(scope + [name])
+            header.ids[full_name] = code
+            header.widths[code] = width
+            header.names.setdefault(code, []).append(full_name)
+        elif keyword == '$timescale':
+            header.timescale = ' '.join(tokens[1:tokens.index('$end')])
+        elif keyword == '$enddefinitions':
+            break
+        tokens = []
+    return header
+
+
+def iter_changes(f, codes):
+    """
+    Yield (time, code, value) for changes of the given identifier codes
+
+    Args:
+        f: file positioned after the header
+        codes: set of identifier codes to report
+    """
+    time = 0
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        c = line[0]
+        if c == '#':
+            time = int(line[1:])
+        elif c in '01xXzZ':
+            code = line[1:]
+            if code in codes:
+                yield time, code, _parse_value(c)
+        elif c in 'bB':
+            value, code = line[1:].split()
+            if code in codes:
+                yield time, code, _parse_value(value)
+        elif c in 'rR':
+            value, code = line[1:].split()
+            if code in codes:
+                yield time, code, float(value)
+        # $dumpvars / $end / $comment lines carry no values themselves
+
+
+def read_changes(path, signals):
+    """
+    Value changes of selected signals
+
+    Returns:
+        dict name -> (times int64 array, values int64 array)
+    """
+    with open(path) as f:
+        header = read_header(f)
+        codes = {name: header.resolve(name) for name in signals}
+        buffers = {code: (array('q'), array('q')) for code in codes.values()}
+        for time, code, value in iter_changes(f, set(buffers)):
+            buffers[code][0].append(time)
+            buffers[code][1].append(int(value))
+
+    return {name: (np.frombuffer(buffers[code][0], dtype=np.int64),
+                   np.frombuffer(buffers[code][1], dtype=np.int64))
+            for name, code in codes.items()}
+
+
+def iter_cycles(path, signals, clock='clk'):
+    """
+    Yield (edge_time, {name: value}) at every rising edge of `clock`
+
+    Each sample holds the value the flip-flops see at that edge, i.e. the
+    state before the changes recorded at the edge time (x/z -> -1). Only
+    the current value of each signal is kept, so memory stays constant
+    however long the waveform is.
+    """
+    with open(path) as f:
+        header = read_header(f)
+        clock_code = header.resolve(clock)
+        codes = {name: header.resolve(name) for name in signals}
+        watched = set(codes.values()) | {clock_code}
+
+        current = {code: UNKNOWN for code in watched}
+        pending = {}
+        pending_time = None
+
+        for time, code, value in iter_changes(f, watched):
+            if time != pending_time and pending:
+                # Apply all changes of one timestamp; a 0->1 clock change is an edge
+                if current[clock_code] == 0 and pending.get(clock_code) == 1:
+                    yield pending_time, {name: current[c] for name, c in codes.items()}
+                current.update(pending)
+                pending.clear()
+            pending_time = time
+            pending[code] = value
+        if current[clock_code] == 0 and pending.get(clock_code) == 1:
+            yield pending_time, {name: current[c] for name, c in codes.items()}
+
+
+def sample_on_clock(path, signals, clock='clk'):
+    """
+    Sample signals at every rising edge of `clock` (see iter_cycles)
+
+    Returns:
+        dict name -> int64 array [num_cycles] (x/z -> -1), plus 'time' -> edge times
+    """
+    samples = {name: array('q') for name in signals}
+    edge_times = array('q')
+    for time, values in iter_cycles(path, signals, clock):
+        edge_times.append(time)
+        for name, value in values.items():
+            samples[name].append(int(value))
+
+    result = {name: np.frombuffer(buf, dtype=np.int64) for name, buf in samples.items()}
+    result['time'] = np.frombuffer(edge_times, dtype=np.int64)
+    return result
+
+
+def assertion_cycles(samples):
+    """Cycles where a 1-bit handshake signal rises (0/x -> 1)"""
+    high = samples == 1
+    rising = high & ~np.concatenate([[False], high[:-1]])
+    return np.flatnonzero(rising)
+
+
+def handshake_latency(sampled, chain):
+    """
+    Latency report along a chain of handshake signals
+
+    Args:
+        sampled: output of sample_on_clock()
+        chain: signal names in pipeline order, e.g. ['pixel_valid', 'window_valid', 'done']
+
+    Returns:
+        list of dicts per stage: first assertion cycle, active cycles, and
+        latency (cycles) from the previous stage's first assertion
+    """
+    report = []
+    previous = None
+    for name in chain:
+        values = sampled[name]
+        first = np.flatnonzero(values == 1)
+        first_cycle = int(first[0]) if len(first) else None
+        entry = {
+            'signal': name,
+            'first_cycle': first_cycle,
+            'active_cycles': int((values == 1).sum()),
+            'assertions': len(assertion_cycles(values)),
+            'latency': None,
+        }
+        if previous is not None and first_cycle is not None and previous['first_cycle'] is not None:
+            entry['latency'] = first_cycle - previous['first_cycle']
+        report.append(entry)
+        previous = entry
+    return report
+
+
+def print_latency_report(report, clock_period=None):
+    """Print handshake_latency() output as a table"""
+    width = max([20] + [len(entry['signal']) for entry in report])
+    print(f"  {'signal':<{width}} {'first cycle':>11} {'active':>7} {'pulses':>7} {'latency':>8}")
+    for entry in report:
+        first = '-' if entry['first_cycle'] is None else entry['first_cycle']
+        latency = '' if entry['latency'] is None else f"{entry['latency']:+d}"
+        print(f"  {entry['signal']:<{width}} {first:>11} {entry['active_cycles']:>7} "
+              f"{entry['assertions']:>7} {latency:>8}")
+    total = [e['first_cycle'] for e in report if e['first_cycle'] is not None]
+    if len(total) > 1:
+        cycles = total[-1] - total[0]
+        line = f"  End-to-end: {cycles} cycles"
+        if clock_period:
+            line += f" ({cycles * clock_period} time units)"
+        print(line)
+
+
+if __name__ == '__main__':
+    import sys
+    instrument.setup()
+
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_VCD
+    clock = sys.argv[2] if len(sys.argv) > 2 else 'clk'
+    chain = sys.argv[3:] or ['pixel_valid', 'window_valid', 'conv_valid']   # no done in this dump
+
+    print("\n" + "="*60)
+    print("VCD Handshake Latency Report")
+    print("="*60)
+
+    sampled = sample_on_clock(path, chain, clock)
+    edges = sampled['time']
+    period = int(np.median(np.diff(edges))) if len(edges) > 1 else None
+
+    print(f"File: {path}")
+    print(f"Clock: {clock}, {len(edges)} rising edges" + (f", period {period}" if period else ""))
+    print()
+    print_latency_report(handshake_latency(sampled, chain), period)
+    print()
@@ -0,0 +1,59 @@
+"""
+Simulator Discovery and Persistent Verilator Server Process
+- find_simulator() picks the testbench simulator: Verilator first (2-state,
+  no x scores), Icarus Verilog otherwise
+- VerilatorServer runs a Verilator-built harness as a child process and
+  speaks its line protocol: one command per line on stdin, replies tagged
+  with '@' on stdout (other lines are RTL $display output), '@ERROR ...'
+  raises, QUIT ends the process
+
+Subclassed by CNN1/python/verilator_backend.py (cnn_sim_server) and
+SNN2_AER/python/verilator_backend.py (snn_sim_server).
+"""
+
+import shutil
+import subprocess
+
+
+def find_simulator(preferred=None):
+    """'verilator' or 'iverilog', whichever is installed (Verilator first)"""
+    candidates = [preferred] if preferred else ['verilator', 'iverilog']
+    for simulator in candidates:
+        tools = ['iverilog', 'vvp'] if simulator == 'iverilog' else ['verilator']
+        if all(shutil.which(tool) for tool in tools):
+            return simulator
+    raise RuntimeError("no simulator found - install Icarus Verilog or Verilator")
+
+
+class VerilatorServer:
+    """Long-lived simulator process; replies start with '@', other output is RTL $display"""
+
+    def __init__(self, binary):
+        self.process = subprocess.Popen([binary], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        text=True, bufsize=1)
+
+    def command(self, line):
+        """Send one command line and return the reply fields (without the '@' tag)"""
+        self.process.stdin.write(line + "\n")
+        self.process.stdin.flush()
+        while True:
+            reply = self.process.stdout.readline()
+            if not reply:
+                raise RuntimeError("simulation server exited")
+            if reply.startswith('@'):
+                fields = reply[1:].split()
+                if fields[0] == 'ERROR':
+                    raise RuntimeError(reply[1:].strip())
+                return fields
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.write("QUIT\n")
+            self.process.stdin.flush()
+            self.process.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()